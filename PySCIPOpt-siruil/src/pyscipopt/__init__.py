@@ -20,6 +20,7 @@ from pyscipopt.scip      import Presol
 from pyscipopt.scip      import Pricer
 from pyscipopt.scip      import Prop
 from pyscipopt.scip      import Sepa
+from pyscipopt.scip      import Cutsel
 from pyscipopt.scip      import LP
 from pyscipopt.scip      import Expr
 from pyscipopt.scip      import quicksum
@@ -0,0 +1,143 @@
+##@file cutsel.pxi
+#@brief Base class of the Cut Selector Plugin
+cdef class Cutsel:
+    cdef public Model model
+    cdef public str name
+
+    def cutselfree(self):
+        '''frees memory of cut selector'''
+        pass
+
+    def cutselinit(self):
+        '''executed after the problem is transformed. use this call to initialize cut selector data.'''
+        pass
+
+    def cutselexit(self):
+        '''executed before the transformed problem is freed'''
+        pass
+
+    def cutselinitsol(self):
+        '''executed when the presolving is finished and the branch-and-bound process is about to begin'''
+        pass
+
+    def cutselexitsol(self):
+        '''executed before the branch-and-bound process is freed'''
+        pass
+
+    def cutselselect(self, cuts, forcedcuts, root, maxnselectedcuts):
+        '''selects the cuts to apply after a separation round.
+
+        :param cuts: list of candidate cuts (Row)
+        :param forcedcuts: list of forced cuts, which are always applied
+        :param root: are we at the root node?
+        :param maxnselectedcuts: maximal number of candidate cuts to select
+
+        Return a dictionary with "result" (SCIP_RESULT.SUCCESS, or SCIP_RESULT.DIDNOTFIND to fall back to the next cut
+        selector / SCIP's default selection) and either
+        - "selected": positions in cuts of the selected cuts (list or integer array), or
+        - "cuts": the candidate cuts reordered such that the selected ones come first, and "nselectedcuts".
+        At most maxnselectedcuts cuts are used, surplus ones are dropped.
+        '''
+        print("python error in cutselselect: this method needs to be implemented")
+        return {}
+
+
+cdef SCIP_RETCODE PyCutselCopy (SCIP* scip, SCIP_CUTSEL* cutsel) with gil:
+    return SCIP_OKAY
+
+cdef SCIP_RETCODE PyCutselFree (SCIP* scip, SCIP_CUTSEL* cutsel) with gil:
+    cdef SCIP_CUTSELDATA* cutseldata
+    cutseldata = SCIPcutselGetData(cutsel)
+    PyCutsel = <Cutsel>cutseldata
+    PyCutsel.cutselfree()
+    Py_DECREF(PyCutsel)
+    return SCIP_OKAY
+
+cdef SCIP_RETCODE PyCutselInit (SCIP* scip, SCIP_CUTSEL* cutsel) with gil:
+    cdef SCIP_CUTSELDATA* cutseldata
+    cutseldata = SCIPcutselGetData(cutsel)
+    PyCutsel = <Cutsel>cutseldata
+    PyCutsel.cutselinit()
+    return SCIP_OKAY
+
+cdef SCIP_RETCODE PyCutselExit (SCIP* scip, SCIP_CUTSEL* cutsel) with gil:
+    cdef SCIP_CUTSELDATA* cutseldata
+    cutseldata = SCIPcutselGetData(cutsel)
+    PyCutsel = <Cutsel>cutseldata
+    PyCutsel.cutselexit()
+    return SCIP_OKAY
+
+cdef SCIP_RETCODE PyCutselInitsol (SCIP* scip, SCIP_CUTSEL* cutsel) with gil:
+    cdef SCIP_CUTSELDATA* cutseldata
+    cutseldata = SCIPcutselGetData(cutsel)
+    PyCutsel = <Cutsel>cutseldata
+    PyCutsel.cutselinitsol()
+    return SCIP_OKAY
+
+cdef SCIP_RETCODE PyCutselExitsol (SCIP* scip, SCIP_CUTSEL* cutsel) with gil:
+    cdef SCIP_CUTSELDATA* cutseldata
+    cutseldata = SCIPcutselGetData(cutsel)
+    PyCutsel = <Cutsel>cutseldata
+    PyCutsel.cutselexitsol()
+    return SCIP_OKAY
+
+cdef SCIP_RETCODE PyCutselSelect (SCIP* scip, SCIP_CUTSEL* cutsel, SCIP_ROW** cuts, int ncuts,
+                                  SCIP_ROW** forcedcuts, int nforcedcuts, SCIP_Bool root,
+                                  int maxnselectedcuts, int* nselectedcuts, SCIP_RESULT* result) with gil:
+    cdef SCIP_CUTSELDATA* cutseldata
+    cdef SCIP_ROW** order
+    cdef char* taken
+    cdef int i
+    cdef int j
+    cdef int k
+    cutseldata = SCIPcutselGetData(cutsel)
+    PyCutsel = <Cutsel>cutseldata
+    pycuts = []
+    for i in range(ncuts):
+        pycuts.append(Row.create(scip, cuts[i]))
+    pyforcedcuts = []
+    for i in range(nforcedcuts):
+        pyforcedcuts.append(Row.create(scip, forcedcuts[i]))
+    result_dict = PyCutsel.cutselselect(pycuts, pyforcedcuts, bool(root), maxnselectedcuts)
+    result[0] = result_dict.get("result", <SCIP_RESULT>result[0])
+    if result[0] != SCIP_SUCCESS:
+        return SCIP_OKAY
+
+    if "selected" in result_dict:
+        selected = [int(pos) for pos in result_dict["selected"]][:maxnselectedcuts]
+        k = len(selected)
+        if k and (min(selected) < 0 or max(selected) >= ncuts or len(set(selected)) < k):
+            raise ValueError("cutselselect: 'selected' must hold distinct positions in cuts")
+
+        # selected cuts first, in the given order, then the remaining ones in their original order
+        order = <SCIP_ROW**> malloc(ncuts * sizeof(SCIP_ROW*))
+        taken = <char*> calloc(ncuts, sizeof(char))
+        for j in range(k):
+            i = selected[j]
+            order[j] = cuts[i]
+            taken[i] = 1
+        j = k
+        for i in range(ncuts):
+            if not taken[i]:
+                order[j] = cuts[i]
+                j += 1
+        for i in range(ncuts):
+            cuts[i] = order[i]
+        free(order)
+        free(taken)
+        nselectedcuts[0] = k
+    else:
+        # validate everything before the first write: SCIP releases each cut once after selection
+        reordered = [<Row?>row for row in result_dict["cuts"]]
+        candidates = set()
+        for i in range(ncuts):
+            candidates.add(<size_t>cuts[i])
+        given = set()
+        for row in reordered:
+            given.add(<size_t>(<Row>row).scip_row)
+        if len(reordered) != ncuts or given != candidates:
+            raise ValueError("cutselselect: 'cuts' must be a reordering of all candidate cuts")
+        for i in range(ncuts):
+            cuts[i] = (<Row>reordered[i]).scip_row
+        nselectedcuts[0] = min(max(int(result_dict["nselectedcuts"]), 0), maxnselectedcuts)
+    return SCIP_OKAY
@@ -548,6 +548,12 @@ cdef extern from "scip/scip.h":
     ctypedef struct SCIP_RELAXDATA:
         pass
 
+    ctypedef struct SCIP_CUTSEL:
+        pass
+
+    ctypedef struct SCIP_CUTSELDATA:
+        pass
+
     ctypedef struct SCIP_NODE:
         pass
 
@@ -706,6 +712,8 @@ cdef extern from "scip/scip.h":
                               SCIP_Bool             threadsafe,
                               SCIP_Bool             passmessagehdlr,
                               SCIP_Bool*            valid)
+    int SCIPgetSubscipDepth(SCIP* scip)
+    void SCIPsetSubscipDepth(SCIP* scip, int newdepth)
     SCIP_RETCODE SCIPmessagehdlrCreate(SCIP_MESSAGEHDLR **messagehdlr,
                                        SCIP_Bool bufferedoutput,
                                        const char *filename,
@@ -843,7 +851,7 @@ cdef extern from "scip/scip.h":
     SCIP_Real SCIPgetLocalTransEstimate(SCIP* scip)
 
     # Solve Methods
-    SCIP_RETCODE SCIPsolve(SCIP* scip)
+    SCIP_RETCODE SCIPsolve(SCIP* scip) nogil
     SCIP_RETCODE SCIPfreeTransform(SCIP* scip)
     SCIP_RETCODE SCIPpresolve(SCIP* scip)
 
@@ -1033,6 +1041,7 @@ cdef extern from "scip/scip.h":
     int SCIPgetNBestSolsFound(SCIP* scip)
     SCIP_SOL* SCIPgetBestSol(SCIP* scip)
     SCIP_Real SCIPgetSolVal(SCIP* scip, SCIP_SOL* sol, SCIP_VAR* var)
+    SCIP_RETCODE SCIPgetSolVals(SCIP* scip, SCIP_SOL* sol, int nvars, SCIP_VAR** vars, SCIP_Real* vals)
     SCIP_RETCODE SCIPwriteVarName(SCIP* scip, FILE* outfile, SCIP_VAR* var, SCIP_Bool vartype)
     SCIP_Real SCIPgetSolOrigObj(SCIP* scip, SCIP_SOL* sol)
     SCIP_Real SCIPgetSolTransObj(SCIP* scip, SCIP_SOL* sol)
@@ -1301,6 +1310,28 @@ cdef extern from "scip/scip.h":
     SCIP_RELAXDATA* SCIPrelaxGetData(SCIP_RELAX* relax)
     SCIP_RELAX* SCIPfindRelax(SCIP* scip, const char* name)
 
+    # Cut selector plugin
+    SCIP_RETCODE SCIPincludeCutsel(SCIP* scip,
+                                   const char* name,
+                                   const char* desc,
+                                   int priority,
+                                   SCIP_RETCODE (*cutselcopy) (SCIP* scip, SCIP_CUTSEL* cutsel),
+                                   SCIP_RETCODE (*cutselfree) (SCIP* scip, SCIP_CUTSEL* cutsel),
+                                   SCIP_RETCODE (*cutselinit) (SCIP* scip, SCIP_CUTSEL* cutsel),
+                                   SCIP_RETCODE (*cutselexit) (SCIP* scip, SCIP_CUTSEL* cutsel),
+                                   SCIP_RETCODE (*cutselinitsol) (SCIP* scip, SCIP_CUTSEL* cutsel),
+                                   SCIP_RETCODE (*cutselexitsol) (SCIP* scip, SCIP_CUTSEL* cutsel),
+                                   SCIP_RETCODE (*cutselselect) (SCIP* scip, SCIP_CUTSEL* cutsel, SCIP_ROW** cuts, int ncuts,
+                                                                 SCIP_ROW** forcedcuts, int nforcedcuts, SCIP_Bool root,
+                                                                 int maxnselectedcuts, int* nselectedcuts, SCIP_RESULT* result),
+                                   SCIP_CUTSELDATA* cutseldata)
+    SCIP_CUTSELDATA* SCIPcutselGetData(SCIP_CUTSEL* cutsel)
+    SCIP_CUTSEL* SCIPfindCutsel(SCIP* scip, const char* name)
+    SCIP_Longint SCIPcutselGetNCalls(SCIP_CUTSEL* cutsel)
+    SCIP_Longint SCIPcutselGetNSuccess(SCIP_CUTSEL* cutsel)
+    SCIP_Longint SCIPcutselGetNSelected(SCIP_CUTSEL* cutsel)
+    SCIP_Real SCIPcutselGetTime(SCIP_CUTSEL* cutsel)
+
     # Node selection plugin
     SCIP_RETCODE SCIPincludeNodesel(SCIP* scip,
                                     const char* name,
@@ -1428,6 +1459,9 @@ cdef extern from "scip/scip.h":
     SCIP_RETCODE SCIPgetPseudoBranchCands(SCIP* scip, SCIP_VAR*** pseudocands, int* npseudocands, int* npriopseudocands)
 
 
+    # Sorting Methods
+    void SCIPsortIntReal(int* intarray, SCIP_Real* realarray, int len)
+
     # Numerical Methods
     SCIP_Real SCIPinfinity(SCIP* scip)
     SCIP_Real SCIPfrac(SCIP* scip, SCIP_Real val)
@@ -1894,6 +1928,7 @@ cdef extern from "scip/pub_lp.h":
     int SCIProwGetNNonz(SCIP_ROW* row)
     int SCIProwGetNLPNonz(SCIP_ROW* row)
     int SCIProwGetLPPos(SCIP_ROW* row)
+    int SCIProwGetIndex(SCIP_ROW* row)
     int SCIProwGetLPDepth(SCIP_ROW* row)
     int SCIProwGetAge(SCIP_ROW* row)
     int SCIProwGetRank(SCIP_ROW* row)  # added by gizarp
@@ -2052,6 +2087,18 @@ cdef extern from "scip/scip_solvingstats.h":
 cdef extern from "scip/sepastore.h":
     SCIP_RETCODE SCIPoverrideCutSelection(SCIP* scip, int* forcedcuts, int nforcedcuts)
 
+cdef extern from "scip/cutsel_mlscore.h":
+    int SCIP_CUTSEL_MLSCORE_NFEATURES
+    SCIP_RETCODE SCIPincludeCutselMlscore(SCIP* scip)
+    SCIP_RETCODE SCIPsetCutselMlscoreModel(SCIP* scip, int nlayers, const int* layersizes,
+                                           const SCIP_Real* weights, const SCIP_Real* biases)
+    SCIP_RETCODE SCIPsetCutselMlscoreNormalization(SCIP* scip, const SCIP_Real* mu, const SCIP_Real* sd,
+                                                   const SCIP_Real* cliplo, const SCIP_Real* cliphi)
+    SCIP_RETCODE SCIPresetCutselMlscoreModel(SCIP* scip)
+    SCIP_RETCODE SCIPgetCutselMlscoreStatistics(SCIP* scip, SCIP_Longint* nrounds, SCIP_Longint* ncutsseen,
+                                                SCIP_Longint* ncutsvalid, SCIP_Longint* ncutskept,
+                                                SCIP_Longint* nroundsskipped)
+
 cdef class Expr:
     cdef public terms
 
@@ -2164,6 +2211,8 @@ cdef class Model:
     cdef SCIP_Bool _freescip
     # map to store python variables
     cdef _modelvars
+    # False if the SCIP instance may share data with another one (copy with threadsafe=False, wrapped C-API instance)
+    cdef SCIP_Bool _threadsafe
 
     @staticmethod
     cdef create(SCIP* _scip)
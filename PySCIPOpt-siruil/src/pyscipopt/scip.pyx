@@ -10,8 +10,9 @@ import numpy as np  # added by gizarp
 cimport cython
 from cpython cimport Py_INCREF, Py_DECREF
 from cpython.pycapsule cimport PyCapsule_New, PyCapsule_IsValid, PyCapsule_GetPointer
-from libc.stdlib cimport malloc, free
+from libc.stdlib cimport malloc, calloc, free
 from libc.stdio cimport fdopen
+from libc.string cimport strncmp
 from libc.math cimport sqrt as SQRT
 
 from collections.abc import Iterable
@@ -30,6 +31,7 @@ include "pricer.pxi"
 include "propagator.pxi"
 include "sepa.pxi"
 include "relax.pxi"
+include "cutsel.pxi"
 include "nodesel.pxi"
 
 # recommended SCIP version; major version is required
@@ -788,7 +790,7 @@ cdef class Row:
 
     property index:
         def __get__(self):
-            raise NotImplementedError
+            return SCIProwGetIndex(self.scip_row)
 
     property size:
         def __get__(self):
@@ -1758,10 +1760,10 @@ cdef class Constraint:
                 and self.scip_cons == (<Constraint>other).scip_cons)
 
 
-cdef void relayMessage(SCIP_MESSAGEHDLR *messagehdlr, FILE *file, const char *msg):
+cdef void relayMessage(SCIP_MESSAGEHDLR *messagehdlr, FILE *file, const char *msg) with gil:
     sys.stdout.write(msg.decode('UTF-8'))
 
-cdef void relayErrorMessage(void *messagehdlr, FILE *file, const char *msg):
+cdef void relayErrorMessage(void *messagehdlr, FILE *file, const char *msg) with gil:
     sys.stderr.write(msg.decode('UTF-8'))
 
 # - remove create(), includeDefaultPlugins(), createProbBasic() methods
@@ -1770,6 +1772,56 @@ cdef void relayErrorMessage(void *messagehdlr, FILE *file, const char *msg):
 ##
 #@anchor Model
 ##
+cdef SCIP_VAR** _collectVars(SCIP* scip, vars, bint transformed, int* nvars) except? NULL:
+    """malloc'ed array of the given Variables (all original/transformed ones for vars=None); caller frees."""
+    cdef SCIP_VAR** src
+    cdef SCIP_VAR** out
+    cdef int i, n
+
+    if vars is None:
+        if transformed:
+            src = SCIPgetVars(scip)
+            n = SCIPgetNVars(scip)
+        else:
+            src = SCIPgetOrigVars(scip)
+            n = SCIPgetNOrigVars(scip)
+        out = <SCIP_VAR**> malloc((n + 1) * sizeof(SCIP_VAR*))
+        for i in range(n):
+            out[i] = src[i]
+    else:
+        vars = list(vars)
+        n = len(vars)
+        out = <SCIP_VAR**> malloc((n + 1) * sizeof(SCIP_VAR*))
+        try:
+            for i in range(n):
+                out[i] = (<Variable?>vars[i]).scip_var
+        except:
+            free(out)
+            raise
+    nvars[0] = n
+    return out
+
+cdef inline float _finiteOrZero(SCIP_Real val):
+    # inf - inf and nan - nan are both nan
+    if val - val == 0.0:
+        return <float>val
+    return 0.0
+
+cdef SCIP_Real _rowEuclideanNorm(SCIP_ROW* row):
+    # same fallback as SCIProwGetParallelism: recompute from the LP columns if the stored norm is zero
+    cdef SCIP_Real norm = SCIProwGetNorm(row)
+    cdef SCIP_COL** cols
+    cdef SCIP_Real* vals
+    cdef int k
+    if norm == 0.0:
+        cols = SCIProwGetCols(row)
+        vals = SCIProwGetVals(row)
+        for k in range(SCIProwGetNNonz(row)):
+            if SCIPcolGetLPPos(cols[k]) >= 0:
+                norm += vals[k] * vals[k]
+        norm = SQRT(norm)
+    return norm
+
 cdef class Model:
     """Main class holding a pointer to SCIP for managing most interactions"""
 
@@ -1791,12 +1843,14 @@ cdef class Model:
 
         self._freescip = True
         self._modelvars = {}
+        self._threadsafe = True
 
         if not createscip:
             # if no SCIP instance should be created, then an empty Model object is created.
             self._scip = NULL
             self._bestSol = None
             self._freescip = False
+            self._threadsafe = False
         elif sourceModel is None:
             PY_SCIP_CALL(SCIPcreate(&self._scip))
             self._bestSol = None
@@ -1806,6 +1860,7 @@ cdef class Model:
         else:
             PY_SCIP_CALL(SCIPcreate(&self._scip))
             self._bestSol = <Solution> sourceModel._bestSol
+            self._threadsafe = threadsafe
             n = str_conversion(problemName)
             if origcopy:
                 PY_SCIP_CALL(SCIPcopyOrig(sourceModel._scip, self._scip, NULL, NULL, n, enablepricing, threadsafe, True, self._valid))
@@ -1977,6 +2032,23 @@ cdef class Model:
         """Retrieve the depth of the current node"""
         return SCIPgetDepth(self._scip)
 
+    def getSubscipDepth(self):
+        """Retrieve the number of SCIP copies this model is nested in (0 for a top-level SCIP)"""
+        return SCIPgetSubscipDepth(self._scip)
+
+    def setSubscipDepth(self, depth):
+        """Set the sub-SCIP depth; a copy made with sourceModel= starts at the source's depth + 1.
+
+        Plugins skip or change work in sub-SCIPs (symmetry handling, OBBT, ...), so a copy that is
+        solved as a top-level problem should be reset to 0 before solving.
+
+        :param depth: new depth, >= 0
+
+        """
+        if depth < 0:
+            raise ValueError("sub-SCIP depth must be >= 0")
+        SCIPsetSubscipDepth(self._scip, depth)
+
     def infinity(self):
         """Retrieve SCIP's infinity value"""
         return SCIPinfinity(self._scip)
@@ -2309,6 +2381,46 @@ cdef class Model:
         PY_SCIP_CALL(SCIPreleaseVar(self._scip, &scip_var))
         return pyVar
 
+    def addVars(self, shape, name='', vtype='C', lb=0.0, ub=None, obj=0.0):
+        """Create an array of variables, one per entry of shape.
+
+        :param shape: int or tuple giving the shape of the returned array
+        :param name: '' for generic names, a prefix (entry (i, j) gets name 'prefix_i_j'), or a sequence of names
+                     in C order (Default value = '')
+        :param vtype: type of the variables, see addVar() (Default value = 'C')
+        :param lb: lower bound(s), scalar or array broadcastable to shape; None or -inf for -infinity (Default value = 0.0)
+        :param ub: upper bound(s), as lb; None or inf for +infinity (Default value = None)
+        :param obj: objective coefficient(s), scalar or array broadcastable to shape (Default value = 0.0)
+        :return a NumPy object array of Variables with the given shape; column order in addMatrixCons() is the
+                flattened (C order) array.
+
+        """
+        cdef SCIP_Real inf = SCIPinfinity(self._scip)
+        cdef int n, i
+
+        shape = (int(shape),) if np.isscalar(shape) else tuple(int(k) for k in shape)
+        n = int(np.prod(shape, dtype=np.int64))
+
+        lbs = np.broadcast_to(np.asarray(-np.inf if lb is None else lb, dtype=np.float64), shape).reshape(-1)
+        ubs = np.broadcast_to(np.asarray(np.inf if ub is None else ub, dtype=np.float64), shape).reshape(-1)
+        objs = np.broadcast_to(np.asarray(obj, dtype=np.float64), shape).reshape(-1)
+
+        if isinstance(name, str):
+            if name == '':
+                names = [''] * n
+            else:
+                names = ['%s_%s' % (name, '_'.join(str(k) for k in idx)) for idx in np.ndindex(*shape)]
+        else:
+            names = list(name)
+            if len(names) != n:
+                raise ValueError("expected %d names, got %d" % (n, len(names)))
+
+        out = np.empty(n, dtype=object)
+        for i in range(n):
+            out[i] = self.addVar(names[i], vtype=vtype,
+                                 lb=max(lbs[i], -inf), ub=min(ubs[i], inf), obj=objs[i])
+        return out.reshape(shape)
+
     def getTransformedVar(self, Variable var):
         """Retrieve the transformed variable.
 
@@ -2659,6 +2771,78 @@ cdef class Model:
         """Retrieve the number of cols currently in the LP"""
         return SCIPgetNLPCols(self._scip)
 
+    def getLPMatrixCSR(self, rows=None):
+        """Retrieve the coefficients of LP rows (or of any given rows, e.g. cuts) as a CSR matrix over the current LP
+        columns, without creating Python objects per nonzero.
+
+        :param rows: list of Rows (default: None, i.e. all rows currently in the LP, in getLPRowsData() order)
+
+        Returns (indptr, indices, data) with int32 indptr of length nrows+1, int32 column indices equal to the LP
+        position of the column (i.e. its index in getLPColsData()), sorted within each row, and float64 coefficients.
+        Entries of columns that are not in the LP are skipped. Pass (data, indices, indptr) with shape
+        (nrows, getNLPCols()) to scipy.sparse.csr_matrix to get a matrix object.
+        """
+        cdef SCIP_ROW** scipcuts = NULL
+        cdef SCIP_ROW** lprows
+        cdef SCIP_ROW** scrows
+        cdef SCIP_COL** cols
+        cdef SCIP_Real* vals
+        cdef int[::1] indptrview
+        cdef int[::1] indicesview
+        cdef double[::1] dataview
+        cdef int nrows
+        cdef int nnz
+        cdef int start
+        cdef int lppos
+        cdef int i
+        cdef int k
+
+        if rows is None:
+            PY_SCIP_CALL(SCIPgetLPRowsData(self._scip, &lprows, &nrows))
+            scrows = lprows
+        else:
+            nrows = len(rows)
+            scipcuts = <SCIP_ROW**> malloc((nrows + 1) * sizeof(SCIP_ROW*))
+            scrows = scipcuts
+
+        try:
+            if rows is not None:
+                for i in range(nrows):
+                    scrows[i] = (<Row?>rows[i]).scip_row
+
+            indptr = np.zeros(nrows + 1, dtype=np.int32)
+            indptrview = indptr
+            nnz = 0
+            for i in range(nrows):
+                cols = SCIProwGetCols(scrows[i])
+                for k in range(SCIProwGetNNonz(scrows[i])):
+                    if SCIPcolGetLPPos(cols[k]) >= 0:
+                        nnz += 1
+                indptrview[i + 1] = nnz
+
+            indices = np.empty(nnz, dtype=np.int32)
+            data = np.empty(nnz, dtype=np.float64)
+            indicesview = indices
+            dataview = data
+            nnz = 0
+            for i in range(nrows):
+                cols = SCIProwGetCols(scrows[i])
+                vals = SCIProwGetVals(scrows[i])
+                start = nnz
+                for k in range(SCIProwGetNNonz(scrows[i])):
+                    lppos = SCIPcolGetLPPos(cols[k])
+                    if lppos >= 0:
+                        indicesview[nnz] = lppos
+                        dataview[nnz] = vals[k]
+                        nnz += 1
+                # SCIP reorders a row's coefficients when it is linked into the LP; sort for a stable layout
+                if nnz - start > 1:
+                    SCIPsortIntReal(&indicesview[start], &dataview[start], nnz - start)
+        finally:
+            free(scipcuts)
+
+        return indptr, indices, data
+
     def getLPBasisInd(self):
         """Gets all indices of basic columns and rows: index i >= 0 corresponds to column i, index i < 0 to row -i-1"""
         cdef int nrows = SCIPgetNLPRows(self._scip)
@@ -3029,6 +3213,113 @@ cdef class Model:
 
         return constraints
 
+    def addMatrixCons(self, A, vars, lhs=None, rhs=None, names=None, initial=True, separate=True,
+                      enforce=True, check=True, propagate=True, local=False, modifiable=False,
+                      dynamic=False, removable=False, stickingatnode=False):
+        """Add the linear constraints lhs <= A x <= rhs, one per row of A, in a single call.
+
+        :param A: sparse matrix with a tocsr() method (e.g. scipy.sparse), a CSR tuple (indptr, indices, data),
+                  or a dense 2-D array; column j refers to vars[j]
+        :param vars: Variables of the columns, any sequence or array (flattened in C order, e.g. from addVars())
+        :param lhs: left-hand side(s), scalar or array with one entry per row; None or -inf for -infinity
+                    (Default value = None)
+        :param rhs: right-hand side(s), as lhs; None or inf for +infinity (Default value = None)
+        :param names: None for generic names, a prefix (row i gets 'prefix_i'), or a sequence of names
+                      (Default value = None)
+        :param initial, ...: constraint flags as in addCons(), applied to all rows
+        :return A list of the added @ref scip#Constraint "Constraint" objects.
+
+        Explicit zeros in A are skipped.
+        """
+        cdef SCIP* scip = self._scip
+        cdef SCIP_Real inf = SCIPinfinity(scip)
+        cdef SCIP_CONS* scip_cons
+        cdef SCIP_VAR** colvars
+        cdef SCIP_VAR** rowvars
+        cdef SCIP_Real* rowvals
+        cdef long long[::1] indptr_
+        cdef long long[::1] indices_
+        cdef double[::1] data_
+        cdef double[::1] lhs_
+        cdef double[::1] rhs_
+        cdef int nrows, ncols, maxlen, i, k, nnz
+        cdef long long p
+        cdef SCIP_Real a
+
+        if hasattr(A, 'tocsr'):
+            A = A.tocsr()
+            indptr, indices, data = A.indptr, A.indices, A.data
+            nrows = A.shape[0]
+        elif isinstance(A, tuple):
+            indptr, indices, data = A
+            nrows = len(indptr) - 1
+        else:
+            dense = np.atleast_2d(np.asarray(A, dtype=np.float64))
+            rows_nz, cols_nz = np.nonzero(dense)
+            indptr = np.zeros(dense.shape[0] + 1, dtype=np.int64)
+            np.cumsum(np.bincount(rows_nz, minlength=dense.shape[0]), out=indptr[1:])
+            indices, data = cols_nz, dense[rows_nz, cols_nz]
+            nrows = dense.shape[0]
+
+        indptr_ = np.ascontiguousarray(indptr, dtype=np.int64)
+        indices_ = np.ascontiguousarray(indices, dtype=np.int64)
+        data_ = np.ascontiguousarray(data, dtype=np.float64)
+        lhs_ = np.ascontiguousarray(np.broadcast_to(
+            np.asarray(-np.inf if lhs is None else lhs, dtype=np.float64), (nrows,)))
+        rhs_ = np.ascontiguousarray(np.broadcast_to(
+            np.asarray(np.inf if rhs is None else rhs, dtype=np.float64), (nrows,)))
+
+        # no np.asarray on a plain list: Variables support indexing and would not stay scalar objects
+        vars = list(vars.reshape(-1)) if isinstance(vars, np.ndarray) else list(vars)
+        ncols = len(vars)
+        if indices_.shape[0] > 0 and (np.min(indices_) < 0 or np.max(indices_) >= ncols):
+            raise ValueError("column index out of range for %d variables" % ncols)
+
+        if names is None:
+            nconss = SCIPgetNConss(scip)
+            names = ['c%d' % (nconss + i + 1) for i in range(nrows)]
+        elif isinstance(names, str):
+            names = ['%s_%d' % (names, i) for i in range(nrows)]
+        else:
+            names = list(names)
+            if len(names) != nrows:
+                raise ValueError("expected %d names, got %d" % (nrows, len(names)))
+
+        maxlen = 0
+        for i in range(nrows):
+            maxlen = max(maxlen, <int>(indptr_[i + 1] - indptr_[i]))
+
+        colvars = <SCIP_VAR**> malloc((ncols + 1) * sizeof(SCIP_VAR*))
+        rowvars = <SCIP_VAR**> malloc((maxlen + 1) * sizeof(SCIP_VAR*))
+        rowvals = <SCIP_Real*> malloc((maxlen + 1) * sizeof(SCIP_Real))
+        constraints = []
+        try:
+            for k in range(ncols):
+                colvars[k] = (<Variable?>vars[k]).scip_var
+
+            for i in range(nrows):
+                nnz = 0
+                for p in range(indptr_[i], indptr_[i + 1]):
+                    a = data_[p]
+                    if a != 0.0:
+                        rowvars[nnz] = colvars[indices_[p]]
+                        rowvals[nnz] = a
+                        nnz += 1
+
+                PY_SCIP_CALL(SCIPcreateConsLinear(
+                    scip, &scip_cons, str_conversion(names[i]), nnz, rowvars, rowvals,
+                    max(lhs_[i], -inf), min(rhs_[i], inf), initial, separate, enforce, check,
+                    propagate, local, modifiable, dynamic, removable, stickingatnode))
+                PY_SCIP_CALL(SCIPaddCons(scip, scip_cons))
+                constraints.append(Constraint.create(scip, scip_cons))
+                PY_SCIP_CALL(SCIPreleaseCons(scip, &scip_cons))
+        finally:
+            free(colvars)
+            free(rowvars)
+            free(rowvals)
+
+        return constraints
+
     def _addLinCons(self, ExprCons lincons, **kwargs):
         assert isinstance(lincons, ExprCons), "given constraint is not ExprCons but %s" % lincons.__class__.__name__
 
@@ -4030,11 +4321,34 @@ cdef class Model:
             raise Warning("no reduced cost available for variable " + var.name)
         return redcost
 
-    def optimize(self):
-        """Optimize the problem."""
-        PY_SCIP_CALL(SCIPsolve(self._scip))
+    def optimize(self, release_gil=False):
+        """Optimize the problem.
+
+        :param release_gil: release the GIL while SCIP solves, so that other Python threads (e.g. solves of other
+                            Models in a thread pool) run concurrently (Default value = False). Python plugins
+                            (separators, branching rules, event handlers, ...) still work: each callback
+                            re-acquires the GIL, so those parts run one thread at a time. Ignored, with a warning,
+                            for copies created with threadsafe=False, which may share data with their source.
+        """
+        cdef SCIP* scip = self._scip
+        cdef SCIP_RETCODE rc
+
+        if release_gil and not self._threadsafe:
+            warnings.warn("Model was not created thread-safe (copy with threadsafe=False); solving with the GIL held")
+            release_gil = False
+
+        if release_gil:
+            with nogil:
+                rc = SCIPsolve(scip)
+        else:
+            rc = SCIPsolve(scip)
+        PY_SCIP_CALL(rc)
         self._bestSol = Solution.create(self._scip, SCIPgetBestSol(self._scip))
 
+    def isThreadsafe(self):
+        """Can this Model be solved with optimize(release_gil=True) alongside other Models?"""
+        return bool(self._threadsafe)
+
     def presolve(self):
         """Presolve the problem."""
         PY_SCIP_CALL(SCIPpresolve(self._scip))
@@ -4558,6 +4872,160 @@ cdef class Model:
 
         Py_INCREF(relax)
 
+    def includeCutsel(self, Cutsel cutsel, name, desc, priority):
+        """Include a cut selector.
+
+        Cut selectors replace SCIP's default selection of the cuts found in a separation round; they are called once
+        per round, after all separators, in order of decreasing priority until one of them returns SUCCESS.
+
+        :param Cutsel cutsel: cut selector
+        :param name: name of cut selector
+        :param desc: description of cut selector
+        :param priority: priority of the cut selector
+
+        """
+        nam = str_conversion(name)
+        des = str_conversion(desc)
+        PY_SCIP_CALL(SCIPincludeCutsel(self._scip, nam, des, priority,
+                                       PyCutselCopy, PyCutselFree, PyCutselInit, PyCutselExit,
+                                       PyCutselInitsol, PyCutselExitsol, PyCutselSelect, <SCIP_CUTSELDATA*> cutsel))
+        cutsel.model = <Model>weakref.proxy(self)
+        cutsel.name = name
+        Py_INCREF(cutsel)
+
+    def getCutselStatistics(self, name):
+        """Statistics of the cut selector with the given name.
+
+        :return: dict with ncalls, nsuccess (rounds in which it selected the cuts), nselected (total selected
+                 candidate cuts) and time (seconds spent in the selection callback)
+        """
+        cdef SCIP_CUTSEL* cutsel
+        nam = str_conversion(name)
+        cutsel = SCIPfindCutsel(self._scip, nam)
+        if cutsel == NULL:
+            raise KeyError("no cut selector named %s" % name)
+        return {"ncalls": SCIPcutselGetNCalls(cutsel),
+                "nsuccess": SCIPcutselGetNSuccess(cutsel),
+                "nselected": SCIPcutselGetNSelected(cutsel),
+                "time": SCIPcutselGetTime(cutsel)}
+
+    def includeNativeCutScorer(self, weights=None, bias=0.0, layers=None, mu=None, sd=None, cliplo=None, cliphi=None,
+                               top_k=10, top_frac=None, min_keep=5, min_efficacy=1e-4, root_only=True, priority=None):
+        """Include (or reconfigure) the C cut selector "mlscore", which scores and selects the cuts of each round
+        without calling back into Python.
+
+        The model reads the eight columns of getCutFeatureMatrix, clipped to [cliplo, cliphi] and normalized as
+        (x - mu) / sd, and is either linear (weights, bias) or a small MLP with ReLU hidden layers (layers). Without
+        a model the default heuristic 0.4 eff/5 + 0.3 scipscore + 0.2 objparal + 0.1 intsupport is used. Cuts with
+        efficacy below min_efficacy are dropped and the best top_k (or max(min_keep, top_frac * #valid)) are
+        selected; rounds in which every valid cut would be kept are left to SCIP's default selection.
+
+        :param weights: 8 weights of a linear model
+        :param bias: bias of the linear model (Default value = 0.0)
+        :param layers: list of (W, b) with W of shape (out, in), as in torch.nn.Linear; the first layer has 8 inputs,
+                       the last one 1 output
+        :param mu: 8 feature means (default: 0)
+        :param sd: 8 feature standard deviations (default: 1)
+        :param cliplo: 8 lower feature bounds (default: none)
+        :param cliphi: 8 upper feature bounds (default: none)
+        :param top_k: number of cuts kept per round if top_frac is None (Default value = 10)
+        :param top_frac: fraction of the valid cuts kept per round (Default value = None)
+        :param min_keep: minimal number of cuts kept with top_frac (Default value = 5)
+        :param min_efficacy: minimal efficacy of a selected cut (Default value = 1e-4)
+        :param root_only: only select at the root node (Default value = True)
+        :param priority: priority of the cut selector (default: keep the current one, initially 10000)
+
+        """
+        cdef int* sizes = NULL
+        cdef double[::1] w
+        cdef double[::1] b
+        cdef double[::1] nv
+        cdef SCIP_Real* normptrs[4]
+        cdef int nlayers
+        cdef int l
+
+        if SCIPfindCutsel(self._scip, b"mlscore") == NULL:
+            PY_SCIP_CALL(SCIPincludeCutselMlscore(self._scip))
+
+        if weights is not None and layers is not None:
+            raise ValueError("give either weights or layers, not both")
+        if weights is not None:
+            layers = [(np.reshape(np.asarray(weights, dtype=np.float64), (1, -1)), np.atleast_1d(bias))]
+
+        if layers is None:
+            if mu is not None or sd is not None or cliplo is not None or cliphi is not None:
+                raise ValueError("feature normalization needs a model (weights or layers)")
+            PY_SCIP_CALL(SCIPresetCutselMlscoreModel(self._scip))
+        else:
+            nlayers = len(layers)
+            if nlayers == 0:
+                raise ValueError("layers must not be empty")
+            mats = [np.ascontiguousarray(W, dtype=np.float64) for W, _ in layers]
+            vecs = [np.ascontiguousarray(np.ravel(bb), dtype=np.float64) for _, bb in layers]
+            nin = SCIP_CUTSEL_MLSCORE_NFEATURES
+            for l in range(nlayers):
+                if mats[l].ndim != 2 or mats[l].shape[1] != nin or vecs[l].shape[0] != mats[l].shape[0]:
+                    raise ValueError("layer %d: expected W of shape (out, %d) and b of shape (out,), got %s and %s"
+                                     % (l, nin, mats[l].shape, vecs[l].shape))
+                nin = mats[l].shape[0]
+            if nin != 1:
+                raise ValueError("the last layer must have a single output, got %d" % nin)
+
+            w = np.concatenate([W.ravel() for W in mats])
+            b = np.concatenate(vecs)
+            sizes = <int*> malloc((nlayers + 1) * sizeof(int))
+            try:
+                sizes[0] = SCIP_CUTSEL_MLSCORE_NFEATURES
+                for l in range(nlayers):
+                    sizes[l + 1] = mats[l].shape[0]
+                PY_SCIP_CALL(SCIPsetCutselMlscoreModel(self._scip, nlayers, sizes, &w[0], &b[0]))
+            finally:
+                free(sizes)
+
+            # keeps the normalization buffers alive until SCIP has copied them
+            norms = []
+            for l, arr in enumerate((mu, sd, cliplo, cliphi)):
+                normptrs[l] = NULL
+                if arr is not None:
+                    nv = np.ascontiguousarray(np.ravel(arr), dtype=np.float64)
+                    if nv.shape[0] != SCIP_CUTSEL_MLSCORE_NFEATURES:
+                        raise ValueError("normalization arrays need %d entries" % SCIP_CUTSEL_MLSCORE_NFEATURES)
+                    norms.append(nv)
+                    normptrs[l] = &nv[0]
+            PY_SCIP_CALL(SCIPsetCutselMlscoreNormalization(self._scip, normptrs[0], normptrs[1], normptrs[2],
+                                                           normptrs[3]))
+
+        self.setIntParam("cutselection/mlscore/topk", top_k)
+        self.setRealParam("cutselection/mlscore/topfrac", -1.0 if top_frac is None else top_frac)
+        self.setIntParam("cutselection/mlscore/minkeep", min_keep)
+        self.setRealParam("cutselection/mlscore/minefficacy", min_efficacy)
+        self.setBoolParam("cutselection/mlscore/rootonly", root_only)
+        if priority is not None:
+            self.setIntParam("cutselection/mlscore/priority", priority)
+
+    def getNativeCutScorerStatistics(self):
+        """Statistics of the "mlscore" cut selector (see includeNativeCutScorer).
+
+        :return: dict with nrounds, ncutsseen, ncutsvalid (passing min_efficacy), ncutskept, nroundsskipped (left
+                 to the default selection) and time (seconds spent selecting)
+        """
+        cdef SCIP_Longint nrounds
+        cdef SCIP_Longint ncutsseen
+        cdef SCIP_Longint ncutsvalid
+        cdef SCIP_Longint ncutskept
+        cdef SCIP_Longint nroundsskipped
+
+        if SCIPfindCutsel(self._scip, b"mlscore") == NULL:
+            raise KeyError("native cut scorer not included")
+        PY_SCIP_CALL(SCIPgetCutselMlscoreStatistics(self._scip, &nrounds, &ncutsseen, &ncutsvalid, &ncutskept,
+                                                    &nroundsskipped))
+        return {"nrounds": nrounds,
+                "ncutsseen": ncutsseen,
+                "ncutsvalid": ncutsvalid,
+                "ncutskept": ncutskept,
+                "nroundsskipped": nroundsskipped,
+                "time": SCIPcutselGetTime(SCIPfindCutsel(self._scip, b"mlscore"))}
+
     def includeBranchrule(self, Branchrule branchrule, name, desc, priority, maxdepth, maxbounddist):
         """Include a branching rule.
 
@@ -5279,6 +5747,141 @@ cdef class Model:
             raise Warning("method cannot be called before problem is solved")
         return self.getSolVal(self._bestSol, expr)
 
+    def getSolValsArray(self, Solution sol=None, vars=None, transformed=False):
+        """Retrieve the values of many variables in a solution as one float64 array.
+
+        :param Solution sol: solution (Default value = None, i.e. the best solution found)
+        :param vars: list of Variables (Default value = None, i.e. all variables in getVars() order)
+        :param transformed: with vars=None, use the transformed instead of the original variables (Default value = False)
+
+        For the current LP solution use getVarAttrsArray(('lpsol',)).
+        """
+        cdef SCIP* scip = self._scip
+        cdef SCIP_SOL* scip_sol
+        cdef SCIP_VAR** scipvars
+        cdef int nvars
+
+        if sol is None:
+            if not self.getStage() >= SCIP_STAGE_SOLVING:
+                raise Warning("method cannot be called before problem is solved")
+            scip_sol = SCIPgetBestSol(scip)
+            if scip_sol == NULL:
+                raise Warning("no solution available")
+        else:
+            scip_sol = sol.sol
+
+        scipvars = _collectVars(scip, vars, transformed, &nvars)
+        vals = np.empty(nvars, dtype=np.float64)
+        cdef double[::1] vals_ = vals
+        try:
+            if nvars > 0:
+                PY_SCIP_CALL(SCIPgetSolVals(scip, scip_sol, nvars, scipvars, &vals_[0]))
+        finally:
+            free(scipvars)
+        return vals
+
+    def getVarAttrsArray(self, fields=('obj', 'lb', 'ub', 'vtype', 'lpsol'), vars=None, transformed=False):
+        """Retrieve variable attributes for many variables at once.
+
+        :param fields: attributes to return, any of 'obj', 'lb', 'ub' (global bounds), 'lb_local', 'ub_local',
+                       'vtype', 'lpsol', 'index' (Default value = ('obj', 'lb', 'ub', 'vtype', 'lpsol'))
+        :param vars: list of Variables (Default value = None, i.e. all variables in getVars() order)
+        :param transformed: with vars=None, use the transformed instead of the original variables (Default value = False)
+
+        Returns a dict field -> NumPy array: float64 values with infinite bounds as +-inf, int8 'vtype' (SCIP_VARTYPE:
+        0 binary, 1 integer, 2 implicit integer, 3 continuous), int32 'index'. 'lpsol' is only meaningful while an LP
+        solution is available.
+        """
+        cdef SCIP* scip = self._scip
+        cdef SCIP_VAR** scipvars
+        cdef SCIP_VAR* var
+        cdef SCIP_Real val
+        cdef SCIP_Real inf = SCIPinfinity(scip)
+        cdef int nvars, i, f
+        cdef double[::1] col
+        cdef signed char[::1] vtype
+        cdef int[::1] index
+
+        real_fields = ('obj', 'lb', 'ub', 'lb_local', 'ub_local', 'lpsol')
+        for name in fields:
+            if name not in real_fields and name not in ('vtype', 'index'):
+                raise ValueError("unknown variable attribute '%s'" % name)
+
+        scipvars = _collectVars(scip, vars, transformed, &nvars)
+        out = {}
+        try:
+            for name in fields:
+                if name == 'vtype':
+                    out[name] = np.empty(nvars, dtype=np.int8)
+                    vtype = out[name]
+                    for i in range(nvars):
+                        vtype[i] = <signed char>SCIPvarGetType(scipvars[i])
+                    continue
+                if name == 'index':
+                    out[name] = np.empty(nvars, dtype=np.int32)
+                    index = out[name]
+                    for i in range(nvars):
+                        index[i] = SCIPvarGetIndex(scipvars[i])
+                    continue
+
+                f = real_fields.index(name)
+                out[name] = np.empty(nvars, dtype=np.float64)
+                col = out[name]
+                for i in range(nvars):
+                    var = scipvars[i]
+                    if f == 0:
+                        val = SCIPvarGetObj(var)
+                    elif f == 1:
+                        val = SCIPvarGetLbGlobal(var)
+                    elif f == 2:
+                        val = SCIPvarGetUbGlobal(var)
+                    elif f == 3:
+                        val = SCIPvarGetLbLocal(var)
+                    elif f == 4:
+                        val = SCIPvarGetUbLocal(var)
+                    else:
+                        val = SCIPvarGetLPSol(var)
+                    if f in (1, 2, 3, 4) and (val >= inf or val <= -inf):
+                        val = np.inf if val > 0 else -np.inf
+                    col[i] = val
+        finally:
+            free(scipvars)
+        return out
+
+    def getVarIndicesByPrefix(self, prefix, transformed=False):
+        """Positions in getVars(transformed) of the variables whose name starts with prefix.
+
+        :param prefix: a name prefix, or a tuple of prefixes (matching any of them)
+        :param transformed: search the transformed instead of the original variables (Default value = False)
+
+        Returns an int64 array, e.g. for getSolValsArray()[idx].
+        """
+        cdef SCIP_VAR** scipvars
+        cdef int nvars, i, k, nprefixes
+        cdef const char* name
+
+        prefixes = (prefix,) if isinstance(prefix, str) else tuple(prefix)
+        bprefixes = [str_conversion(p) for p in prefixes]
+        lengths = [len(b) for b in bprefixes]
+        nprefixes = len(bprefixes)
+
+        if transformed:
+            scipvars = SCIPgetVars(self._scip)
+            nvars = SCIPgetNVars(self._scip)
+        else:
+            scipvars = SCIPgetOrigVars(self._scip)
+            nvars = SCIPgetNOrigVars(self._scip)
+
+        hits = np.zeros(nvars, dtype=np.uint8)
+        cdef unsigned char[::1] hits_ = hits
+        for k in range(nprefixes):
+            bp = bprefixes[k]
+            for i in range(nvars):
+                if not hits_[i]:
+                    name = SCIPvarGetName(scipvars[i])
+                    hits_[i] = strncmp(name, <const char*>bp, <size_t>lengths[k]) == 0
+        return np.flatnonzero(hits)
+
     def getPrimalbound(self):
         """Retrieve the best primal bound."""
         return SCIPgetPrimalbound(self._scip)
@@ -5789,9 +6392,184 @@ cdef class Model:
         cuts = SCIPgetCuts(self._scip)
         return [Row.create(self._scip, cuts[i]) for i in range(self.getNCuts())]
 
+    def getCutFeatureMatrix(self, cuts=None):
+        """Returns the scalar quality features of several cuts in one call.
+
+        :param cuts: list of Rows (default: the cuts currently in the separation storage)
+
+        Returns a C-contiguous float32 array of shape (ncuts, 8) with columns
+        violation, relative violation, objective parallelism, efficacy (w.r.t. the current LP solution),
+        SCIP score, expected improvement, support score, integer support. Non-finite values are set to 0.
+        """
+        cdef SCIP_ROW** scipcuts
+        cdef SCIP_ROW** rows = NULL
+        cdef float[:, ::1] out
+        cdef int ncuts
+        cdef int i
+
+        if cuts is None:
+            scipcuts = SCIPgetCuts(self._scip)
+            ncuts = SCIPgetNCuts(self._scip)
+        else:
+            ncuts = len(cuts)
+            if ncuts > 0:
+                rows = <SCIP_ROW**> malloc(ncuts * sizeof(SCIP_ROW*))
+            scipcuts = rows
+
+        try:
+            if cuts is not None:
+                for i in range(ncuts):
+                    scipcuts[i] = (<Row?>cuts[i]).scip_row
+
+            features = np.zeros((ncuts, 8), dtype=np.float32)
+            out = features
+            for i in range(ncuts):
+                out[i, 0] = _finiteOrZero(SCIPgetCutViolation(self._scip, scipcuts[i]))
+                out[i, 1] = _finiteOrZero(SCIPgetCutRelViolation(self._scip, scipcuts[i]))
+                out[i, 2] = _finiteOrZero(SCIPgetCutObjParallelism(self._scip, scipcuts[i]))
+                out[i, 3] = _finiteOrZero(SCIPgetCutEfficacy(self._scip, NULL, scipcuts[i]))
+                out[i, 4] = _finiteOrZero(SCIPgetCutSCIPScore(self._scip, scipcuts[i]))
+                out[i, 5] = _finiteOrZero(SCIPgetCutExpImprov(self._scip, scipcuts[i]))
+                out[i, 6] = _finiteOrZero(SCIPgetCutSupportScore(self._scip, scipcuts[i]))
+                out[i, 7] = _finiteOrZero(SCIPgetCutIntSupport(self._scip, scipcuts[i]))
+        finally:
+            free(rows)
+
+        return features
+
     def getRowParallelism(self, Row r1 not None, Row r2 not None):
         return SCIProwGetParallelism(r1.scip_row, r2.scip_row, ord('e'))
 
+    def getParallelismMatrix(self, rows_a, rows_b=None, condensed=False, topk=None):
+        """Computes the euclidean parallelism |<a,b>| / (||a|| ||b||) of many row pairs in one call
+        (the value getRowParallelism returns for a single pair).
+
+        Each row of rows_a is scattered once into a dense work vector indexed by column, and the rows of rows_b are
+        dotted against it, so no Python objects are created per pair.
+
+        :param rows_a: list of Rows
+        :param rows_b: list of Rows (default: None, i.e. rows_a against itself)
+        :param condensed: only with rows_b=None: return the upper triangle (i < j) as a 1D array in row-major order,
+                          the layout of scipy's pdist
+        :param topk: if given, return only the topk most parallel pairs as a tuple (i, j, parallelism) of arrays sorted
+                     by decreasing parallelism; with rows_b=None only pairs i < j are considered
+
+        Returns a float32 array of shape (len(rows_a), len(rows_b)) unless condensed or topk is given.
+        """
+        cdef SCIP_ROW** arows = NULL
+        cdef SCIP_ROW** brows = NULL
+        cdef SCIP_Real* anorms = NULL
+        cdef SCIP_Real* bnorms = NULL
+        cdef SCIP_Real* work = NULL
+        cdef SCIP_COL** cols
+        cdef SCIP_Real* vals
+        cdef SCIP_Real dot
+        cdef SCIP_Real denom
+        cdef float par
+        cdef float[::1] outcond
+        cdef float[:, ::1] outfull
+        cdef bint symmetric = rows_b is None
+        cdef bint triangle
+        cdef int na, nb, i, j, k, nnonz, idx, maxidx, pos
+
+        if condensed and not symmetric:
+            raise ValueError("condensed output requires rows_b=None")
+        triangle = symmetric and (condensed or topk is not None)
+
+        na = len(rows_a)
+        nb = na if symmetric else len(rows_b)
+
+        try:
+            arows = <SCIP_ROW**> malloc((na + 1) * sizeof(SCIP_ROW*))
+            anorms = <SCIP_Real*> malloc((na + 1) * sizeof(SCIP_Real))
+            for i in range(na):
+                arows[i] = (<Row?>rows_a[i]).scip_row
+                anorms[i] = _rowEuclideanNorm(arows[i])
+
+            if symmetric:
+                brows = arows
+                bnorms = anorms
+            else:
+                brows = <SCIP_ROW**> malloc((nb + 1) * sizeof(SCIP_ROW*))
+                bnorms = <SCIP_Real*> malloc((nb + 1) * sizeof(SCIP_Real))
+                for j in range(nb):
+                    brows[j] = (<Row?>rows_b[j]).scip_row
+                    bnorms[j] = _rowEuclideanNorm(brows[j])
+
+            maxidx = 0
+            for i in range(na):
+                cols = SCIProwGetCols(arows[i])
+                for k in range(SCIProwGetNNonz(arows[i])):
+                    if SCIPcolGetIndex(cols[k]) > maxidx:
+                        maxidx = SCIPcolGetIndex(cols[k])
+            work = <SCIP_Real*> calloc(maxidx + 1, sizeof(SCIP_Real))
+
+            if triangle:
+                result = np.zeros(na * (na - 1) // 2, dtype=np.float32)
+                outcond = result
+            else:
+                result = np.zeros((na, nb), dtype=np.float32)
+                outfull = result
+
+            pos = 0
+            for i in range(na):
+                cols = SCIProwGetCols(arows[i])
+                vals = SCIProwGetVals(arows[i])
+                nnonz = SCIProwGetNNonz(arows[i])
+                for k in range(nnonz):
+                    work[SCIPcolGetIndex(cols[k])] = vals[k]
+
+                for j in range(i if symmetric else 0, nb):
+                    if triangle and j == i:
+                        continue
+                    dot = 0.0
+                    cols = SCIProwGetCols(brows[j])
+                    vals = SCIProwGetVals(brows[j])
+                    for k in range(SCIProwGetNNonz(brows[j])):
+                        idx = SCIPcolGetIndex(cols[k])
+                        if idx <= maxidx:
+                            dot += work[idx] * vals[k]
+
+                    denom = anorms[i] * bnorms[j]
+                    par = 0.0 if dot == 0.0 or denom == 0.0 else <float>(abs(dot) / denom)
+
+                    if triangle:
+                        outcond[pos] = par
+                        pos += 1
+                    else:
+                        outfull[i, j] = par
+                        if symmetric:
+                            outfull[j, i] = par
+
+                cols = SCIProwGetCols(arows[i])
+                for k in range(nnonz):
+                    work[SCIPcolGetIndex(cols[k])] = 0.0
+        finally:
+            free(work)
+            if not symmetric:
+                free(brows)
+                free(bnorms)
+            free(arows)
+            free(anorms)
+
+        if topk is None:
+            return result
+
+        flat = result.ravel()
+        k = min(int(topk), flat.shape[0])
+        if k <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        sel = np.argpartition(-flat, k - 1)[:k]
+        sel = sel[np.argsort(-flat[sel], kind='stable')]
+        if triangle:
+            # row i of the triangle starts at offsets[i] and holds pairs (i, i+1), ..., (i, na-1)
+            offsets = np.concatenate(([0], np.cumsum(np.arange(na - 1, 0, -1))))
+            ii = np.searchsorted(offsets, sel, side='right') - 1
+            jj = sel - offsets[ii] + ii + 1
+        else:
+            ii, jj = np.unravel_index(sel, (na, nb))
+        return ii.astype(np.int64), jj.astype(np.int64), flat[sel]
+
     def filterCutWithParallelismAtRoot(self, Row cut not None,
                                        Row other_cut not None, is_good):
         r'''
@@ -6578,6 +7356,251 @@ cdef class Model:
         }
         return features
 
+    def getRowFeatures1Batch(self, rows=None, names=False, dynamic_only=False):
+        """
+        Columnar variant of getRowFeatures1 for many rows at once.
+
+        :param rows: list of Rows (default: None, i.e. all rows currently in the LP)
+        :param names: also return the (interned) row names under 'rname' (default: False)
+        :param dynamic_only: only fill the features that change while a row exists (LP position, sides, activities,
+                             dual value, basis status, age, LP counts, and 'nlpnonz', which a cut only gets once it is
+                             linked into the LP) and skip the static ones ('origin_type', 'cst',
+                             'row_norm', 'obj_parallelism', 'intcols', 'rank', 'nnonz', 'is_integral', 'is_removable',
+                             'rname'), e.g. when those are cached across separation rounds
+
+        Returns a dict with one NumPy array per per-row feature of getRowFeatures1 (same keys; int8 origin_type and
+        basisstatus, bool flags, float64 values) and plain scalars for the global normalizers 'obj_norm', 'cste',
+        'ncols' and 'nlps'.
+        """
+        cdef SCIP* scip = self._scip
+        cdef SCIP_ROW** lprows
+        cdef SCIP_ROW** scipcuts = NULL
+        cdef SCIP_ROW** scrows
+        cdef SCIP_ROW* row
+        cdef SCIP_Real lhs, rhs
+        cdef double inf = np.inf
+        cdef int nrows
+        cdef int i
+
+        cdef signed char[::1] origin_type, basisstatus
+        cdef int[::1] lp_pos, age, intcols, rank, nnonz, nlpnonz
+        cdef long long[::1] nlpsaftercreation
+        cdef double[::1] lhs_, rhs_, cst, activity, feasibility, minactivity, maxactivity, dualsol, row_norm
+        cdef double[::1] obj_parallelism, pseudoactivity, pseudofeasibility
+        cdef unsigned char[::1] is_integral, is_removable, is_in_lp
+
+        if rows is None:
+            PY_SCIP_CALL(SCIPgetLPRowsData(scip, &lprows, &nrows))
+            scrows = lprows
+        else:
+            nrows = len(rows)
+            scipcuts = <SCIP_ROW**> malloc((nrows + 1) * sizeof(SCIP_ROW*))
+            scrows = scipcuts
+
+        try:
+            if rows is not None:
+                for i in range(nrows):
+                    scrows[i] = (<Row?>rows[i]).scip_row
+
+            features = {
+                'lp_pos': np.empty(nrows, dtype=np.int32),
+                'lhs': np.empty(nrows, dtype=np.float64),
+                'rhs': np.empty(nrows, dtype=np.float64),
+                'activity': np.empty(nrows, dtype=np.float64),
+                'feasibility': np.empty(nrows, dtype=np.float64),
+                'minactivity': np.empty(nrows, dtype=np.float64),
+                'maxactivity': np.empty(nrows, dtype=np.float64),
+                'dualsol': np.empty(nrows, dtype=np.float64),
+                'obj_norm': self.getObjL2Norm(),
+                'cste': 5.,
+                'ncols': SCIPgetNLPCols(scip),
+                'nlps': SCIPgetNLPs(scip),
+                'age': np.empty(nrows, dtype=np.int32),
+                'nlpsaftercreation': np.empty(nrows, dtype=np.int64),
+                'pseudoactivity': np.empty(nrows, dtype=np.float64),
+                'pseudofeasibility': np.empty(nrows, dtype=np.float64),
+                'basisstatus': np.empty(nrows, dtype=np.int8),
+                'is_in_lp': np.empty(nrows, dtype=np.bool_),
+                'nlpnonz': np.empty(nrows, dtype=np.int32),
+            }
+            lp_pos = features['lp_pos']
+            lhs_ = features['lhs']
+            rhs_ = features['rhs']
+            activity = features['activity']
+            feasibility = features['feasibility']
+            minactivity = features['minactivity']
+            maxactivity = features['maxactivity']
+            dualsol = features['dualsol']
+            age = features['age']
+            nlpsaftercreation = features['nlpsaftercreation']
+            pseudoactivity = features['pseudoactivity']
+            pseudofeasibility = features['pseudofeasibility']
+            basisstatus = features['basisstatus']
+            is_in_lp = features['is_in_lp'].view(np.uint8)
+            nlpnonz = features['nlpnonz']
+
+            for i in range(nrows):
+                row = scrows[i]
+                lhs = SCIProwGetLhs(row)
+                rhs = SCIProwGetRhs(row)
+
+                lp_pos[i] = SCIProwGetLPPos(row)
+                lhs_[i] = -inf if SCIPisInfinity(scip, REALABS(lhs)) else lhs
+                rhs_[i] = inf if SCIPisInfinity(scip, REALABS(rhs)) else rhs
+                activity[i] = SCIPgetRowLPActivity(scip, row)
+                feasibility[i] = SCIPgetRowLPFeasibility(scip, row)
+                minactivity[i] = SCIPgetRowMinActivity(scip, row)
+                maxactivity[i] = SCIPgetRowMaxActivity(scip, row)
+                dualsol[i] = SCIProwGetDualsol(row)
+                age[i] = SCIProwGetAge(row)
+                nlpsaftercreation[i] = SCIProwGetNLPsAfterCreation(row)
+                pseudoactivity[i] = SCIPgetRowPseudoActivity(scip, row)
+                pseudofeasibility[i] = SCIPgetRowPseudoFeasibility(scip, row)
+                basisstatus[i] = <signed char>SCIProwGetBasisStatus(row)
+                is_in_lp[i] = SCIProwIsInLP(row)
+                nlpnonz[i] = SCIProwGetNLPNonz(row)
+
+            if dynamic_only:
+                return features
+
+            features.update({
+                'origin_type': np.empty(nrows, dtype=np.int8),
+                'cst': np.empty(nrows, dtype=np.float64),
+                'row_norm': np.empty(nrows, dtype=np.float64),
+                'obj_parallelism': np.empty(nrows, dtype=np.float64),
+                'intcols': np.empty(nrows, dtype=np.int32),
+                'rank': np.empty(nrows, dtype=np.int32),
+                'nnonz': np.empty(nrows, dtype=np.int32),
+                'is_integral': np.empty(nrows, dtype=np.bool_),
+                'is_removable': np.empty(nrows, dtype=np.bool_),
+            })
+            origin_type = features['origin_type']
+            cst = features['cst']
+            row_norm = features['row_norm']
+            obj_parallelism = features['obj_parallelism']
+            intcols = features['intcols']
+            rank = features['rank']
+            nnonz = features['nnonz']
+            is_integral = features['is_integral'].view(np.uint8)
+            is_removable = features['is_removable'].view(np.uint8)
+
+            for i in range(nrows):
+                row = scrows[i]
+                origin_type[i] = <signed char>SCIProwGetOrigintype(row)
+                cst[i] = SCIProwGetConstant(row)
+                row_norm[i] = SCIProwGetNorm(row)
+                obj_parallelism[i] = SCIPgetCutObjParallelism(scip, row)
+                intcols[i] = SCIPgetRowNumIntCols(scip, row)
+                rank[i] = SCIProwGetRank(row)
+                nnonz[i] = SCIProwGetNNonz(row)
+                is_integral[i] = SCIProwIsIntegral(row)
+                is_removable[i] = SCIProwIsRemovable(row)
+
+            if names:
+                features['rname'] = [sys.intern(bytes(SCIProwGetName(scrows[i])).decode('utf-8')) for i in range(nrows)]
+        finally:
+            free(scipcuts)
+
+        return features
+
+    def getColFeatures1Batch(self, cols=None, names=False):
+        """
+        Columnar variant of getColFeatures1 for many columns at once.
+
+        :param cols: list of Columns (default: None, i.e. all columns currently in the LP)
+        :param names: also return the (interned) variable names under 'vname' (default: False)
+
+        Returns a dict with one NumPy array per feature of getColFeatures1 (same keys; int8 type and basestat, bool
+        flags, float64 values). Infinite bounds are stored as -inf/inf instead of None.
+        """
+        cdef SCIP* scip = self._scip
+        cdef SCIP_COL** lpcols
+        cdef SCIP_COL** scipcols = NULL
+        cdef SCIP_COL** sccols
+        cdef SCIP_COL* col
+        cdef SCIP_Real lb, ub, solval, obj
+        cdef SCIP_Real obj_norm = self.getObjL2Norm()
+        cdef SCIP_Real cste = 5.
+        cdef SCIP_Longint n_lps = SCIPgetNLPs(scip)
+        cdef double inf = np.inf
+        cdef int ncols
+        cdef int i
+
+        cdef signed char[::1] vtype, basestat
+        cdef int[::1] lp_pos
+        cdef double[::1] coef, norm_coef, lb_, ub_, norm_redcost, norm_age, solval_, solfrac
+        cdef unsigned char[::1] sol_is_at_lb, sol_is_at_ub
+
+        if cols is None:
+            PY_SCIP_CALL(SCIPgetLPColsData(scip, &lpcols, &ncols))
+            sccols = lpcols
+        else:
+            ncols = len(cols)
+            scipcols = <SCIP_COL**> malloc((ncols + 1) * sizeof(SCIP_COL*))
+            sccols = scipcols
+
+        try:
+            if cols is not None:
+                for i in range(ncols):
+                    sccols[i] = (<Column?>cols[i]).scip_col
+
+            features = {
+                'lp_pos': np.empty(ncols, dtype=np.int32),
+                'type': np.empty(ncols, dtype=np.int8),
+                'coef': np.empty(ncols, dtype=np.float64),
+                'norm_coef': np.empty(ncols, dtype=np.float64),
+                'lb': np.empty(ncols, dtype=np.float64),
+                'ub': np.empty(ncols, dtype=np.float64),
+                'basestat': np.empty(ncols, dtype=np.int8),
+                'norm_redcost': np.empty(ncols, dtype=np.float64),
+                'norm_age': np.empty(ncols, dtype=np.float64),
+                'solval': np.empty(ncols, dtype=np.float64),
+                'solfrac': np.empty(ncols, dtype=np.float64),
+                'sol_is_at_lb': np.empty(ncols, dtype=np.bool_),
+                'sol_is_at_ub': np.empty(ncols, dtype=np.bool_),
+            }
+            lp_pos = features['lp_pos']
+            vtype = features['type']
+            coef = features['coef']
+            norm_coef = features['norm_coef']
+            lb_ = features['lb']
+            ub_ = features['ub']
+            basestat = features['basestat']
+            norm_redcost = features['norm_redcost']
+            norm_age = features['norm_age']
+            solval_ = features['solval']
+            solfrac = features['solfrac']
+            sol_is_at_lb = features['sol_is_at_lb'].view(np.uint8)
+            sol_is_at_ub = features['sol_is_at_ub'].view(np.uint8)
+
+            for i in range(ncols):
+                col = sccols[i]
+                lb = SCIPcolGetLb(col)
+                ub = SCIPcolGetUb(col)
+                solval = SCIPcolGetPrimsol(col)
+                obj = SCIPcolGetObj(col)
+
+                lp_pos[i] = SCIPcolGetLPPos(col)
+                vtype[i] = <signed char>SCIPvarGetType(SCIPcolGetVar(col))
+                coef[i] = obj
+                norm_coef[i] = obj / obj_norm
+                lb_[i] = -inf if SCIPisInfinity(scip, REALABS(lb)) else lb
+                ub_[i] = inf if SCIPisInfinity(scip, REALABS(ub)) else ub
+                basestat[i] = <signed char>SCIPcolGetBasisStatus(col)
+                norm_redcost[i] = SCIPgetColRedcost(scip, col) / obj_norm
+                norm_age[i] = col.age / (n_lps + cste)
+                solval_[i] = solval
+                solfrac[i] = SCIPfeasFrac(scip, solval)
+                sol_is_at_lb[i] = SCIPisEQ(scip, solval, lb)
+                sol_is_at_ub[i] = SCIPisEQ(scip, solval, ub)
+
+            if names:
+                features['vname'] = [sys.intern(bytes(SCIPvarGetName(SCIPcolGetVar(sccols[i]))).decode('utf-8')) for i in range(ncols)]
+        finally:
+            free(scipcols)
+
+        return features
+
     def getRowColCoef(self, Row row not None, Column col not None):
           col_name = col.getVar().name
           row_cols = row.getCols()
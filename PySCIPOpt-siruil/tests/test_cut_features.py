@@ -0,0 +1,79 @@
+import math
+
+import numpy as np
+
+from pyscipopt import Model, Sepa, SCIP_RESULT, SCIP_PARAMSETTING
+
+
+class FeatureProbe(Sepa):
+    """Runs after the default separators and compares the bulk cut features with the per-cut getters."""
+
+    def __init__(self):
+        self.ncalls = 0
+        self.ncuts = 0
+
+    def sepaexeclp(self):
+        m = self.model
+        cuts = m.getCuts()
+        feats = m.getCutFeatureMatrix()
+
+        assert feats.dtype == np.float32
+        assert feats.shape == (len(cuts), 8)
+        assert feats.flags["C_CONTIGUOUS"]
+        assert np.all(np.isfinite(feats))
+
+        getters = [
+            m.getCutViolation,
+            m.getCutRelViolation,
+            m.getCutObjParallelism,
+            m.getCutEfficacy,
+            m.getCutSCIPScore,
+            m.getCutExpImprov,
+            m.getCutSupportScore,
+            m.getCutIntSupport,
+        ]
+        for i, cut in enumerate(cuts):
+            for j, getter in enumerate(getters):
+                v = getter(cut)
+                expected = v if math.isfinite(v) else 0.0
+                assert math.isclose(feats[i, j], expected, rel_tol=1e-5, abs_tol=1e-6)
+
+        # explicit list of rows gives the same matrix, in the given order
+        assert np.array_equal(m.getCutFeatureMatrix(cuts[::-1]), feats[::-1])
+
+        self.ncalls += 1
+        self.ncuts += len(cuts)
+        return {"result": SCIP_RESULT.DIDNOTRUN}
+
+
+def build_knapsacks(m, n=30, k=4):
+    weights = [[(7 * i + 13 * j) % 23 + 5 for i in range(n)] for j in range(k)]
+    values = [(11 * i) % 17 + 3 for i in range(n)]
+    x = [m.addVar("x%d" % i, vtype="B", obj=-values[i]) for i in range(n)]
+    for j in range(k):
+        m.addCons(sum(weights[j][i] * x[i] for i in range(n)) <= sum(weights[j]) // 3)
+    return x
+
+
+def test_cut_feature_matrix():
+    m = Model()
+    m.hideOutput()
+    m.setPresolve(SCIP_PARAMSETTING.OFF)
+    m.setHeuristics(SCIP_PARAMSETTING.OFF)
+    m.setIntParam("separating/maxroundsroot", 5)
+
+    probe = FeatureProbe()
+    m.includeSepa(probe, "featureprobe", "checks getCutFeatureMatrix", priority=-100000, freq=1)
+
+    build_knapsacks(m)
+    m.optimize()
+
+    assert probe.ncalls > 0
+
+
+def test_cut_feature_matrix_empty():
+    m = Model()
+    m.hideOutput()
+    feats = m.getCutFeatureMatrix([])
+    assert feats.shape == (0, 8)
+    assert feats.dtype == np.float32
@@ -0,0 +1,107 @@
+import pytest
+
+from pyscipopt import Model, Cutsel, SCIP_RESULT, SCIP_PARAMSETTING
+
+
+class TopEfficacyCutsel(Cutsel):
+    """Keeps the k most efficacious candidate cuts, returned as positions or as a reordered list."""
+
+    def __init__(self, k, by_position=True):
+        self.k = k
+        self.by_position = by_position
+        self.ncalls = 0
+        self.nselected = 0
+
+    def cutselselect(self, cuts, forcedcuts, root, maxnselectedcuts):
+        assert maxnselectedcuts <= len(cuts)
+        self.ncalls += 1
+        eff = [self.model.getCutEfficacy(c) for c in cuts]
+        order = sorted(range(len(cuts)), key=lambda i: -eff[i])
+        n = min(self.k, maxnselectedcuts)
+        self.nselected += n
+        if self.by_position:
+            return {"result": SCIP_RESULT.SUCCESS, "selected": order[:n]}
+        return {"result": SCIP_RESULT.SUCCESS, "cuts": [cuts[i] for i in order], "nselectedcuts": n}
+
+
+class PassCutsel(Cutsel):
+
+    def __init__(self):
+        self.ncalls = 0
+
+    def cutselselect(self, cuts, forcedcuts, root, maxnselectedcuts):
+        self.ncalls += 1
+        return {"result": SCIP_RESULT.DIDNOTFIND}
+
+
+class BadReorderCutsel(Cutsel):
+    """Returns the candidates with the first cut repeated in place of the last one."""
+
+    def cutselselect(self, cuts, forcedcuts, root, maxnselectedcuts):
+        if len(cuts) < 2:
+            return {"result": SCIP_RESULT.DIDNOTFIND}
+        return {"result": SCIP_RESULT.SUCCESS, "cuts": [cuts[0]] + cuts[:-1], "nselectedcuts": 1}
+
+
+def build_knapsacks(m, n=30, k=4):
+    weights = [[(7 * i + 13 * j) % 23 + 5 for i in range(n)] for j in range(k)]
+    values = [(11 * i) % 17 + 3 for i in range(n)]
+    x = [m.addVar("x%d" % i, vtype="B", obj=-values[i]) for i in range(n)]
+    for j in range(k):
+        m.addCons(sum(weights[j][i] * x[i] for i in range(n)) <= sum(weights[j]) // 3)
+    return x
+
+
+def make_model():
+    m = Model()
+    m.hideOutput()
+    m.setPresolve(SCIP_PARAMSETTING.OFF)
+    m.setHeuristics(SCIP_PARAMSETTING.OFF)
+    m.setIntParam("separating/maxroundsroot", 5)
+    build_knapsacks(m)
+    return m
+
+
+def test_cutsel_selects_cuts():
+    for by_position in (True, False):
+        m = make_model()
+        cutsel = TopEfficacyCutsel(k=2, by_position=by_position)
+        m.includeCutsel(cutsel, "topefficacy", "keeps the two most efficacious cuts", priority=5000)
+        m.optimize()
+
+        assert cutsel.ncalls > 0
+        stats = m.getCutselStatistics("topefficacy")
+        assert stats["ncalls"] == cutsel.ncalls
+        assert stats["nsuccess"] == cutsel.ncalls
+        assert stats["nselected"] == cutsel.nselected
+        assert m.getNCutsApplied() <= cutsel.nselected
+
+
+def test_cutsel_fallback_and_priority():
+    reference = make_model()
+    reference.optimize()
+
+    m = make_model()
+    passing = PassCutsel()
+    selecting = TopEfficacyCutsel(k=1)
+    m.includeCutsel(passing, "pass", "never selects", priority=10000)
+    m.includeCutsel(selecting, "top1", "keeps the most efficacious cut", priority=100)
+    m.optimize()
+
+    # the higher priority selector is asked first, the next one decides
+    assert passing.ncalls > 0
+    assert passing.ncalls == selecting.ncalls
+    assert abs(m.getObjVal() - reference.getObjVal()) < 1e-6
+
+    m.setIntParam("cutselection/top1/priority", 20000)
+    m.freeTransform()
+    passing.ncalls = 0
+    m.optimize()
+    assert passing.ncalls == 0
+
+
+def test_cutsel_rejects_non_permutation():
+    m = make_model()
+    m.includeCutsel(BadReorderCutsel(), "bad", "repeats a cut", priority=5000)
+    with pytest.raises(Exception):
+        m.optimize()
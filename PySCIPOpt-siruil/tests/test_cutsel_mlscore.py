@@ -0,0 +1,85 @@
+import pytest
+
+from pyscipopt import Model, Cutsel, SCIP_RESULT, SCIP_PARAMSETTING
+
+
+class RecordingCutsel(Cutsel):
+    """Runs after the native scorer and records the rounds it leaves to the next selector."""
+
+    def __init__(self):
+        self.ncalls = 0
+
+    def cutselselect(self, cuts, forcedcuts, root, maxnselectedcuts):
+        self.ncalls += 1
+        return {"result": SCIP_RESULT.DIDNOTFIND}
+
+
+def build_knapsacks(m, n=30, k=4):
+    weights = [[(7 * i + 13 * j) % 23 + 5 for i in range(n)] for j in range(k)]
+    values = [(11 * i) % 17 + 3 for i in range(n)]
+    x = [m.addVar("x%d" % i, vtype="B", obj=-values[i]) for i in range(n)]
+    for j in range(k):
+        m.addCons(sum(weights[j][i] * x[i] for i in range(n)) <= sum(weights[j]) // 3)
+    return x
+
+
+def make_model():
+    m = Model()
+    m.hideOutput()
+    m.setPresolve(SCIP_PARAMSETTING.OFF)
+    m.setHeuristics(SCIP_PARAMSETTING.OFF)
+    m.setIntParam("separating/maxroundsroot", 5)
+    build_knapsacks(m)
+    return m
+
+
+def test_default_model_selects_top_k():
+    reference = make_model()
+    reference.optimize()
+
+    m = make_model()
+    m.includeNativeCutScorer(top_k=2)
+    m.optimize()
+
+    stats = m.getNativeCutScorerStatistics()
+    assert stats["nrounds"] > 0
+    assert stats["ncutsvalid"] <= stats["ncutsseen"]
+    selecting = stats["nrounds"] - stats["nroundsskipped"]
+    assert stats["ncutskept"] <= 2 * selecting
+    assert m.getCutselStatistics("mlscore")["nselected"] == stats["ncutskept"]
+    assert abs(m.getObjVal() - reference.getObjVal()) < 1e-6
+
+
+def test_linear_and_mlp_models():
+    for kwargs in (dict(weights=[0, 0, 0, 1, 0, 0, 0, 0]),
+                   dict(layers=[([[0, 0, 0, 1, 0, 0, 0, 0]] * 4, [0.0] * 4), ([[1, -1, 1, -1]], [0.5])],
+                        mu=[0.0] * 8, sd=[2.0] * 8, cliplo=[0.0] * 8, cliphi=[10.0] * 8)):
+        m = make_model()
+        m.includeNativeCutScorer(top_frac=0.5, min_keep=1, **kwargs)
+        m.optimize()
+        assert m.getNativeCutScorerStatistics()["nrounds"] > 0
+
+
+def test_skipped_rounds_fall_through():
+    m = make_model()
+    recorder = RecordingCutsel()
+    m.includeCutsel(recorder, "recorder", "records unselected rounds", priority=100)
+    # keeping more cuts than any round produces leaves every round to the next selector
+    m.includeNativeCutScorer(top_k=100000, min_efficacy=0.0, root_only=False)
+    m.optimize()
+
+    stats = m.getNativeCutScorerStatistics()
+    assert stats["ncutskept"] == 0
+    assert recorder.ncalls == stats["nrounds"]
+
+
+def test_invalid_models_rejected():
+    m = make_model()
+    with pytest.raises(ValueError):
+        m.includeNativeCutScorer(weights=[1.0] * 7)
+    with pytest.raises(ValueError):
+        m.includeNativeCutScorer(layers=[([[1.0] * 8] * 3, [0.0] * 3), ([[1.0, 1.0]], [0.0])])
+    with pytest.raises(ValueError):
+        m.includeNativeCutScorer(mu=[0.0] * 8)
+    with pytest.raises(KeyError):
+        make_model().getNativeCutScorerStatistics()
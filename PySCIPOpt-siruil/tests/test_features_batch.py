@@ -0,0 +1,88 @@
+import math
+
+import numpy as np
+
+from pyscipopt import Model, Sepa, SCIP_RESULT, SCIP_PARAMSETTING
+
+
+def check_batch(batch, dicts, name_key, global_keys=()):
+    for k, v in batch.items():
+        if k == name_key:
+            assert v == [d[k] for d in dicts]
+            continue
+        if k in global_keys:
+            for d in dicts:
+                assert d[k] == v
+            continue
+        assert isinstance(v, np.ndarray) and v.shape == (len(dicts),)
+        for i, d in enumerate(dicts):
+            expected = d[k]
+            if expected is None:
+                expected = -math.inf if k == 'lb' else math.inf
+            assert v[i] == expected or math.isclose(v[i], expected, rel_tol=1e-12), (k, v[i], expected)
+
+
+class FeatureProbe(Sepa):
+
+    def __init__(self):
+        self.ncalls = 0
+
+    def sepaexeclp(self):
+        m = self.model
+        rows = m.getLPRowsData()
+        cols = m.getLPColsData()
+        cuts = m.getCuts()
+
+        batch = m.getRowFeatures1Batch(names=True)
+        assert batch['basisstatus'].dtype == np.int8
+        assert batch['is_in_lp'].dtype == np.bool_
+        check_batch(batch, [m.getRowFeatures1(r) for r in rows], 'rname', ('obj_norm', 'cste', 'ncols', 'nlps'))
+        assert 'rname' not in m.getRowFeatures1Batch()
+
+        batch = m.getRowFeatures1Batch(cuts)
+        check_batch(batch, [m.getRowFeatures1(c) for c in cuts], 'rname', ('obj_norm', 'cste', 'ncols', 'nlps'))
+
+        full = m.getRowFeatures1Batch(rows)
+        dynamic = m.getRowFeatures1Batch(rows, dynamic_only=True)
+        assert set(dynamic) < set(full)
+        for key in ('origin_type', 'rank', 'nnonz', 'row_norm'):
+            assert key not in dynamic
+        for key, v in dynamic.items():
+            assert np.array_equal(v, full[key])
+
+        # row indices identify rows across rounds
+        indices = [r.index for r in rows + cuts]
+        assert len(set(indices)) == len(indices)
+
+        batch = m.getColFeatures1Batch(names=True)
+        assert batch['basestat'].dtype == np.int8
+        check_batch(batch, [m.getColFeatures1(c) for c in cols], 'vname')
+
+        # interned names share the identical string object
+        names = m.getColFeatures1Batch(names=True)['vname']
+        assert all(a is b for a, b in zip(names, batch['vname']))
+
+        self.ncalls += 1
+        return {"result": SCIP_RESULT.DIDNOTRUN}
+
+
+def test_features_batch():
+    m = Model()
+    m.hideOutput()
+    m.setPresolve(SCIP_PARAMSETTING.OFF)
+    m.setHeuristics(SCIP_PARAMSETTING.OFF)
+    m.setIntParam("separating/maxroundsroot", 2)
+
+    probe = FeatureProbe()
+    m.includeSepa(probe, "featureprobe", "checks the batched feature getters", priority=-100000, freq=1)
+
+    n, k = 20, 3
+    x = [m.addVar("x%d" % i, vtype="B", obj=-((11 * i) % 17 + 3)) for i in range(n)]
+    y = m.addVar("y", lb=None, obj=0.5)
+    for j in range(k):
+        w = [(7 * i + 13 * j) % 23 + 5 for i in range(n)]
+        m.addCons(sum(w[i] * x[i] for i in range(n)) <= sum(w) // 3)
+    m.addCons(y >= x[0] - x[1])
+    m.optimize()
+
+    assert probe.ncalls > 0
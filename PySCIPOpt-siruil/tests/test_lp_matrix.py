@@ -0,0 +1,71 @@
+import numpy as np
+
+from pyscipopt import Model, Sepa, SCIP_RESULT, SCIP_PARAMSETTING
+
+
+def dense_from_rows(rows, ncols):
+    A = np.zeros((len(rows), ncols))
+    for i, row in enumerate(rows):
+        for col, val in zip(row.getCols(), row.getVals()):
+            if col.getLPPos() >= 0:
+                A[i, col.getLPPos()] = val
+    return A
+
+
+def sorted_rows(indptr, indices):
+    return all(np.all(np.diff(indices[indptr[i]:indptr[i + 1]]) > 0) for i in range(len(indptr) - 1))
+
+
+def dense_from_csr(indptr, indices, data, ncols):
+    A = np.zeros((len(indptr) - 1, ncols))
+    for i in range(len(indptr) - 1):
+        A[i, indices[indptr[i]:indptr[i + 1]]] = data[indptr[i]:indptr[i + 1]]
+    return A
+
+
+class MatrixProbe(Sepa):
+
+    def __init__(self):
+        self.ncalls = 0
+
+    def sepaexeclp(self):
+        m = self.model
+        ncols = m.getNLPCols()
+        rows = m.getLPRowsData()
+        cuts = m.getCuts()
+
+        indptr, indices, data = m.getLPMatrixCSR()
+        assert indptr.dtype == np.int32 and indices.dtype == np.int32 and data.dtype == np.float64
+        assert len(indptr) == len(rows) + 1
+        assert indptr[-1] == len(indices) == len(data)
+        assert np.array_equal(dense_from_csr(indptr, indices, data, ncols), dense_from_rows(rows, ncols))
+        assert sorted_rows(indptr, indices)
+
+        indptr, indices, data = m.getLPMatrixCSR(cuts)
+        assert len(indptr) == len(cuts) + 1
+        assert np.all((indices >= 0) & (indices < ncols))
+        assert np.array_equal(dense_from_csr(indptr, indices, data, ncols), dense_from_rows(cuts, ncols))
+        assert sorted_rows(indptr, indices)
+
+        self.ncalls += 1
+        return {"result": SCIP_RESULT.DIDNOTRUN}
+
+
+def test_lp_matrix_csr():
+    m = Model()
+    m.hideOutput()
+    m.setPresolve(SCIP_PARAMSETTING.OFF)
+    m.setHeuristics(SCIP_PARAMSETTING.OFF)
+    m.setIntParam("separating/maxroundsroot", 3)
+
+    probe = MatrixProbe()
+    m.includeSepa(probe, "matrixprobe", "checks getLPMatrixCSR", priority=-100000, freq=1)
+
+    n, k = 25, 4
+    x = [m.addVar("x%d" % i, vtype="B", obj=-((11 * i) % 17 + 3)) for i in range(n)]
+    for j in range(k):
+        w = [(7 * i + 13 * j) % 23 + 5 for i in range(n)]
+        m.addCons(sum(w[i] * x[i] for i in range(n)) <= sum(w) // 3)
+    m.optimize()
+
+    assert probe.ncalls > 0
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from pyscipopt import Model, quicksum
+
+
+def test_add_vars_shape_and_bounds():
+    m = Model()
+    x = m.addVars((2, 3), name="x", vtype="I", lb=[[0, 1, 2]], ub=None, obj=np.arange(6).reshape(2, 3))
+    assert x.shape == (2, 3)
+    assert m.getNVars() == 6
+    assert x[1, 2].name == "x_1_2"
+    assert x[0, 1].getLbOriginal() == 1.0
+    assert m.isInfinity(x[0, 0].getUbOriginal())
+    assert x[1, 0].getObj() == 3.0
+    assert x[0, 0].vtype() == "INTEGER"
+
+    y = m.addVars(3, name=["a", "b", "c"], vtype="B")
+    assert [v.name for v in y] == ["a", "b", "c"]
+    assert y[0].vtype() == "BINARY"
+
+    with pytest.raises(ValueError):
+        m.addVars(2, name=["only_one"])
+
+
+def knapsack_data():
+    weights = np.array([[(7 * i + 13 * j) % 23 + 5 for i in range(12)] for j in range(3)], dtype=float)
+    values = np.array([(11 * i) % 17 + 3 for i in range(12)], dtype=float)
+    caps = weights.sum(axis=1) // 3
+    return weights, values, caps
+
+
+def test_matrix_cons_matches_addcons():
+    weights, values, caps = knapsack_data()
+
+    m1 = Model()
+    m1.hideOutput()
+    x1 = [m1.addVar("x%d" % i, vtype="B", obj=-values[i]) for i in range(12)]
+    for j in range(3):
+        m1.addCons(quicksum(weights[j, i] * x1[i] for i in range(12)) <= caps[j])
+    m1.optimize()
+
+    m2 = Model()
+    m2.hideOutput()
+    x2 = m2.addVars(12, name="x", vtype="B", obj=-values)
+    conss = m2.addMatrixCons(weights, x2, rhs=caps, names="knap")
+    assert len(conss) == 3
+    assert conss[1].name == "knap_1"
+    coefs = m2.getValsLinear(conss[0])
+    assert coefs == {"x_%d" % i: weights[0, i] for i in range(12)}
+    m2.optimize()
+
+    assert m1.getStatus() == m2.getStatus() == "optimal"
+    assert abs(m1.getObjVal() - m2.getObjVal()) < 1e-9
+
+
+def test_matrix_cons_csr_tuple():
+    m = Model()
+    m.hideOutput()
+    x = m.addVars(3, lb=None)
+    # rows: x0 + 2 x2 (explicit zero on x1 skipped), x1 - x0
+    indptr = np.array([0, 3, 5])
+    indices = np.array([0, 1, 2, 1, 0])
+    data = np.array([1.0, 0.0, 2.0, 1.0, -1.0])
+    conss = m.addMatrixCons((indptr, indices, data), x, lhs=[1.0, -np.inf], rhs=[np.inf, 0.0])
+    assert len(conss) == 2
+    assert len(m.getValsLinear(conss[0])) == 2
+    assert m.isInfinity(m.getRhs(conss[0]))
+    assert m.isInfinity(-m.getLhs(conss[1]))
+
+    with pytest.raises(ValueError):
+        m.addMatrixCons((np.array([0, 1]), np.array([5]), np.array([1.0])), x)
+
+
+def test_matrix_cons_scipy():
+    sp = pytest.importorskip("scipy.sparse")
+    weights, values, caps = knapsack_data()
+    m = Model()
+    m.hideOutput()
+    x = m.addVars(12, vtype="B", obj=-values)
+    conss = m.addMatrixCons(sp.csr_matrix(weights), x, rhs=caps)
+    assert len(conss) == 3
+    m.optimize()
+    assert m.getStatus() == "optimal"
@@ -0,0 +1,139 @@
+import os
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyscipopt import Model, Sepa, Nodesel, SCIP_RESULT, SCIP_PARAMSETTING
+
+
+def build_knapsacks(m, n=30, k=4, shift=0):
+    weights = [[(7 * i + 13 * j + shift) % 23 + 5 for i in range(n)] for j in range(k)]
+    values = [(11 * i + shift) % 17 + 3 for i in range(n)]
+    x = [m.addVar("x%d" % i, vtype="B", obj=-values[i]) for i in range(n)]
+    for j in range(k):
+        m.addCons(sum(weights[j][i] * x[i] for i in range(n)) <= sum(weights[j]) // 3)
+    return x
+
+
+def solve(shift, release_gil, n=30):
+    m = Model()
+    m.hideOutput()
+    build_knapsacks(m, n=n, shift=shift)
+    m.optimize(release_gil=release_gil)
+    return m.getObjVal()
+
+
+class CountingProbe(Sepa):
+
+    def __init__(self):
+        self.ncalls = 0
+
+    def sepaexeclp(self):
+        self.ncalls += 1
+        return {"result": SCIP_RESULT.DIDNOTRUN}
+
+
+class BestBoundNodesel(Nodesel):
+    """Best-bound search in Python; nodecomp is called from SCIP's node queue."""
+
+    def __init__(self):
+        self.nselect = 0
+        self.ncomp = 0
+
+    def nodeselect(self):
+        self.nselect += 1
+        leaves, children, siblings = self.model.getOpenNodes()
+        nodes = leaves + children + siblings
+        if not nodes:
+            return {}
+        return {"selnode": min(nodes, key=lambda n: n.getLowerbound())}
+
+    def nodecomp(self, node1, node2):
+        self.ncomp += 1
+        lb1, lb2 = node1.getLowerbound(), node2.getLowerbound()
+        return -1 if lb1 < lb2 else (1 if lb1 > lb2 else 0)
+
+
+def test_concurrent_solves_match_serial():
+    shifts = list(range(8))
+    serial = [solve(s, release_gil=False) for s in shifts]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        threaded = list(pool.map(lambda s: solve(s, release_gil=True), shifts))
+    assert threaded == pytest.approx(serial)
+
+
+def test_release_gil_with_python_plugin():
+    def run(shift):
+        m = Model()
+        m.hideOutput()
+        m.setPresolve(SCIP_PARAMSETTING.OFF)
+        m.setHeuristics(SCIP_PARAMSETTING.OFF)
+        probe = CountingProbe()
+        m.includeSepa(probe, "countingprobe", "counts LP separation calls", priority=-100000, freq=1)
+        build_knapsacks(m, shift=shift)
+        m.optimize(release_gil=True)
+        return probe.ncalls, m.getObjVal()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(run, range(4)))
+    for shift, (ncalls, obj) in enumerate(results):
+        assert ncalls > 0
+        assert obj == pytest.approx(solve(shift, release_gil=False))
+
+
+def test_release_gil_with_python_nodesel():
+    def run(shift):
+        m = Model()
+        m.hideOutput()
+        m.setPresolve(SCIP_PARAMSETTING.OFF)
+        m.setHeuristics(SCIP_PARAMSETTING.OFF)
+        m.setSeparating(SCIP_PARAMSETTING.OFF)
+        nodesel = BestBoundNodesel()
+        m.includeNodesel(nodesel, "pybestbound", "best bound in Python", stdpriority=1000000, memsavepriority=1000000)
+        build_knapsacks(m, shift=shift)
+        m.optimize(release_gil=True)
+        return nodesel.nselect, nodesel.ncomp, m.getObjVal()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(run, range(4)))
+    assert any(ncomp > 0 for _, ncomp, _ in results)
+    for shift, (nselect, _, obj) in enumerate(results):
+        assert nselect > 0
+        assert obj == pytest.approx(solve(shift, release_gil=False))
+
+
+def test_release_gil_ignored_for_shared_copy():
+    src = Model()
+    src.hideOutput()
+    build_knapsacks(src)
+    assert src.isThreadsafe()
+
+    shared = Model(sourceModel=src, threadsafe=False)
+    shared.hideOutput()
+    assert not shared.isThreadsafe()
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        shared.optimize(release_gil=True)
+    assert any("thread-safe" in str(x.message) for x in w)
+
+    copied = Model(sourceModel=src, threadsafe=True)
+    assert copied.isThreadsafe()
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="needs at least two cores")
+def test_concurrent_solves_scale():
+    nthreads = min(4, os.cpu_count())
+    shifts = list(range(2 * nthreads))
+
+    def sweep(release_gil):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=nthreads) as pool:
+            list(pool.map(lambda s: solve(s, release_gil=release_gil, n=60), shifts))
+        return time.perf_counter() - start
+
+    held = sweep(False)
+    released = sweep(True)
+    # with the GIL held the sweep is effectively serial; leave plenty of slack for noisy machines
+    assert released < 0.9 * held
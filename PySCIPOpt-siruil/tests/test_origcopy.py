@@ -0,0 +1,45 @@
+from pyscipopt import Model, SCIP_PARAMSETTING
+
+
+def build_knapsacks(m, n=40, k=5):
+    weights = [[(7 * i + 13 * j) % 23 + 5 for i in range(n)] for j in range(k)]
+    values = [(11 * i) % 17 + 3 for i in range(n)]
+    x = [m.addVar("x%d" % i, vtype="B", obj=-values[i]) for i in range(n)]
+    for j in range(k):
+        m.addCons(sum(weights[j][i] * x[i] for i in range(n)) <= sum(weights[j]) // 3, name="c%d" % j)
+    return x
+
+
+def solve_stats(m):
+    m.hideOutput()
+    m.setHeuristics(SCIP_PARAMSETTING.OFF)
+    m.optimize()
+    return m.getObjVal(), m.getNNodes(), m.getNLPIterations()
+
+
+def test_origcopy_starts_as_subscip():
+    src = Model()
+    build_knapsacks(src)
+    copy = Model(sourceModel=src, origcopy=True)
+    assert src.getSubscipDepth() == 0
+    assert copy.getSubscipDepth() == 1
+    copy.setSubscipDepth(0)
+    assert copy.getSubscipDepth() == 0
+
+
+def test_reset_copy_solves_like_read_problem(tmp_path):
+    path = str(tmp_path / "knapsacks.lp")
+    writer = Model()
+    build_knapsacks(writer)
+    writer.writeProblem(path)
+
+    fresh = Model()
+    fresh.readProblem(path)
+
+    src = Model()
+    src.hideOutput()
+    src.readProblem(path)
+    copy = Model(sourceModel=src, origcopy=True, threadsafe=True)
+    copy.setSubscipDepth(0)
+
+    assert solve_stats(copy) == solve_stats(fresh)
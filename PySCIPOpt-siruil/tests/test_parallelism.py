@@ -0,0 +1,72 @@
+import numpy as np
+
+from pyscipopt import Model, Sepa, SCIP_RESULT, SCIP_PARAMSETTING
+
+
+class ParallelismProbe(Sepa):
+    """Compares getParallelismMatrix with pairwise getRowParallelism on the current LP rows and cuts."""
+
+    def __init__(self):
+        self.ncalls = 0
+
+    def sepaexeclp(self):
+        m = self.model
+        rows = m.getLPRowsData()
+        cuts = m.getCuts()
+
+        expected = np.array([[m.getRowParallelism(c, r) for r in rows] for c in cuts],
+                            dtype=np.float32).reshape(len(cuts), len(rows))
+        full = m.getParallelismMatrix(cuts, rows)
+        assert full.dtype == np.float32
+        assert full.shape == (len(cuts), len(rows))
+        assert np.allclose(full, expected, atol=1e-5)
+
+        sym = m.getParallelismMatrix(rows)
+        assert np.allclose(sym, sym.T)
+
+        iu = np.triu_indices(len(rows), k=1)
+        cond = m.getParallelismMatrix(rows, condensed=True)
+        assert cond.shape == (len(rows) * (len(rows) - 1) // 2,)
+        assert np.allclose(cond, sym[iu], atol=1e-6)
+
+        k = min(5, cond.shape[0])
+        ii, jj, vals = m.getParallelismMatrix(rows, topk=k)
+        assert len(vals) == k
+        assert np.all(ii < jj)
+        assert np.all(np.diff(vals) <= 0)
+        assert np.allclose(vals, sym[ii, jj], atol=1e-6)
+        if k > 0:
+            assert np.isclose(vals[0], cond.max(), atol=1e-6)
+
+        self.ncalls += 1
+        return {"result": SCIP_RESULT.DIDNOTRUN}
+
+
+def test_parallelism_matrix():
+    m = Model()
+    m.hideOutput()
+    m.setPresolve(SCIP_PARAMSETTING.OFF)
+    m.setHeuristics(SCIP_PARAMSETTING.OFF)
+    m.setIntParam("separating/maxroundsroot", 3)
+
+    probe = ParallelismProbe()
+    m.includeSepa(probe, "parallelismprobe", "checks getParallelismMatrix", priority=-100000, freq=1)
+
+    n, k = 25, 4
+    x = [m.addVar("x%d" % i, vtype="B", obj=-((11 * i) % 17 + 3)) for i in range(n)]
+    for j in range(k):
+        w = [(7 * i + 13 * j) % 23 + 5 for i in range(n)]
+        m.addCons(sum(w[i] * x[i] for i in range(n)) <= sum(w) // 3)
+    m.optimize()
+
+    assert probe.ncalls > 0
+
+
+def test_parallelism_matrix_requires_symmetric_for_condensed():
+    m = Model()
+    try:
+        m.getParallelismMatrix([], [], condensed=True)
+    except ValueError:
+        pass
+    else:
+        assert False, "expected ValueError"
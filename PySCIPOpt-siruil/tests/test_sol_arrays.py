@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from pyscipopt import Model, quicksum
+
+
+def small_model():
+    m = Model()
+    m.hideOutput()
+    x = [m.addVar("x%d" % i, vtype="B", obj=-(i % 5 + 1)) for i in range(8)]
+    y = m.addVar("slack_y", lb=None, ub=4.0, obj=1.0)
+    z = m.addVar("slack_z", vtype="I", lb=-2, obj=0.5)
+    m.addCons(quicksum((i + 2) * x[i] for i in range(8)) + y - z <= 12)
+    m.addCons(y + z >= -1)
+    return m, x, y, z
+
+
+def test_sol_vals_array():
+    m, x, y, z = small_model()
+    with pytest.raises(Warning):
+        m.getSolValsArray()
+    m.optimize()
+
+    vars = m.getVars()
+    vals = m.getSolValsArray()
+    assert vals.dtype == np.float64
+    assert vals.shape == (len(vars),)
+    assert np.allclose(vals, [m.getVal(v) for v in vars])
+
+    sub = m.getSolValsArray(vars=[z, x[3]])
+    assert np.allclose(sub, [m.getVal(z), m.getVal(x[3])])
+
+    sol = m.getSols()[-1]
+    assert np.allclose(m.getSolValsArray(sol), [m.getSolVal(sol, v) for v in vars])
+
+
+def test_var_attrs_array():
+    m, x, y, z = small_model()
+    vars = m.getVars()
+    attrs = m.getVarAttrsArray(('obj', 'lb', 'ub', 'vtype', 'index'))
+    assert np.allclose(attrs['obj'], [v.getObj() for v in vars])
+    assert attrs['lb'][len(x)] == -np.inf
+    assert attrs['ub'][len(x)] == 4.0
+    assert attrs['ub'][len(x) + 1] == np.inf
+    assert attrs['vtype'].dtype == np.int8
+    assert list(attrs['vtype']) == [0] * len(x) + [3, 1]
+    assert len(set(attrs['index'])) == len(vars)
+
+    with pytest.raises(ValueError):
+        m.getVarAttrsArray(('nope',))
+
+
+def test_var_indices_by_prefix():
+    m, x, y, z = small_model()
+    assert list(m.getVarIndicesByPrefix("slack_")) == [8, 9]
+    assert list(m.getVarIndicesByPrefix(("x1", "slack_z"))) == [1, 9]
+    assert len(m.getVarIndicesByPrefix("nothing")) == 0
@@ -0,0 +1,129 @@
+/* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * */
+/*                                                                           */
+/*                  This file is part of the program and library             */
+/*         SCIP --- Solving Constraint Integer Programs                      */
+/*                                                                           */
+/*    Copyright (C) 2002-2020 Konrad-Zuse-Zentrum                            */
+/*                            fuer Informationstechnik Berlin                */
+/*                                                                           */
+/*  SCIP is distributed under the terms of the ZIB Academic License.         */
+/*                                                                           */
+/*  You should have received a copy of the ZIB Academic License              */
+/*  along with SCIP; see the file COPYING. If not visit scipopt.org.         */
+/*                                                                           */
+/* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * */
+
+/**@file   cutsel.h
+ * @ingroup INTERNALAPI
+ * @brief  internal methods for cut selectors
+ */
+
+/*---+----1----+----2----+----3----+----4----+----5----+----6----+----7----+----8----+----9----+----0----+----1----+----2*/
+
+#ifndef __SCIP_CUTSEL_H__
+#define __SCIP_CUTSEL_H__
+
+
+#include "scip/def.h"
+#include "blockmemshell/memory.h"
+#include "scip/type_retcode.h"
+#include "scip/type_set.h"
+#include "scip/type_lp.h"
+#include "scip/type_cutsel.h"
+#include "scip/pub_cutsel.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/** creates a cut selector */
+SCIP_RETCODE SCIPcutselCreate(
+   SCIP_CUTSEL**         cutsel,             /**< pointer to store cut selector */
+   SCIP_SET*             set,                /**< global SCIP settings */
+   SCIP_MESSAGEHDLR*     messagehdlr,        /**< message handler */
+   BMS_BLKMEM*           blkmem,             /**< block memory for parameter settings */
+   const char*           name,               /**< name of cut selector */
+   const char*           desc,               /**< description of cut selector */
+   int                   priority,           /**< priority of the cut selector */
+   SCIP_DECL_CUTSELCOPY  ((*cutselcopy)),    /**< copy method of cut selector or NULL if you don't want to copy your plugin into sub-SCIPs */
+   SCIP_DECL_CUTSELFREE  ((*cutselfree)),    /**< destructor of cut selector */
+   SCIP_DECL_CUTSELINIT  ((*cutselinit)),    /**< initialize cut selector */
+   SCIP_DECL_CUTSELEXIT  ((*cutselexit)),    /**< deinitialize cut selector */
+   SCIP_DECL_CUTSELINITSOL((*cutselinitsol)),/**< solving process initialization method of cut selector */
+   SCIP_DECL_CUTSELEXITSOL((*cutselexitsol)),/**< solving process deinitialization method of cut selector */
+   SCIP_DECL_CUTSELSELECT((*cutselselect)),  /**< cut selection method */
+   SCIP_CUTSELDATA*      cutseldata          /**< cut selector data */
+   );
+
+/** copies the given cut selector to a new scip */
+SCIP_RETCODE SCIPcutselCopyInclude(
+   SCIP_CUTSEL*          cutsel,             /**< cut selector */
+   SCIP_SET*             set                 /**< SCIP_SET of SCIP to copy to */
+   );
+
+/** frees memory of cut selector */
+SCIP_RETCODE SCIPcutselFree(
+   SCIP_CUTSEL**         cutsel,             /**< pointer to cut selector data structure */
+   SCIP_SET*             set                 /**< global SCIP settings */
+   );
+
+/** initializes cut selector */
+SCIP_RETCODE SCIPcutselInit(
+   SCIP_CUTSEL*          cutsel,             /**< cut selector */
+   SCIP_SET*             set                 /**< global SCIP settings */
+   );
+
+/** deinitializes cut selector */
+SCIP_RETCODE SCIPcutselExit(
+   SCIP_CUTSEL*          cutsel,             /**< cut selector */
+   SCIP_SET*             set                 /**< global SCIP settings */
+   );
+
+/** informs cut selector that the branch and bound process is being started */
+SCIP_RETCODE SCIPcutselInitsol(
+   SCIP_CUTSEL*          cutsel,             /**< cut selector */
+   SCIP_SET*             set                 /**< global SCIP settings */
+   );
+
+/** informs cut selector that the branch and bound process is being freed */
+SCIP_RETCODE SCIPcutselExitsol(
+   SCIP_CUTSEL*          cutsel,             /**< cut selector */
+   SCIP_SET*             set                 /**< global SCIP settings */
+   );
+
+/** calls the cut selectors in priority order until one of them selects the cuts
+ *
+ *  The first nforcedcuts entries of cuts are forced and always selected, the remaining ones are candidates. On
+ *  success, the selected candidates are moved directly behind the forced cuts and nselectedcuts contains the number
+ *  of forced plus selected candidate cuts. If no cut selector succeeds, success is set to FALSE and the caller
+ *  should fall back to SCIPselectCuts().
+ */
+SCIP_RETCODE SCIPcutselsSelect(
+   SCIP_SET*             set,                /**< global SCIP settings */
+   SCIP_ROW**            cuts,               /**< forced cuts followed by the candidate cuts */
+   int                   ncuts,              /**< total number of cuts */
+   int                   nforcedcuts,        /**< number of forced cuts at the beginning of cuts */
+   SCIP_Bool             root,               /**< are we at the root node? */
+   int                   maxnselectedcuts,   /**< maximal number of cuts (forced ones included) to select */
+   int*                  nselectedcuts,      /**< pointer to store the number of selected cuts (forced ones included) */
+   SCIP_Bool*            success             /**< pointer to store whether a cut selector selected the cuts */
+   );
+
+/** sets priority of cut selector */
+void SCIPcutselSetPriority(
+   SCIP_CUTSEL*          cutsel,             /**< cut selector */
+   SCIP_SET*             set,                /**< global SCIP settings */
+   int                   priority            /**< new priority of the cut selector */
+   );
+
+/** enables or disables all clocks of \p cutsel, depending on the value of the flag */
+void SCIPcutselEnableOrDisableClocks(
+   SCIP_CUTSEL*          cutsel,             /**< the cut selector for which all clocks should be enabled or disabled */
+   SCIP_Bool             enable              /**< should the clocks of the cut selector be enabled? */
+   );
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
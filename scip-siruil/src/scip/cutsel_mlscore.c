@@ -0,0 +1,566 @@
+/* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * */
+/*                                                                           */
+/*                  This file is part of the program and library             */
+/*         SCIP --- Solving Constraint Integer Programs                      */
+/*                                                                           */
+/*    Copyright (C) 2002-2020 Konrad-Zuse-Zentrum                            */
+/*                            fuer Informationstechnik Berlin                */
+/*                                                                           */
+/*  SCIP is distributed under the terms of the ZIB Academic License.         */
+/*                                                                           */
+/*  You should have received a copy of the ZIB Academic License              */
+/*  along with SCIP; see the file COPYING. If not visit scipopt.org.         */
+/*                                                                           */
+/* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * */
+
+/**@file   cutsel_mlscore.c
+ * @ingroup DEFPLUGINS_CUTSEL
+ * @brief  cut selector scoring cuts with a linear model or a small MLP over eight cut features
+ *
+ * See cutsel_mlscore.h. The whole round (features, scores, ranking, reordering of the cuts) runs in C, so a
+ * learned selection costs no Python callback per separation round.
+ */
+
+/*---+----1----+----2----+----3----+----4----+----5----+----6----+----7----+----8----+----9----+----0----+----1----+----2*/
+
+#include "scip/cutsel_mlscore.h"
+#include "scip/pub_cutsel.h"
+#include "scip/pub_message.h"
+#include "scip/pub_misc_sort.h"
+#include "scip/scip_cut.h"
+#include "scip/scip_cutsel.h"
+#include "scip/scip_mem.h"
+#include "scip/scip_message.h"
+#include "scip/scip_numerics.h"
+#include "scip/scip_param.h"
+#include <string.h>
+
+
+#define CUTSEL_NAME              "mlscore"
+#define CUTSEL_DESC              "ranks cuts by a linear model or small MLP over eight cut features"
+#define CUTSEL_PRIORITY               10000
+
+#define NFEATURES                SCIP_CUTSEL_MLSCORE_NFEATURES
+#define FEAT_EFFICACY                     3  /**< position of the efficacy in the feature vector */
+
+/* default values for parameters */
+#define DEFAULT_TOPK                     10  /**< number of cuts to keep per round (if topfrac <= 0) */
+#define DEFAULT_TOPFRAC                -1.0  /**< fraction of the valid cuts to keep per round (<= 0: use topk) */
+#define DEFAULT_MINKEEP                   5  /**< minimal number of cuts kept when topfrac is used */
+#define DEFAULT_MINEFFICACY            1e-4  /**< cuts with smaller efficacy are never selected */
+#define DEFAULT_ROOTONLY               TRUE  /**< select only at the root node (default selection elsewhere)? */
+
+
+/** cut selector data */
+struct SCIP_CutselData
+{
+   SCIP_Real*            weights;            /**< concatenated row-major weight matrices */
+   SCIP_Real*            biases;             /**< concatenated bias vectors */
+   int*                  layersizes;         /**< nlayers+1 layer widths, input first */
+   int                   nlayers;            /**< number of layers */
+   int                   nweights;           /**< length of weights */
+   int                   nbiases;            /**< length of biases */
+   int                   maxwidth;           /**< largest layer width */
+   SCIP_Real             mu[NFEATURES];      /**< feature means */
+   SCIP_Real             invsd[NFEATURES];   /**< inverse feature standard deviations */
+   SCIP_Real             cliplo[NFEATURES];  /**< lower clipping bounds of the features */
+   SCIP_Real             cliphi[NFEATURES];  /**< upper clipping bounds of the features */
+   int                   topk;               /**< number of cuts to keep per round (if topfrac <= 0) */
+   SCIP_Real             topfrac;            /**< fraction of the valid cuts to keep per round (<= 0: use topk) */
+   int                   minkeep;            /**< minimal number of cuts kept when topfrac is used */
+   SCIP_Real             minefficacy;        /**< cuts with smaller efficacy are never selected */
+   SCIP_Bool             rootonly;           /**< select only at the root node? */
+   SCIP_Longint          nrounds;            /**< number of rounds the selector ran in */
+   SCIP_Longint          ncutsseen;          /**< number of candidate cuts seen */
+   SCIP_Longint          ncutsvalid;         /**< number of candidate cuts passing minefficacy */
+   SCIP_Longint          ncutskept;          /**< number of selected cuts */
+   SCIP_Longint          nroundsskipped;     /**< number of rounds left to the default selection */
+};
+
+
+/*
+ * Local methods
+ */
+
+/** frees the scoring network */
+static
+void freeModel(
+   SCIP*                 scip,               /**< SCIP data structure */
+   SCIP_CUTSELDATA*      cutseldata          /**< cut selector data */
+   )
+{
+   SCIPfreeBlockMemoryArrayNull(scip, &cutseldata->weights, cutseldata->nweights);
+   SCIPfreeBlockMemoryArrayNull(scip, &cutseldata->biases, cutseldata->nbiases);
+   SCIPfreeBlockMemoryArrayNull(scip, &cutseldata->layersizes, cutseldata->nlayers + 1);
+   cutseldata->nlayers = 0;
+   cutseldata->nweights = 0;
+   cutseldata->nbiases = 0;
+   cutseldata->maxwidth = 0;
+}
+
+/** replaces the scoring network */
+static
+SCIP_RETCODE setModel(
+   SCIP*                 scip,               /**< SCIP data structure */
+   SCIP_CUTSELDATA*      cutseldata,         /**< cut selector data */
+   int                   nlayers,            /**< number of layers */
+   const int*            layersizes,         /**< nlayers+1 layer widths, input first */
+   const SCIP_Real*      weights,            /**< concatenated row-major weight matrices */
+   const SCIP_Real*      biases              /**< concatenated bias vectors */
+   )
+{
+   int nweights;
+   int nbiases;
+   int maxwidth;
+   int l;
+
+   if( nlayers < 1 || layersizes[0] != NFEATURES || layersizes[nlayers] != 1 )
+   {
+      SCIPerrorMessage("cut selector <%s>: network must map %d features to 1 score\n", CUTSEL_NAME, NFEATURES);
+      return SCIP_INVALIDDATA;
+   }
+
+   nweights = 0;
+   nbiases = 0;
+   maxwidth = 0;
+   for( l = 0; l < nlayers; ++l )
+   {
+      if( layersizes[l+1] < 1 )
+      {
+         SCIPerrorMessage("cut selector <%s>: layer %d has no outputs\n", CUTSEL_NAME, l);
+         return SCIP_INVALIDDATA;
+      }
+      nweights += layersizes[l] * layersizes[l+1];
+      nbiases += layersizes[l+1];
+      maxwidth = MAX(maxwidth, layersizes[l+1]);
+   }
+
+   freeModel(scip, cutseldata);
+
+   SCIP_CALL( SCIPduplicateBlockMemoryArray(scip, &cutseldata->layersizes, layersizes, nlayers + 1) );
+   SCIP_CALL( SCIPduplicateBlockMemoryArray(scip, &cutseldata->weights, weights, nweights) );
+   SCIP_CALL( SCIPduplicateBlockMemoryArray(scip, &cutseldata->biases, biases, nbiases) );
+   cutseldata->nlayers = nlayers;
+   cutseldata->nweights = nweights;
+   cutseldata->nbiases = nbiases;
+   cutseldata->maxwidth = maxwidth;
+
+   return SCIP_OKAY;
+}
+
+/** sets the feature preprocessing; NULL arrays reset the respective default */
+static
+void setNormalization(
+   SCIP_CUTSELDATA*      cutseldata,         /**< cut selector data */
+   const SCIP_Real*      mu,                 /**< feature means, or NULL */
+   const SCIP_Real*      sd,                 /**< feature standard deviations, or NULL */
+   const SCIP_Real*      cliplo,             /**< lower clipping bounds, or NULL */
+   const SCIP_Real*      cliphi              /**< upper clipping bounds, or NULL */
+   )
+{
+   int i;
+
+   for( i = 0; i < NFEATURES; ++i )
+   {
+      cutseldata->mu[i] = mu != NULL ? mu[i] : 0.0;
+      /* same epsilon as the Python scorer, (x - mu) / (sd + 1e-8) */
+      cutseldata->invsd[i] = sd != NULL ? 1.0 / (sd[i] + 1e-8) : 1.0;
+      cutseldata->cliplo[i] = cliplo != NULL ? cliplo[i] : -SCIP_REAL_MAX;
+      cutseldata->cliphi[i] = cliphi != NULL ? cliphi[i] : SCIP_REAL_MAX;
+   }
+}
+
+/** installs the default heuristic: 0.4 eff/5 + 0.3 scipscore + 0.2 objparal + 0.1 intsupport, all clipped */
+static
+SCIP_RETCODE setDefaultModel(
+   SCIP*                 scip,               /**< SCIP data structure */
+   SCIP_CUTSELDATA*      cutseldata          /**< cut selector data */
+   )
+{  /*lint --e{747}*/
+   /* feature order: violation, relviolation, objparallelism, efficacy, scipscore, expimprov, supportscore, intsupport */
+   static const int layersizes[2] = { NFEATURES, 1 };
+   static const SCIP_Real weights[NFEATURES] = { 0.0, 0.0, 0.2, 0.4 / 5.0, 0.3, 0.0, 0.0, 0.1 };
+   static const SCIP_Real biases[1] = { 0.0 };
+   SCIP_Real cliplo[NFEATURES] = { -SCIP_REAL_MAX, -SCIP_REAL_MAX, 0.0, 0.0, 0.0, -SCIP_REAL_MAX, -SCIP_REAL_MAX, 0.0 };
+   SCIP_Real cliphi[NFEATURES] = { SCIP_REAL_MAX, SCIP_REAL_MAX, 1.0, 5.0, 1.0, SCIP_REAL_MAX, SCIP_REAL_MAX, 1.0 };
+
+   SCIP_CALL( setModel(scip, cutseldata, 1, layersizes, weights, biases) );
+   setNormalization(cutseldata, NULL, NULL, cliplo, cliphi);
+
+   return SCIP_OKAY;
+}
+
+/** returns value if it is finite, 0 otherwise (matches Model.getCutFeatureMatrix) */
+static
+SCIP_Real finiteOrZero(
+   SCIP*                 scip,               /**< SCIP data structure */
+   SCIP_Real             val                 /**< value */
+   )
+{
+   return (val == val && !SCIPisInfinity(scip, REALABS(val))) ? val : 0.0;
+}
+
+/** computes the features of a cut in the column order of Model.getCutFeatureMatrix */
+static
+void computeFeatures(
+   SCIP*                 scip,               /**< SCIP data structure */
+   SCIP_ROW*             cut,                /**< cut */
+   SCIP_Real*            feats               /**< array of length NFEATURES to store the features */
+   )
+{
+   feats[0] = finiteOrZero(scip, SCIPgetCutViolation(scip, cut));
+   feats[1] = finiteOrZero(scip, SCIPgetCutRelViolation(scip, cut));
+   feats[2] = finiteOrZero(scip, SCIPgetCutObjParallelism(scip, cut));
+   feats[3] = finiteOrZero(scip, SCIPgetCutEfficacy(scip, NULL, cut));
+   feats[4] = finiteOrZero(scip, SCIPgetCutSCIPScore(scip, cut));
+   feats[5] = finiteOrZero(scip, SCIPgetCutExpImprov(scip, cut));
+   feats[6] = finiteOrZero(scip, SCIPgetCutSupportScore(scip, cut));
+   feats[7] = finiteOrZero(scip, SCIPgetCutIntSupport(scip, cut));
+}
+
+/** evaluates the scoring network on one feature vector */
+static
+SCIP_Real scoreFeatures(
+   SCIP_CUTSELDATA*      cutseldata,         /**< cut selector data */
+   const SCIP_Real*      feats,              /**< raw features */
+   SCIP_Real*            input,              /**< buffer of length NFEATURES */
+   SCIP_Real*            buf1,               /**< buffer of length maxwidth */
+   SCIP_Real*            buf2                /**< buffer of length maxwidth */
+   )
+{
+   const SCIP_Real* in;
+   const SCIP_Real* w;
+   const SCIP_Real* b;
+   SCIP_Real* out;
+   int l;
+   int i;
+   int o;
+
+   for( i = 0; i < NFEATURES; ++i )
+   {
+      SCIP_Real x;
+
+      x = MIN(MAX(feats[i], cutseldata->cliplo[i]), cutseldata->cliphi[i]);
+      input[i] = (x - cutseldata->mu[i]) * cutseldata->invsd[i];
+   }
+
+   in = input;
+   out = buf1;
+   w = cutseldata->weights;
+   b = cutseldata->biases;
+   for( l = 0; l < cutseldata->nlayers; ++l )
+   {
+      int nin;
+      int nout;
+
+      nin = cutseldata->layersizes[l];
+      nout = cutseldata->layersizes[l+1];
+
+      for( o = 0; o < nout; ++o )
+      {
+         SCIP_Real s;
+
+         s = b[o];
+         for( i = 0; i < nin; ++i )
+            s += w[o * nin + i] * in[i];
+
+         /* ReLU on all hidden layers */
+         if( l < cutseldata->nlayers - 1 && s < 0.0 )
+            s = 0.0;
+         out[o] = s;
+      }
+
+      w += nin * nout;
+      b += nout;
+      in = out;
+      out = (out == buf1) ? buf2 : buf1;
+   }
+
+   return in[0];
+}
+
+/** gets the data of the included mlscore cut selector */
+static
+SCIP_RETCODE getCutselData(
+   SCIP*                 scip,               /**< SCIP data structure */
+   SCIP_CUTSELDATA**     cutseldata          /**< pointer to store the cut selector data */
+   )
+{
+   SCIP_CUTSEL* cutsel;
+
+   cutsel = SCIPfindCutsel(scip, CUTSEL_NAME);
+   if( cutsel == NULL )
+   {
+      SCIPerrorMessage("cut selector <%s> not included\n", CUTSEL_NAME);
+      return SCIP_PLUGINNOTFOUND;
+   }
+
+   *cutseldata = SCIPcutselGetData(cutsel);
+   assert(*cutseldata != NULL);
+
+   return SCIP_OKAY;
+}
+
+
+/*
+ * Callback methods of cut selector
+ */
+
+/** destructor of cut selector to free user data (called when SCIP is exiting) */
+static
+SCIP_DECL_CUTSELFREE(cutselFreeMlscore)
+{  /*lint --e{715}*/
+   SCIP_CUTSELDATA* cutseldata;
+
+   cutseldata = SCIPcutselGetData(cutsel);
+   assert(cutseldata != NULL);
+
+   freeModel(scip, cutseldata);
+   SCIPfreeBlockMemory(scip, &cutseldata);
+   SCIPcutselSetData(cutsel, NULL);
+
+   return SCIP_OKAY;
+}
+
+/** initialization method of cut selector (called after problem was transformed) */
+static
+SCIP_DECL_CUTSELINIT(cutselInitMlscore)
+{  /*lint --e{715}*/
+   SCIP_CUTSELDATA* cutseldata;
+
+   cutseldata = SCIPcutselGetData(cutsel);
+   assert(cutseldata != NULL);
+
+   cutseldata->nrounds = 0;
+   cutseldata->ncutsseen = 0;
+   cutseldata->ncutsvalid = 0;
+   cutseldata->ncutskept = 0;
+   cutseldata->nroundsskipped = 0;
+
+   return SCIP_OKAY;
+}
+
+/** cut selection method of cut selector */
+static
+SCIP_DECL_CUTSELSELECT(cutselSelectMlscore)
+{  /*lint --e{715}*/
+   SCIP_CUTSELDATA* cutseldata;
+   SCIP_ROW** sortedcuts;
+   SCIP_Real* scores;
+   SCIP_Real* feats;
+   SCIP_Real* input;
+   SCIP_Real* buf1;
+   SCIP_Real* buf2;
+   SCIP_Bool* taken;
+   int* inds;
+   int nvalid;
+   int nkeep;
+   int i;
+   int j;
+
+   assert(result != NULL);
+   assert(nselectedcuts != NULL);
+
+   cutseldata = SCIPcutselGetData(cutsel);
+   assert(cutseldata != NULL);
+   assert(cutseldata->nlayers >= 1);
+
+   *result = SCIP_DIDNOTFIND;
+   *nselectedcuts = 0;
+
+   if( cutseldata->rootonly && !root )
+      return SCIP_OKAY;
+
+   ++cutseldata->nrounds;
+   cutseldata->ncutsseen += ncuts;
+
+   if( ncuts == 0 )
+      return SCIP_OKAY;
+
+   SCIP_CALL( SCIPallocBufferArray(scip, &scores, ncuts) );
+   SCIP_CALL( SCIPallocBufferArray(scip, &inds, ncuts) );
+   SCIP_CALL( SCIPallocBufferArray(scip, &feats, NFEATURES) );
+   SCIP_CALL( SCIPallocBufferArray(scip, &input, NFEATURES) );
+   SCIP_CALL( SCIPallocBufferArray(scip, &buf1, cutseldata->maxwidth) );
+   SCIP_CALL( SCIPallocBufferArray(scip, &buf2, cutseldata->maxwidth) );
+
+   /* score the cuts passing the efficacy filter */
+   nvalid = 0;
+   for( i = 0; i < ncuts; ++i )
+   {
+      computeFeatures(scip, cuts[i], feats);
+      if( feats[FEAT_EFFICACY] < cutseldata->minefficacy )
+         continue;
+
+      scores[nvalid] = scoreFeatures(cutseldata, feats, input, buf1, buf2);
+      inds[nvalid] = i;
+      ++nvalid;
+   }
+   cutseldata->ncutsvalid += nvalid;
+
+   if( cutseldata->topfrac > 0.0 )
+      nkeep = MAX(cutseldata->minkeep, (int)(nvalid * cutseldata->topfrac));
+   else
+      nkeep = cutseldata->topk;
+   nkeep = MIN(nkeep, maxnselectedcuts);
+
+   /* nothing valid, or everything would be kept: leave the round to the default selection */
+   if( nvalid == 0 || nkeep >= nvalid )
+   {
+      if( nvalid > 0 )
+         ++cutseldata->nroundsskipped;
+   }
+   else
+   {
+      SCIPsortDownRealInt(scores, inds, nvalid);
+
+      SCIP_CALL( SCIPduplicateBufferArray(scip, &sortedcuts, cuts, ncuts) );
+      SCIP_CALL( SCIPallocClearBufferArray(scip, &taken, ncuts) );
+
+      /* selected cuts first, best first, then the others in their original order */
+      for( j = 0; j < nkeep; ++j )
+      {
+         cuts[j] = sortedcuts[inds[j]];
+         taken[inds[j]] = TRUE;
+      }
+      for( i = 0; i < ncuts; ++i )
+      {
+         if( !taken[i] )
+            cuts[j++] = sortedcuts[i];
+      }
+      assert(j == ncuts);
+
+      SCIPfreeBufferArray(scip, &taken);
+      SCIPfreeBufferArray(scip, &sortedcuts);
+
+      cutseldata->ncutskept += nkeep;
+      *nselectedcuts = nkeep;
+      *result = SCIP_SUCCESS;
+   }
+
+   SCIPfreeBufferArray(scip, &buf2);
+   SCIPfreeBufferArray(scip, &buf1);
+   SCIPfreeBufferArray(scip, &input);
+   SCIPfreeBufferArray(scip, &feats);
+   SCIPfreeBufferArray(scip, &inds);
+   SCIPfreeBufferArray(scip, &scores);
+
+   return SCIP_OKAY;
+}
+
+
+/*
+ * cut selector specific interface methods
+ */
+
+/** creates the mlscore cut selector and includes it in SCIP */
+SCIP_RETCODE SCIPincludeCutselMlscore(
+   SCIP*                 scip                /**< SCIP data structure */
+   )
+{
+   SCIP_CUTSELDATA* cutseldata;
+
+   SCIP_CALL( SCIPallocBlockMemory(scip, &cutseldata) );
+   BMSclearMemory(cutseldata);
+   SCIP_CALL( setDefaultModel(scip, cutseldata) );
+
+   SCIP_CALL( SCIPincludeCutsel(scip, CUTSEL_NAME, CUTSEL_DESC, CUTSEL_PRIORITY,
+         NULL, cutselFreeMlscore, cutselInitMlscore, NULL, NULL, NULL, cutselSelectMlscore, cutseldata) );
+
+   SCIP_CALL( SCIPaddIntParam(scip, "cutselection/" CUTSEL_NAME "/topk",
+         "number of cuts to keep per round (if topfrac <= 0)",
+         &cutseldata->topk, FALSE, DEFAULT_TOPK, 0, INT_MAX, NULL, NULL) );
+   SCIP_CALL( SCIPaddRealParam(scip, "cutselection/" CUTSEL_NAME "/topfrac",
+         "fraction of the valid cuts to keep per round (<= 0: use topk)",
+         &cutseldata->topfrac, FALSE, DEFAULT_TOPFRAC, -1.0, 1.0, NULL, NULL) );
+   SCIP_CALL( SCIPaddIntParam(scip, "cutselection/" CUTSEL_NAME "/minkeep",
+         "minimal number of cuts kept per round when topfrac is used",
+         &cutseldata->minkeep, FALSE, DEFAULT_MINKEEP, 0, INT_MAX, NULL, NULL) );
+   SCIP_CALL( SCIPaddRealParam(scip, "cutselection/" CUTSEL_NAME "/minefficacy",
+         "cuts with smaller efficacy are never selected",
+         &cutseldata->minefficacy, FALSE, DEFAULT_MINEFFICACY, 0.0, SCIP_REAL_MAX, NULL, NULL) );
+   SCIP_CALL( SCIPaddBoolParam(scip, "cutselection/" CUTSEL_NAME "/rootonly",
+         "select only at the root node (default selection elsewhere)?",
+         &cutseldata->rootonly, FALSE, DEFAULT_ROOTONLY, NULL, NULL) );
+
+   return SCIP_OKAY;
+}
+
+/** sets the scoring network of the mlscore cut selector */
+SCIP_RETCODE SCIPsetCutselMlscoreModel(
+   SCIP*                 scip,               /**< SCIP data structure */
+   int                   nlayers,            /**< number of layers (1: linear model) */
+   const int*            layersizes,         /**< nlayers+1 layer widths, input first */
+   const SCIP_Real*      weights,            /**< concatenated row-major weight matrices */
+   const SCIP_Real*      biases              /**< concatenated bias vectors */
+   )
+{
+   SCIP_CUTSELDATA* cutseldata;
+
+   assert(layersizes != NULL);
+   assert(weights != NULL);
+   assert(biases != NULL);
+
+   SCIP_CALL( getCutselData(scip, &cutseldata) );
+   SCIP_CALL( setModel(scip, cutseldata, nlayers, layersizes, weights, biases) );
+
+   return SCIP_OKAY;
+}
+
+/** sets the feature preprocessing of the mlscore cut selector */
+SCIP_RETCODE SCIPsetCutselMlscoreNormalization(
+   SCIP*                 scip,               /**< SCIP data structure */
+   const SCIP_Real*      mu,                 /**< feature means, or NULL */
+   const SCIP_Real*      sd,                 /**< feature standard deviations, or NULL */
+   const SCIP_Real*      cliplo,             /**< lower clipping bounds, or NULL */
+   const SCIP_Real*      cliphi              /**< upper clipping bounds, or NULL */
+   )
+{
+   SCIP_CUTSELDATA* cutseldata;
+
+   SCIP_CALL( getCutselData(scip, &cutseldata) );
+   setNormalization(cutseldata, mu, sd, cliplo, cliphi);
+
+   return SCIP_OKAY;
+}
+
+/** restores the default (heuristic) model of the mlscore cut selector */
+SCIP_RETCODE SCIPresetCutselMlscoreModel(
+   SCIP*                 scip                /**< SCIP data structure */
+   )
+{
+   SCIP_CUTSELDATA* cutseldata;
+
+   SCIP_CALL( getCutselData(scip, &cutseldata) );
+   SCIP_CALL( setDefaultModel(scip, cutseldata) );
+
+   return SCIP_OKAY;
+}
+
+/** gets the statistics of the mlscore cut selector */
+SCIP_RETCODE SCIPgetCutselMlscoreStatistics(
+   SCIP*                 scip,               /**< SCIP data structure */
+   SCIP_Longint*         nrounds,            /**< pointer to store the number of rounds it was called in, or NULL */
+   SCIP_Longint*         ncutsseen,          /**< pointer to store the number of candidate cuts seen, or NULL */
+   SCIP_Longint*         ncutsvalid,         /**< pointer to store the number of cuts passing minefficacy, or NULL */
+   SCIP_Longint*         ncutskept,          /**< pointer to store the number of selected cuts, or NULL */
+   SCIP_Longint*         nroundsskipped      /**< pointer to store the number of rounds left to the default, or NULL */
+   )
+{
+   SCIP_CUTSELDATA* cutseldata;
+
+   SCIP_CALL( getCutselData(scip, &cutseldata) );
+
+   if( nrounds != NULL )
+      *nrounds = cutseldata->nrounds;
+   if( ncutsseen != NULL )
+      *ncutsseen = cutseldata->ncutsseen;
+   if( ncutsvalid != NULL )
+      *ncutsvalid = cutseldata->ncutsvalid;
+   if( ncutskept != NULL )
+      *ncutskept = cutseldata->ncutskept;
+   if( nroundsskipped != NULL )
+      *nroundsskipped = cutseldata->nroundsskipped;
+
+   return SCIP_OKAY;
+}
@@ -0,0 +1,105 @@
+/* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * */
+/*                                                                           */
+/*                  This file is part of the program and library             */
+/*         SCIP --- Solving Constraint Integer Programs                      */
+/*                                                                           */
+/*    Copyright (C) 2002-2020 Konrad-Zuse-Zentrum                            */
+/*                            fuer Informationstechnik Berlin                */
+/*                                                                           */
+/*  SCIP is distributed under the terms of the ZIB Academic License.         */
+/*                                                                           */
+/*  You should have received a copy of the ZIB Academic License              */
+/*  along with SCIP; see the file COPYING. If not visit scipopt.org.         */
+/*                                                                           */
+/* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * */
+
+/**@file   cutsel_mlscore.h
+ * @ingroup CUTSELECTORS
+ * @brief  cut selector scoring cuts with a linear model or a small MLP over eight cut features
+ *
+ * For each candidate cut the features violation, relative violation, objective parallelism, efficacy, SCIP score,
+ * expected improvement, support score and integer support are computed (non-finite values become 0), clipped to
+ * per-feature bounds and normalized as (x - mu) / sd. A feed-forward network with ReLU hidden layers maps them to a
+ * score; a single layer is a linear model. The cuts with efficacy at least minefficacy are ranked by score and the
+ * best topk (or max(minkeep, topfrac * #valid)) are selected. Rounds in which all valid cuts would be kept are left
+ * to the next cut selector or SCIP's default selection.
+ *
+ * The default model is the linear heuristic
+ *    0.4 * clip(efficacy, 0, 5) / 5 + 0.3 * clip(scipscore, 0, 1) + 0.2 * clip(objparallelism, 0, 1)
+ *    + 0.1 * clip(intsupport, 0, 1).
+ *
+ * The selector is not part of the default plugins; include it with SCIPincludeCutselMlscore().
+ */
+
+/*---+----1----+----2----+----3----+----4----+----5----+----6----+----7----+----8----+----9----+----0----+----1----+----2*/
+
+#ifndef __SCIP_CUTSEL_MLSCORE_H__
+#define __SCIP_CUTSEL_MLSCORE_H__
+
+
+#include "scip/def.h"
+#include "scip/type_retcode.h"
+#include "scip/type_scip.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/** number of cut features the model reads */
+#define SCIP_CUTSEL_MLSCORE_NFEATURES 8
+
+/** creates the mlscore cut selector and includes it in SCIP */
+SCIP_EXPORT
+SCIP_RETCODE SCIPincludeCutselMlscore(
+   SCIP*                 scip                /**< SCIP data structure */
+   );
+
+/** sets the scoring network of the mlscore cut selector
+ *
+ *  Layer l maps layersizes[l] inputs to layersizes[l+1] outputs with the row-major weight matrix
+ *  (layersizes[l+1] x layersizes[l]) and bias vector stored consecutively in weights and biases; all but the last
+ *  layer are followed by a ReLU. layersizes[0] must be SCIP_CUTSEL_MLSCORE_NFEATURES and layersizes[nlayers] must be 1.
+ */
+SCIP_EXPORT
+SCIP_RETCODE SCIPsetCutselMlscoreModel(
+   SCIP*                 scip,               /**< SCIP data structure */
+   int                   nlayers,            /**< number of layers (1: linear model) */
+   const int*            layersizes,         /**< nlayers+1 layer widths, input first */
+   const SCIP_Real*      weights,            /**< concatenated row-major weight matrices */
+   const SCIP_Real*      biases              /**< concatenated bias vectors */
+   );
+
+/** sets the feature preprocessing of the mlscore cut selector; NULL arrays reset the respective default
+ *  (mu = 0, sd = 1, no clipping)
+ */
+SCIP_EXPORT
+SCIP_RETCODE SCIPsetCutselMlscoreNormalization(
+   SCIP*                 scip,               /**< SCIP data structure */
+   const SCIP_Real*      mu,                 /**< feature means, or NULL */
+   const SCIP_Real*      sd,                 /**< feature standard deviations, or NULL */
+   const SCIP_Real*      cliplo,             /**< lower clipping bounds, or NULL */
+   const SCIP_Real*      cliphi              /**< upper clipping bounds, or NULL */
+   );
+
+/** restores the default (heuristic) model of the mlscore cut selector */
+SCIP_EXPORT
+SCIP_RETCODE SCIPresetCutselMlscoreModel(
+   SCIP*                 scip                /**< SCIP data structure */
+   );
+
+/** gets the statistics of the mlscore cut selector */
+SCIP_EXPORT
+SCIP_RETCODE SCIPgetCutselMlscoreStatistics(
+   SCIP*                 scip,               /**< SCIP data structure */
+   SCIP_Longint*         nrounds,            /**< pointer to store the number of rounds it was called in, or NULL */
+   SCIP_Longint*         ncutsseen,          /**< pointer to store the number of candidate cuts seen, or NULL */
+   SCIP_Longint*         ncutsvalid,         /**< pointer to store the number of cuts passing minefficacy, or NULL */
+   SCIP_Longint*         ncutskept,          /**< pointer to store the number of selected cuts, or NULL */
+   SCIP_Longint*         nroundsskipped      /**< pointer to store the number of rounds left to the default, or NULL */
+   );
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
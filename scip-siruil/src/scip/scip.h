@@ -52,6 +52,7 @@
 #include "scip/type_branch.h"
 #include "scip/type_conflict.h"
 #include "scip/type_cons.h"
+#include "scip/type_cutsel.h"
 #include "scip/type_dialog.h"
 #include "scip/type_disp.h"
 #include "scip/type_heur.h"
@@ -80,6 +81,7 @@
 #include "scip/pub_conflict.h"
 #include "scip/pub_cons.h"
 #include "scip/pub_cutpool.h"
+#include "scip/pub_cutsel.h"
 #include "scip/pub_dcmp.h"
 #include "scip/pub_dialog.h"
 #include "scip/pub_disp.h"
@@ -124,6 +126,7 @@
 #include "scip/scip_cons.h"
 #include "scip/scip_copy.h"
 #include "scip/scip_cut.h"
+#include "scip/scip_cutsel.h"
 #include "scip/scip_datastructures.h"
 #include "scip/scip_debug.h"
 #include "scip/scip_dcmp.h"
@@ -2572,7 +2572,7 @@ void SCIPsetSubscipDepth(
    )
 {
    assert( scip != NULL );
-   assert( newdepth > 0 );
+   assert( newdepth >= 0 );
 
    SCIP_CALL_ABORT( SCIPcheckStage(scip, "SCIPsetSubscipDepth", FALSE, TRUE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE) );
 
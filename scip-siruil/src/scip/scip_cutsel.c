@@ -0,0 +1,118 @@
+/* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * */
+/*                                                                           */
+/*                  This file is part of the program and library             */
+/*         SCIP --- Solving Constraint Integer Programs                      */
+/*                                                                           */
+/*    Copyright (C) 2002-2020 Konrad-Zuse-Zentrum                            */
+/*                            fuer Informationstechnik Berlin                */
+/*                                                                           */
+/*  SCIP is distributed under the terms of the ZIB Academic License.         */
+/*                                                                           */
+/*  You should have received a copy of the ZIB Academic License              */
+/*  along with SCIP; see the file COPYING. If not visit scipopt.org.         */
+/*                                                                           */
+/* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * */
+
+/**@file   scip_cutsel.c
+ * @ingroup OTHER_CFILES
+ * @brief  public methods for cut selector plugins
+ */
+
+/*---+----1----+----2----+----3----+----4----+----5----+----6----+----7----+----8----+----9----+----0----+----1----+----2*/
+
+#include "scip/debug.h"
+#include "scip/cutsel.h"
+#include "scip/pub_message.h"
+#include "scip/scip_cutsel.h"
+#include "scip/set.h"
+#include "scip/struct_mem.h"
+#include "scip/struct_scip.h"
+#include "scip/struct_set.h"
+
+/** creates a cut selector and includes it in SCIP
+ *
+ *  Cut selectors are called after each separation round, in order of decreasing priority, until one of them selects
+ *  the cuts; if none does, the default selection (SCIPselectCuts()) is used.
+ */
+SCIP_RETCODE SCIPincludeCutsel(
+   SCIP*                 scip,               /**< SCIP data structure */
+   const char*           name,               /**< name of cut selector */
+   const char*           desc,               /**< description of cut selector */
+   int                   priority,           /**< priority of the cut selector */
+   SCIP_DECL_CUTSELCOPY  ((*cutselcopy)),    /**< copy method of cut selector or NULL if you don't want to copy your plugin into sub-SCIPs */
+   SCIP_DECL_CUTSELFREE  ((*cutselfree)),    /**< destructor of cut selector */
+   SCIP_DECL_CUTSELINIT  ((*cutselinit)),    /**< initialize cut selector */
+   SCIP_DECL_CUTSELEXIT  ((*cutselexit)),    /**< deinitialize cut selector */
+   SCIP_DECL_CUTSELINITSOL((*cutselinitsol)),/**< solving process initialization method of cut selector */
+   SCIP_DECL_CUTSELEXITSOL((*cutselexitsol)),/**< solving process deinitialization method of cut selector */
+   SCIP_DECL_CUTSELSELECT((*cutselselect)),  /**< cut selection method */
+   SCIP_CUTSELDATA*      cutseldata          /**< cut selector data */
+   )
+{
+   SCIP_CUTSEL* cutsel;
+
+   SCIP_CALL( SCIPcheckStage(scip, "SCIPincludeCutsel", TRUE, TRUE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE, FALSE) );
+
+   /* check whether cut selector is already present */
+   if( SCIPfindCutsel(scip, name) != NULL )
+   {
+      SCIPerrorMessage("cut selector <%s> already included.\n", name);
+      return SCIP_INVALIDDATA;
+   }
+
+   SCIP_CALL( SCIPcutselCreate(&cutsel, scip->set, scip->messagehdlr, scip->mem->setmem, name, desc, priority,
+         cutselcopy, cutselfree, cutselinit, cutselexit, cutselinitsol, cutselexitsol, cutselselect, cutseldata) );
+   SCIP_CALL( SCIPsetIncludeCutsel(scip->set, cutsel) );
+
+   return SCIP_OKAY;
+}
+
+/** returns the cut selector of the given name, or NULL if not existing */
+SCIP_CUTSEL* SCIPfindCutsel(
+   SCIP*                 scip,               /**< SCIP data structure */
+   const char*           name                /**< name of cut selector */
+   )
+{
+   assert(scip != NULL);
+   assert(scip->set != NULL);
+   assert(name != NULL);
+
+   return SCIPsetFindCutsel(scip->set, name);
+}
+
+/** returns the array of currently available cut selectors */
+SCIP_CUTSEL** SCIPgetCutsels(
+   SCIP*                 scip                /**< SCIP data structure */
+   )
+{
+   assert(scip != NULL);
+   assert(scip->set != NULL);
+
+   return scip->set->cutsels;
+}
+
+/** returns the number of currently available cut selectors */
+int SCIPgetNCutsels(
+   SCIP*                 scip                /**< SCIP data structure */
+   )
+{
+   assert(scip != NULL);
+   assert(scip->set != NULL);
+
+   return scip->set->ncutsels;
+}
+
+/** sets the priority of a cut selector */
+SCIP_RETCODE SCIPsetCutselPriority(
+   SCIP*                 scip,               /**< SCIP data structure */
+   SCIP_CUTSEL*          cutsel,             /**< cut selector */
+   int                   priority            /**< new priority of the cut selector */
+   )
+{
+   assert(scip != NULL);
+   assert(scip->set != NULL);
+
+   SCIPcutselSetPriority(cutsel, scip->set, priority);
+
+   return SCIP_OKAY;
+}
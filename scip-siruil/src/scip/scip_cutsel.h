@@ -0,0 +1,89 @@
+/* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * */
+/*                                                                           */
+/*                  This file is part of the program and library             */
+/*         SCIP --- Solving Constraint Integer Programs                      */
+/*                                                                           */
+/*    Copyright (C) 2002-2020 Konrad-Zuse-Zentrum                            */
+/*                            fuer Informationstechnik Berlin                */
+/*                                                                           */
+/*  SCIP is distributed under the terms of the ZIB Academic License.         */
+/*                                                                           */
+/*  You should have received a copy of the ZIB Academic License              */
+/*  along with SCIP; see the file COPYING. If not visit scipopt.org.         */
+/*                                                                           */
+/* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * */
+
+/**@file   scip_cutsel.h
+ * @ingroup PUBLICCOREAPI
+ * @brief  public methods for cut selector plugins
+ */
+
+/*---+----1----+----2----+----3----+----4----+----5----+----6----+----7----+----8----+----9----+----0----+----1----+----2*/
+
+#ifndef __SCIP_SCIP_CUTSEL_H__
+#define __SCIP_SCIP_CUTSEL_H__
+
+
+#include "scip/def.h"
+#include "scip/type_cutsel.h"
+#include "scip/type_result.h"
+#include "scip/type_retcode.h"
+#include "scip/type_scip.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/** creates a cut selector and includes it in SCIP
+ *
+ *  Cut selectors are called after each separation round, in order of decreasing priority, until one of them selects
+ *  the cuts; if none does, the default selection (SCIPselectCuts()) is used.
+ */
+SCIP_EXPORT
+SCIP_RETCODE SCIPincludeCutsel(
+   SCIP*                 scip,               /**< SCIP data structure */
+   const char*           name,               /**< name of cut selector */
+   const char*           desc,               /**< description of cut selector */
+   int                   priority,           /**< priority of the cut selector */
+   SCIP_DECL_CUTSELCOPY  ((*cutselcopy)),    /**< copy method of cut selector or NULL if you don't want to copy your plugin into sub-SCIPs */
+   SCIP_DECL_CUTSELFREE  ((*cutselfree)),    /**< destructor of cut selector */
+   SCIP_DECL_CUTSELINIT  ((*cutselinit)),    /**< initialize cut selector */
+   SCIP_DECL_CUTSELEXIT  ((*cutselexit)),    /**< deinitialize cut selector */
+   SCIP_DECL_CUTSELINITSOL((*cutselinitsol)),/**< solving process initialization method of cut selector */
+   SCIP_DECL_CUTSELEXITSOL((*cutselexitsol)),/**< solving process deinitialization method of cut selector */
+   SCIP_DECL_CUTSELSELECT((*cutselselect)),  /**< cut selection method */
+   SCIP_CUTSELDATA*      cutseldata          /**< cut selector data */
+   );
+
+/** returns the cut selector of the given name, or NULL if not existing */
+SCIP_EXPORT
+SCIP_CUTSEL* SCIPfindCutsel(
+   SCIP*                 scip,               /**< SCIP data structure */
+   const char*           name                /**< name of cut selector */
+   );
+
+/** returns the array of currently available cut selectors */
+SCIP_EXPORT
+SCIP_CUTSEL** SCIPgetCutsels(
+   SCIP*                 scip                /**< SCIP data structure */
+   );
+
+/** returns the number of currently available cut selectors */
+SCIP_EXPORT
+int SCIPgetNCutsels(
+   SCIP*                 scip                /**< SCIP data structure */
+   );
+
+/** sets the priority of a cut selector */
+SCIP_EXPORT
+SCIP_RETCODE SCIPsetCutselPriority(
+   SCIP*                 scip,               /**< SCIP data structure */
+   SCIP_CUTSEL*          cutsel,             /**< cut selector */
+   int                   priority            /**< new priority of the cut selector */
+   );
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -77,6 +77,7 @@
 #include "scip/cons_varbound.h"
 #include "scip/cons_xor.h"
 #include "scip/cons_components.h"
+#include "scip/cutsel_mlscore.h"
 #include "scip/disp_default.h"
 #include "scip/event_estim.h"
 #include "scip/event_solvingphase.h"
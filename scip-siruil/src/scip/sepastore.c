@@ -39,6 +39,7 @@
 #include "scip/debug.h"
 #include "scip/scip.h"
 #include "scip/cuts.h"
+#include "scip/cutsel.h"
 #include "scip/struct_event.h"
 #include "scip/struct_sepastore.h"
 #include "scip/misc.h"
@@ -887,6 +888,7 @@ SCIP_RETCODE SCIPsepastoreApplyCuts(
    int maxsepacuts;
    int ncutsapplied;
    int nselectedcuts;
+   SCIP_Bool cutselsuccess;
    int depth;
    int i;
 
@@ -931,14 +933,21 @@ SCIP_RETCODE SCIPsepastoreApplyCuts(
       // end mbp28;
    }
 
+   /* call the cut selector plugins; they reorder the non-forced cuts such that the selected ones come first */
+   SCIP_CALL( SCIPcutselsSelect(set, sepastore->cuts, sepastore->ncuts, sepastore->nforcedcuts, root, maxsepacuts,
+         &nselectedcuts, &cutselsuccess) );
+
    /* call cut selection algorithm */
    /* start mbp28, add more control by parameterizing function with goodscorefac and badscorefac */
    // SCIP_CALL( SCIPselectCuts(set->scip, sepastore->cuts, sepastore->randnumgen, 0.9, 0.0, goodmaxparall, maxparall,
    //       set->sepa_dircutoffdistfac, set->sepa_efficacyfac, set->sepa_objparalfac, set->sepa_intsupportfac, set->sepa_lookaheadfac, // added by mbp28
    //       sepastore->ncuts, sepastore->nforcedcuts, maxsepacuts, &nselectedcuts) );
-   SCIP_CALL( SCIPselectCuts(set->scip, sepastore->cuts, sepastore->randnumgen, set->sepa_goodscorefac, set->sepa_badscorefac, goodmaxparall, maxparall,
-         set->sepa_dircutoffdistfac, set->sepa_efficacyfac, set->sepa_objparalfac, set->sepa_intsupportfac, set->sepa_lookaheadfac, // added by mbp28
-         sepastore->ncuts, sepastore->nforcedcuts, maxsepacuts, &nselectedcuts) );
+   if( !cutselsuccess )
+   {
+      SCIP_CALL( SCIPselectCuts(set->scip, sepastore->cuts, sepastore->randnumgen, set->sepa_goodscorefac, set->sepa_badscorefac, goodmaxparall, maxparall,
+            set->sepa_dircutoffdistfac, set->sepa_efficacyfac, set->sepa_objparalfac, set->sepa_intsupportfac, set->sepa_lookaheadfac, // added by mbp28
+            sepastore->ncuts, sepastore->nforcedcuts, maxsepacuts, &nselectedcuts) );
+   }
    /* end mbp28 */
 
    /* apply all selected cuts */
@@ -52,6 +52,7 @@
 #include "scip/reader.h"
 #include "scip/relax.h"
 #include "scip/sepa.h"
+#include "scip/cutsel.h"
 #include "scip/table.h"
 #include "scip/prop.h"
 #include "scip/benders.h"
@@ -831,6 +832,9 @@ void SCIPsetEnableOrDisablePluginClocks(
    for( i = set->nsepas - 1; i >= 0; --i )
       SCIPsepaEnableOrDisableClocks(set->sepas[i], enabled);
 
+   for( i = set->ncutsels - 1; i >= 0; --i )
+      SCIPcutselEnableOrDisableClocks(set->cutsels[i], enabled);
+
    for( i = set->nprops - 1; i >= 0; --i )
       SCIPpropEnableOrDisableClocks(set->props[i], enabled);
 
@@ -978,6 +982,15 @@ SCIP_RETCODE SCIPsetCopyPlugins(
       }
    }
 
+   /* copy all cut selector plugins; they belong to the separation, so they follow copyseparators */
+   if( copyseparators && sourceset->cutsels != NULL )
+   {
+      for( p = sourceset->ncutsels - 1; p >= 0; --p )
+      {
+         SCIP_CALL( SCIPcutselCopyInclude(sourceset->cutsels[p], targetset) );
+      }
+   }
+
    /* copy all propagators plugins */
    if( copypropagators && sourceset->props != NULL )
    {
@@ -1150,6 +1163,10 @@ SCIP_RETCODE SCIPsetCreate(
    (*set)->sepassize = 0;
    (*set)->sepassorted = FALSE;
    (*set)->sepasnamesorted = FALSE;
+   (*set)->cutsels = NULL;
+   (*set)->ncutsels = 0;
+   (*set)->cutselssize = 0;
+   (*set)->cutselssorted = FALSE;
    (*set)->props = NULL;
    (*set)->props_presol = NULL;
    (*set)->nprops = 0;
@@ -2863,6 +2880,13 @@ SCIP_RETCODE SCIPsetFree(
    }
    BMSfreeMemoryArrayNull(&(*set)->sepas);
 
+   /* free cut selectors */
+   for( i = 0; i < (*set)->ncutsels; ++i )
+   {
+      SCIP_CALL( SCIPcutselFree(&(*set)->cutsels[i], *set) );
+   }
+   BMSfreeMemoryArrayNull(&(*set)->cutsels);
+
    /* free propagators */
    for( i = 0; i < (*set)->nprops; ++i )
    {
@@ -4309,6 +4333,64 @@ void SCIPsetSortSepasName(
    }
 }
 
+/** inserts cut selector in cut selector list */
+SCIP_RETCODE SCIPsetIncludeCutsel(
+   SCIP_SET*             set,                /**< global SCIP settings */
+   SCIP_CUTSEL*          cutsel              /**< cut selector */
+   )
+{
+   assert(set != NULL);
+   assert(cutsel != NULL);
+   assert(!SCIPcutselIsInitialized(cutsel));
+
+   if( set->ncutsels >= set->cutselssize )
+   {
+      set->cutselssize = SCIPsetCalcMemGrowSize(set, set->ncutsels+1);
+      SCIP_ALLOC( BMSreallocMemoryArray(&set->cutsels, set->cutselssize) );
+   }
+   assert(set->ncutsels < set->cutselssize);
+
+   set->cutsels[set->ncutsels] = cutsel;
+   set->ncutsels++;
+   set->cutselssorted = FALSE;
+
+   return SCIP_OKAY;
+}
+
+/** returns the cut selector of the given name, or NULL if not existing */
+SCIP_CUTSEL* SCIPsetFindCutsel(
+   SCIP_SET*             set,                /**< global SCIP settings */
+   const char*           name                /**< name of cut selector */
+   )
+{
+   int i;
+
+   assert(set != NULL);
+   assert(name != NULL);
+
+   for( i = 0; i < set->ncutsels; ++i )
+   {
+      if( strcmp(SCIPcutselGetName(set->cutsels[i]), name) == 0 )
+         return set->cutsels[i];
+   }
+
+   return NULL;
+}
+
+/** sorts cut selectors by priorities */
+void SCIPsetSortCutsels(
+   SCIP_SET*             set                 /**< global SCIP settings */
+   )
+{
+   assert(set != NULL);
+
+   if( !set->cutselssorted )
+   {
+      SCIPsortPtr((void**)set->cutsels, SCIPcutselComp, set->ncutsels);
+      set->cutselssorted = TRUE;
+   }
+}
+
 /** inserts propagator in propagator list */
 SCIP_RETCODE SCIPsetIncludeProp(
    SCIP_SET*             set,                /**< global SCIP settings */
@@ -5185,6 +5267,12 @@ SCIP_RETCODE SCIPsetInitPlugins(
       SCIP_CALL( SCIPsepaInit(set->sepas[i], set) );
    }
 
+   /* cut selectors */
+   for( i = 0; i < set->ncutsels; ++i )
+   {
+      SCIP_CALL( SCIPcutselInit(set->cutsels[i], set) );
+   }
+
    /* propagators */
    for( i = 0; i < set->nprops; ++i )
    {
@@ -5292,6 +5380,12 @@ SCIP_RETCODE SCIPsetExitPlugins(
       SCIP_CALL( SCIPsepaExit(set->sepas[i], set) );
    }
 
+   /* cut selectors */
+   for( i = 0; i < set->ncutsels; ++i )
+   {
+      SCIP_CALL( SCIPcutselExit(set->cutsels[i], set) );
+   }
+
    /* propagators */
    for( i = 0; i < set->nprops; ++i )
    {
@@ -5477,6 +5571,12 @@ SCIP_RETCODE SCIPsetInitsolPlugins(
       SCIP_CALL( SCIPsepaInitsol(set->sepas[i], set) );
    }
 
+   /* cut selectors */
+   for( i = 0; i < set->ncutsels; ++i )
+   {
+      SCIP_CALL( SCIPcutselInitsol(set->cutsels[i], set) );
+   }
+
    /* propagators */
    for( i = 0; i < set->nprops; ++i )
    {
@@ -5572,6 +5672,12 @@ SCIP_RETCODE SCIPsetExitsolPlugins(
       SCIP_CALL( SCIPsepaExitsol(set->sepas[i], set) );
    }
 
+   /* cut selectors */
+   for( i = 0; i < set->ncutsels; ++i )
+   {
+      SCIP_CALL( SCIPcutselExitsol(set->cutsels[i], set) );
+   }
+
    /* propagators */
    for( i = 0; i < set->nprops; ++i )
    {
@@ -46,6 +46,7 @@
 #include "scip/type_reader.h"
 #include "scip/type_relax.h"
 #include "scip/type_sepa.h"
+#include "scip/type_cutsel.h"
 #include "scip/type_table.h"
 #include "scip/type_prop.h"
 #include "nlpi/type_nlpi.h"
@@ -75,6 +76,7 @@ struct SCIP_Set
    SCIP_PRESOL**         presols;            /**< presolvers */
    SCIP_RELAX**          relaxs;             /**< relaxators */
    SCIP_SEPA**           sepas;              /**< separators */
+   SCIP_CUTSEL**         cutsels;            /**< cut selectors */
    SCIP_PROP**           props;              /**< propagators */
    SCIP_PROP**           props_presol;       /**< propagators (sorted by presol priority) */
    SCIP_HEUR**           heurs;              /**< primal heuristics */
@@ -109,6 +111,8 @@ struct SCIP_Set
    int                   relaxssize;         /**< size of relaxs array */
    int                   nsepas;             /**< number of separators */
    int                   sepassize;          /**< size of sepas array */
+   int                   ncutsels;           /**< number of cut selectors */
+   int                   cutselssize;        /**< size of cutsels array */
    int                   nprops;             /**< number of propagators */
    int                   propssize;          /**< size of props array */
    int                   nheurs;             /**< number of primal heuristics */
@@ -150,6 +154,7 @@ struct SCIP_Set
    SCIP_Bool             relaxsnamesorted;   /**< are the relaxators sorted by name? */
    SCIP_Bool             sepassorted;        /**< are the separators sorted by priority? */
    SCIP_Bool             sepasnamesorted;    /**< are the separators sorted by name? */
+   SCIP_Bool             cutselssorted;      /**< are the cut selectors sorted by priority? */
    SCIP_Bool             propssorted;        /**< are the propagators sorted by priority? */
    SCIP_Bool             propspresolsorted;  /**< are the propagators in prop_presol sorted? */
    SCIP_Bool             propsnamesorted;    /**< are the propagators sorted by name? */
@@ -0,0 +1,122 @@
+/* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * */
+/*                                                                           */
+/*                  This file is part of the program and library             */
+/*         SCIP --- Solving Constraint Integer Programs                      */
+/*                                                                           */
+/*    Copyright (C) 2002-2020 Konrad-Zuse-Zentrum                            */
+/*                            fuer Informationstechnik Berlin                */
+/*                                                                           */
+/*  SCIP is distributed under the terms of the ZIB Academic License.         */
+/*                                                                           */
+/*  You should have received a copy of the ZIB Academic License              */
+/*  along with SCIP; see the file COPYING. If not visit scipopt.org.         */
+/*                                                                           */
+/* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * */
+
+/**@file   type_cutsel.h
+ * @ingroup TYPEDEFINITIONS
+ * @brief  type definitions for cut selectors
+ *
+ * Cut selectors are called by SCIPsepastoreApplyCuts() after all separators of a round have added their cuts. They
+ * replace the default selection of SCIPselectCuts(). This is a reduced backport of the cut selector plugin type of
+ * SCIP 8.
+ */
+
+/*---+----1----+----2----+----3----+----4----+----5----+----6----+----7----+----8----+----9----+----0----+----1----+----2*/
+
+#ifndef __SCIP_TYPE_CUTSEL_H__
+#define __SCIP_TYPE_CUTSEL_H__
+
+#include "scip/def.h"
+#include "scip/type_retcode.h"
+#include "scip/type_result.h"
+#include "scip/type_lp.h"
+#include "scip/type_scip.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef struct SCIP_Cutsel SCIP_CUTSEL;           /**< cut selector */
+typedef struct SCIP_CutselData SCIP_CUTSELDATA;   /**< locally defined cut selector data */
+
+
+/** copy method for cut selector plugins (called when SCIP copies plugins)
+ *
+ *  input:
+ *  - scip            : SCIP main data structure
+ *  - cutsel          : the cut selector itself
+ */
+#define SCIP_DECL_CUTSELCOPY(x) SCIP_RETCODE x (SCIP* scip, SCIP_CUTSEL* cutsel)
+
+/** destructor of cut selector to free user data (called when SCIP is exiting)
+ *
+ *  input:
+ *  - scip            : SCIP main data structure
+ *  - cutsel          : the cut selector itself
+ */
+#define SCIP_DECL_CUTSELFREE(x) SCIP_RETCODE x (SCIP* scip, SCIP_CUTSEL* cutsel)
+
+/** initialization method of cut selector (called after problem was transformed)
+ *
+ *  input:
+ *  - scip            : SCIP main data structure
+ *  - cutsel          : the cut selector itself
+ */
+#define SCIP_DECL_CUTSELINIT(x) SCIP_RETCODE x (SCIP* scip, SCIP_CUTSEL* cutsel)
+
+/** deinitialization method of cut selector (called before transformed problem is freed)
+ *
+ *  input:
+ *  - scip            : SCIP main data structure
+ *  - cutsel          : the cut selector itself
+ */
+#define SCIP_DECL_CUTSELEXIT(x) SCIP_RETCODE x (SCIP* scip, SCIP_CUTSEL* cutsel)
+
+/** solving process initialization method of cut selector (called when branch and bound process is about to begin)
+ *
+ *  input:
+ *  - scip            : SCIP main data structure
+ *  - cutsel          : the cut selector itself
+ */
+#define SCIP_DECL_CUTSELINITSOL(x) SCIP_RETCODE x (SCIP* scip, SCIP_CUTSEL* cutsel)
+
+/** solving process deinitialization method of cut selector (called before branch and bound process data is freed)
+ *
+ *  input:
+ *  - scip            : SCIP main data structure
+ *  - cutsel          : the cut selector itself
+ */
+#define SCIP_DECL_CUTSELEXITSOL(x) SCIP_RETCODE x (SCIP* scip, SCIP_CUTSEL* cutsel)
+
+/** cut selection method of cut selector
+ *
+ *  The method reorders the candidate cuts such that the selected cuts come first and stores their number in
+ *  nselectedcuts. Forced cuts (e.g. the ones forced by SCIPoverrideCutSelection()) are always applied and are only
+ *  passed for information, e.g. to compute parallelism with them.
+ *
+ *  input:
+ *  - scip            : SCIP main data structure
+ *  - cutsel          : the cut selector itself
+ *  - cuts            : array of candidate cuts, to be reordered such that the selected cuts come first
+ *  - ncuts           : number of candidate cuts
+ *  - forcedcuts      : array of forced cuts
+ *  - nforcedcuts     : number of forced cuts
+ *  - root            : are we at the root node?
+ *  - maxnselectedcuts: maximal number of candidate cuts to select
+ *  - nselectedcuts   : pointer to store the number of selected candidate cuts
+ *  - result          : pointer to store the result of the cut selection call
+ *
+ *  possible return values for *result (if more than one applies, the first in the list should be used):
+ *  - SCIP_SUCCESS    : the cut selection succeeded
+ *  - SCIP_DIDNOTFIND : the cut selection did not succeed; the next cut selector (or the default selection) is used
+ */
+#define SCIP_DECL_CUTSELSELECT(x) SCIP_RETCODE x (SCIP* scip, SCIP_CUTSEL* cutsel, SCIP_ROW** cuts, int ncuts, \
+      SCIP_ROW** forcedcuts, int nforcedcuts, SCIP_Bool root, int maxnselectedcuts, int* nselectedcuts, \
+      SCIP_RESULT* result)
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -8,78 +8,179 @@ based on measured solve times in results.jsonl.
 We define delta(s,x) relative to baseline config (default: "all_on"):
     delta = (t_base - t_s) / t_base
 
+Runs with status "capped" (collect_uc_times.py --adaptive-cap) are
+right-censored: the config would have needed at least solve_time_sec. By
+default (--censored limit) their time is imputed as the full time_limit, like
+an uncapped run that timed out, so a capped config gets no credit on that
+instance; --censored cap uses the censoring time instead (an upper bound on
+delta).
+
+Selection is greedy on mean_i max(0, max_{s in A} delta(s,i)). Being
+submodular, it is evaluated lazily (CELF) on a NumPy matrix, so large config
+spaces (e.g. race_configs.py over 2^8 configs) stay cheap; --workers spreads
+the candidate evaluations over threads, and --stream builds the matrix in one
+pass over results.jsonl instead of a pandas pivot.
+
 Outputs:
   outputs_step4_restrict_space/A.json
   outputs_step4_restrict_space/delta_matrix.csv
+  outputs_step4_restrict_space/censored_matrix.csv  (only with capped runs)
   outputs_step4_restrict_space/summary.json
 """
 
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+from results_store import iter_results, load_results
 
-def greedy_select(delta_df: pd.DataFrame, candidates: list[str], max_k: int) -> tuple[list[str], list[float]]:
-    """
-    delta_df: index=instance_name, columns=config_name, values=delta
-    candidates: candidate config names
-    """
-    A: list[str] = []
-    curve: list[float] = []
+STREAM_COLUMNS = ["instance_name", "config_name", "solve_time_sec", "status", "time_limit"]
 
-    current_best = pd.Series(0.0, index=delta_df.index)  # best delta so far per instance
-    for _ in range(max_k):
-        best_c = None
-        best_perf = None
-        best_new_best = None
 
-        for c in candidates:
-            new_best = np.maximum(current_best.values, delta_df[c].values)
-            perf = float(np.mean(new_best))
-            if (best_perf is None) or (perf > best_perf + 1e-12):
-                best_perf = perf
-                best_c = c
-                best_new_best = new_best
+def _gains(D: np.ndarray, current_best: np.ndarray, cols: np.ndarray, workers: int = 1,
+           block: int = 256) -> np.ndarray:
+    """
+    Marginal gain mean(max(current_best, D[:, c])) - mean(current_best) of
+    every column c in cols, computed in column blocks (over `workers` threads;
+    NumPy releases the GIL inside the block reductions).
+    """
+    def run(part: np.ndarray) -> np.ndarray:
+        return np.maximum(D[:, part] - current_best[:, None], 0.0).mean(axis=0)
 
-        if best_c is None:
-            break
+    parts = [cols[i:i + block] for i in range(0, len(cols), block)]
+    if workers <= 1 or len(parts) <= 1:
+        return np.concatenate([run(p) for p in parts]) if parts else np.zeros(0)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return np.concatenate(list(pool.map(run, parts)))
 
-        A.append(best_c)
-        curve.append(float(best_perf))
-        candidates = [c for c in candidates if c != best_c]
-        current_best = pd.Series(best_new_best, index=delta_df.index)
 
-        if not candidates:
-            break
+def greedy_select_matrix(D: np.ndarray, max_k: int, lazy: bool = True,
+                         workers: int = 1) -> tuple[list[int], list[float]]:
+    """
+    Greedy maximization of mean_i max(0, max_{c in A} D[i, c]) over column
+    subsets A of size <= max_k. Returns the chosen column indices and the
+    objective after each pick.
+
+    The objective is monotone submodular, so a candidate's gain can only
+    shrink as A grows: with lazy=True (CELF) stale gains are kept in a heap as
+    upper bounds and only the top one is recomputed, which usually touches a
+    handful of columns per pick instead of all of them. Ties go to the lower
+    column index, as in the plain loop. NaN entries (missing runs) never
+    improve an instance.
+    """
+    D = np.asfortranarray(np.nan_to_num(np.asarray(D, dtype=np.float64), nan=-np.inf))
+    n_inst, n_cols = D.shape
+    current_best = np.zeros(n_inst)
+    A: list[int] = []
+    curve: list[float] = []
+    if n_inst == 0 or n_cols == 0:
+        return A, curve
+
+    all_cols = np.arange(n_cols)
+    if lazy:
+        gains = _gains(D, current_best, all_cols, workers=workers)
+        heap = [(-float(g), int(c), 0) for c, g in enumerate(gains)]
+        heapq.heapify(heap)
+        while heap and len(A) < max_k:
+            neg_gain, c, stamp = heapq.heappop(heap)
+            if stamp != len(A):
+                gain = float(np.maximum(D[:, c] - current_best, 0.0).mean())
+                heapq.heappush(heap, (-gain, c, len(A)))
+                continue
+            np.maximum(current_best, D[:, c], out=current_best)
+            A.append(c)
+            curve.append(float(current_best.mean()))
+    else:
+        remaining = all_cols
+        while len(remaining) and len(A) < max_k:
+            gains = _gains(D, current_best, remaining, workers=workers)
+            c = int(remaining[int(np.argmax(gains))])
+            np.maximum(current_best, D[:, c], out=current_best)
+            A.append(c)
+            curve.append(float(current_best.mean()))
+            remaining = remaining[remaining != c]
 
     return A, curve
 
 
-def main():
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--results-jsonl", required=True, help="Path to results.jsonl")
-    ap.add_argument("--out-dir", default="outputs_step4_restrict_space", help="Output folder")
-    ap.add_argument("--baseline", default="all_on", help="Baseline config_name")
-    ap.add_argument("--min-avg-delta", type=float, default=0.0, help="Filter configs with avg delta < threshold")
-    ap.add_argument("--max-A", type=int, default=5, help="Max size of A")
-    args = ap.parse_args()
+def greedy_select(delta_df: pd.DataFrame, candidates: list[str], max_k: int,
+                  lazy: bool = True, workers: int = 1) -> tuple[list[str], list[float]]:
+    """
+    delta_df: index=instance_name, columns=config_name, values=delta
+    candidates: candidate config names
+    """
+    idx, curve = greedy_select_matrix(delta_df[candidates].to_numpy(dtype=np.float64), max_k,
+                                      lazy=lazy, workers=workers)
+    return [candidates[i] for i in idx], curve
 
-    out_dir = Path(args.out_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
 
-    # Load results.jsonl
-    records = []
-    with open(args.results_jsonl, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                records.append(json.loads(line))
-    df = pd.DataFrame(records)
+def stream_delta_matrix(results_jsonl: str, baseline: str,
+                        censored: str = "limit") -> tuple[list[str], list[str], np.ndarray, np.ndarray]:
+    """
+    Build the instance x config delta matrix in one pass over the results
+    (a store only reads the columns it needs), without a DataFrame or pivot:
+    rows are reduced to index/time arrays and scattered into dense matrices. Duplicate (instance, config) runs are
+    averaged, instances without a baseline run are dropped and missing cells
+    are NaN, as in the pandas path.
+
+    Returns (instances, configs, delta, censored_mask), names sorted.
+    """
+    inst_ids: dict[str, int] = {}
+    cfg_ids: dict[str, int] = {}
+    ii: list[int] = []
+    jj: list[int] = []
+    tt: list[float] = []
+    cc: list[bool] = []
+    for r in iter_results(results_jsonl, columns=STREAM_COLUMNS):
+        t = float("nan") if r.get("solve_time_sec") is None else float(r["solve_time_sec"])
+        cens = r.get("status") == "capped"
+        if cens and censored == "limit":
+            if r.get("time_limit") is None:
+                raise ValueError("capped rows need a time_limit column to impute their time")
+            t = max(t, float(r["time_limit"]))
+        ii.append(inst_ids.setdefault(r["instance_name"], len(inst_ids)))
+        jj.append(cfg_ids.setdefault(r["config_name"], len(cfg_ids)))
+        tt.append(t)
+        cc.append(cens)
+
+    if baseline not in cfg_ids:
+        raise ValueError(f"no runs of baseline config {baseline!r} in {results_jsonl}")
+
+    shape = (len(inst_ids), len(cfg_ids))
+    i = np.asarray(ii, dtype=np.int64)
+    j = np.asarray(jj, dtype=np.int64)
+    tsum = np.zeros(shape)
+    count = np.zeros(shape)
+    cens_mat = np.zeros(shape, dtype=bool)
+    np.add.at(tsum, (i, j), np.asarray(tt, dtype=np.float64))
+    np.add.at(count, (i, j), 1.0)
+    cens_mat[i[np.asarray(cc, dtype=bool)], j[np.asarray(cc, dtype=bool)]] = True
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        times = tsum / count
+    base = times[:, cfg_ids[baseline]]
+    keep = ~np.isnan(base)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        delta = (base[:, None] - times) / base[:, None]
+
+    inst_order = sorted((n for n, k in inst_ids.items() if keep[k]))
+    cfg_order = sorted(cfg_ids)
+    rows = np.array([inst_ids[n] for n in inst_order], dtype=np.int64)
+    cols = np.array([cfg_ids[n] for n in cfg_order], dtype=np.int64)
+    return inst_order, cfg_order, delta[np.ix_(rows, cols)], cens_mat[np.ix_(rows, cols)]
+
+
+def pivot_delta_matrix(results_jsonl: str, baseline: str,
+                       censored: str = "limit") -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Delta matrix and censored mask (instance x config) via pandas."""
+    df = load_results(results_jsonl)
 
     # Expect these columns (from your collector)
     required = {"instance_name", "config_name", "solve_time_sec"}
@@ -87,8 +188,19 @@ def main():
     if missing:
         raise ValueError(f"results.jsonl missing columns: {missing}. Found: {list(df.columns)}")
 
+    # Capped runs are right-censored, not exact times
+    if "status" in df.columns:
+        df["censored"] = df["status"] == "capped"
+    else:
+        df["censored"] = False
+    if censored == "limit" and df["censored"].any():
+        if "time_limit" not in df.columns:
+            raise ValueError("capped rows need a time_limit column to impute their time")
+        cens = df["censored"]
+        df.loc[cens, "solve_time_sec"] = df.loc[cens, ["solve_time_sec", "time_limit"]].astype(float).max(axis=1)
+
     # Build baseline time per instance
-    base = df[df["config_name"] == args.baseline].set_index("instance_name")["solve_time_sec"]
+    base = df[df["config_name"] == baseline].set_index("instance_name")["solve_time_sec"]
     if base.index.nunique() != df["instance_name"].nunique():
         # Some instances missing baseline; restrict to intersection
         common = sorted(set(df["instance_name"].unique()).intersection(set(base.index)))
@@ -106,6 +218,43 @@ def main():
         aggfunc="mean",
     )
 
+    censored_mat = df.assign(censored=df["censored"].astype(int)).pivot_table(
+        index="instance_name",
+        columns="config_name",
+        values="censored",
+        aggfunc="max",
+    ).reindex_like(delta_mat).fillna(0).astype(bool)
+
+    return delta_mat, censored_mat
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--results-jsonl", required=True, help="Path to results.jsonl (or results.sqlite)")
+    ap.add_argument("--out-dir", default="outputs_step4_restrict_space", help="Output folder")
+    ap.add_argument("--baseline", default="all_on", help="Baseline config_name")
+    ap.add_argument("--min-avg-delta", type=float, default=0.0, help="Filter configs with avg delta < threshold")
+    ap.add_argument("--max-A", type=int, default=5, help="Max size of A")
+    ap.add_argument("--censored", choices=["limit", "cap"], default="limit",
+                    help="Time imputed for capped (right-censored) runs: full time_limit or the cap")
+    ap.add_argument("--stream", action="store_true",
+                    help="Build the delta matrix in one pass over results.jsonl instead of a pandas pivot")
+    ap.add_argument("--no-lazy", action="store_true",
+                    help="Re-evaluate every candidate at each greedy step instead of lazily (CELF)")
+    ap.add_argument("--workers", type=int, default=1, help="Threads evaluating candidate blocks")
+    args = ap.parse_args()
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if args.stream:
+        instances, configs, delta, censored = stream_delta_matrix(args.results_jsonl, args.baseline, args.censored)
+        delta_mat = pd.DataFrame(delta, index=pd.Index(instances, name="instance_name"),
+                                 columns=pd.Index(configs, name="config_name"))
+        censored_mat = pd.DataFrame(censored, index=delta_mat.index, columns=delta_mat.columns)
+    else:
+        delta_mat, censored_mat = pivot_delta_matrix(args.results_jsonl, args.baseline, args.censored)
+
     # Config statistics
     avg_delta = delta_mat.mean(axis=0).sort_values(ascending=False)
 
@@ -116,11 +265,14 @@ def main():
         raise RuntimeError("No configs survived filtering; lower --min-avg-delta.")
 
     # Greedy select A
-    A, curve = greedy_select(delta_mat, candidates=candidates, max_k=args.max_A)
+    A, curve = greedy_select(delta_mat, candidates=candidates, max_k=args.max_A,
+                             lazy=not args.no_lazy, workers=args.workers)
 
     # Save outputs
     delta_csv = out_dir / "delta_matrix.csv"
     delta_mat.to_csv(delta_csv)
+    if censored_mat.values.any():
+        censored_mat.to_csv(out_dir / "censored_matrix.csv")
 
     A_path = out_dir / "A.json"
     with open(A_path, "w") as f:
@@ -139,6 +291,8 @@ def main():
         "n_instances": int(delta_mat.shape[0]),
         "configs_all": list(delta_mat.columns),
         "avg_delta": {k: float(v) for k, v in avg_delta.to_dict().items()},
+        "censored_policy": args.censored,
+        "n_censored": {k: int(v) for k, v in censored_mat.sum(axis=0).to_dict().items() if v},
         "A": A,
         "greedy_curve_mean_best_delta": curve,
         "mean_best_delta_A": float(delta_mat[A].max(axis=1).mean()) if A else 0.0,
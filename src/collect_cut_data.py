@@ -42,7 +42,7 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 from pyscipopt import Model, Sepa, SCIP_RESULT
 
-from cut_quality_sepa import CUT_FEATURE_NAMES, N_CUT_FEATURES, _extract_cut_features
+from cut_quality_sepa import CUT_FEATURE_NAMES, N_CUT_FEATURES
 
 
 class CutDataCollector(Sepa):
@@ -81,7 +81,7 @@ class CutDataCollector(Sepa):
             return {"result": SCIP_RESULT.DIDNOTRUN}
 
         # Extract features for each cut
-        feats = np.stack([_extract_cut_features(c, model) for c in cuts], axis=0)
+        feats = model.getCutFeatureMatrix(cuts)
 
         # Lookahead labels: LP improvement from adding each cut
         labels = np.zeros(len(cuts), dtype=np.float32)
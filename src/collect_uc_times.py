@@ -8,8 +8,9 @@ and record reward = solve_time_sec.
 Writes:
   experiments/step3_collect_time/
     configs.json
-    results.csv
-    results.jsonl
+    results.sqlite   (results_store.py; the record runs are appended to)
+    results.csv      (exported from results.sqlite at the end of a run)
+    results.jsonl    (same)
 
 Usage:
   python src/collect_uc_times.py \
@@ -17,21 +18,48 @@ Usage:
     --outdir experiments/step3_collect_time \
     --time-limit 300 \
     --seed 0
+
+Parallel / resumable:
+  --workers N fans the (instance, config) grid out over N processes, each
+  running one SCIP solve with --threads-per-solve LP threads. Rows are
+  appended to results.sqlite as runs finish (so row order is completion
+  order), and pairs already in it are skipped unless --no-resume is given.
+  An outdir with only a results.jsonl from older runs is imported first.
+  --thread-pool runs the N workers as threads of one process instead; SCIP
+  releases the GIL while solving, and the parsed-instance cache is shared by
+  all workers rather than rebuilt in each process.
+
+Adaptive capping:
+  --adaptive-cap first runs the first --cap-first-k configs of CONFIGS on
+  every instance. The remaining configs of an instance then get
+  min(time_limit, --cap-factor * best_time + --cap-slack) seconds, where
+  best_time is the fastest solved run (optimal/infeasible) so far. A run that
+  hits such a reduced limit is recorded with status "capped": its time is
+  right-censored at cap_sec (jsonl only; time_limit keeps the full limit).
+
+Solve cache:
+  Every solve is also recorded in the shared solve cache (solve_cache.py,
+  --solve-cache DIR), which the evaluation scripts consult for the same
+  instance/config/parameters. With --no-resume, pairs are re-run from the
+  cache unless --force-resolve is given as well; rows served from the cache
+  carry "cached": true in results.jsonl.
 """
 
 from __future__ import annotations
 
 import argparse
-import csv
 import json
-import os
-import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from pyscipopt import Model
 
+from instance_cache import load_model
+from results_store import ResultsStore
+from solve_cache import SolveCache, add_solve_cache_args, measure_solve, solve_cache_from_args
+from utils import multiprocess_unordered
+
 
 # -----------------------------
 # Config definitions
@@ -215,13 +243,18 @@ def run_one(lp_path: str,
             node_limit: Optional[int],
             maxroundsroot: int,
             maxrounds: int,
-            hide_output: bool = True) -> Dict[str, Any]:
+            hide_output: bool = True,
+            threads: Optional[int] = None,
+            cache: Optional[SolveCache] = None) -> Dict[str, Any]:
     """
     Solve one instance under one config; return metrics including solve time.
+    threads, if given, sets lp/threads for this solve.
+    cache, if given, is consulted first and records the result.
     """
-    m = Model()
-    if hide_output:
-        m.hideOutput(True)
+    m = load_model(lp_path, hide_output=hide_output)
+
+    if threads is not None:
+        m.setIntParam("lp/threads", int(threads))
 
     # Basic limits
     m.setRealParam("limits/time", float(time_limit))
@@ -240,41 +273,86 @@ def run_one(lp_path: str,
     # Apply config
     set_sepa_freqs(m, sepa_freq)
 
-    # Load and solve
-    m.readProblem(lp_path)
-
-    t0 = time.time()
-    m.optimize()
-    wall = time.time() - t0
-
-    # Metrics
-    out: Dict[str, Any] = {
-        "solve_time_sec": float(getattr(m, "getSolvingTime", lambda: wall)()),
-        "wall_time_sec": float(wall),
-    }
-
-    # Status / objective / nodes if available
-    try:
-        out["status"] = str(m.getStatus())
-    except Exception:
-        out["status"] = None
+    if cache is not None:
+        return cache.solve(m, lp_path, measure_solve)
+    return measure_solve(m)
+
+
+FIELDNAMES = [
+    "instance_name",
+    "case",
+    "config_id",
+    "config_name",
+    "lp_path",
+    "sidecar_path",
+    "solve_time_sec",
+    "wall_time_sec",
+    "status",
+    "obj",
+    "nodes",
+    "lp_iterations",
+    "time_limit",
+    "maxroundsroot",
+    "maxrounds",
+]
 
-    try:
-        out["obj"] = float(m.getObjVal())
-    except Exception:
-        out["obj"] = None
 
-    try:
-        out["nodes"] = int(m.getNNodes())
-    except Exception:
-        out["nodes"] = None
+# statuses of runs that finished, i.e. whose time is exact
+SOLVED_STATUSES = {"optimal", "infeasible"}
+CAPPED_STATUS = "capped"
 
-    try:
-        out["lp_iterations"] = int(m.getNLPIterations())
-    except Exception:
-        out["lp_iterations"] = None
 
-    return out
+def run_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Worker entry point: solve one (instance, config) pair and return the
+    finished results row (CSV fields + sepa_freq + cached). Top-level so it
+    pickles.
+    With task["cap_sec"] set, the solve gets that limit instead of
+    time_limit and a run stopped by it is reported as "capped".
+    """
+    print(f"[RUN] {task['instance_name']} | {task['config_name']}", flush=True)
+    cap = task.get("cap_sec")
+    metrics = run_one(
+        lp_path=task["lp_path"],
+        sepa_freq=task["sepa_freq"],
+        time_limit=cap if cap is not None else task["time_limit"],
+        node_limit=task["node_limit"],
+        maxroundsroot=task["maxroundsroot"],
+        maxrounds=task["maxrounds"],
+        hide_output=True,
+        threads=task.get("threads"),
+        cache=SolveCache(task["solve_cache"], force=task["force_resolve"]) if task.get("solve_cache") else None,
+    )
+
+    row = {k: task.get(k) for k in FIELDNAMES}
+    for k in ("solve_time_sec", "wall_time_sec", "status", "obj", "nodes", "lp_iterations"):
+        row[k] = metrics.get(k)
+    row["sepa_freq"] = task["sepa_freq"]
+    # a time taken from the solve cache was measured by an earlier run, possibly another script
+    row["cached"] = bool(metrics.get("cached", False))
+    if cap is not None:
+        row["cap_sec"] = cap
+        if row["status"] == "timelimit":
+            row["status"] = CAPPED_STATUS
+    return row
+
+
+def load_best_times(store: ResultsStore) -> Dict[str, float]:
+    """Return {instance_name: fastest solved solve_time_sec} from the results store."""
+    best: Dict[str, float] = {}
+    for r in store.rows(columns=["instance_name", "status", "solve_time_sec"],
+                        where={"status": sorted(SOLVED_STATUSES)}):
+        update_best_time(best, r)
+    return best
+
+
+def update_best_time(best: Dict[str, float], row: Dict[str, Any]) -> None:
+    if row.get("status") not in SOLVED_STATUSES or row.get("solve_time_sec") is None:
+        return
+    t = float(row["solve_time_sec"])
+    name = row["instance_name"]
+    if name not in best or t < best[name]:
+        best[name] = t
 
 
 # -----------------------------
@@ -291,7 +369,29 @@ def main():
     ap.add_argument("--maxrounds", type=int, default=10, help="SCIP separating/maxrounds")
     ap.add_argument("--seed", type=int, default=0, help="Not used heavily yet; reserved for shuffling/order")
     ap.add_argument("--max-instances", type=int, default=None, help="Optional cap for quick debugging")
+    ap.add_argument("--workers", type=int, default=1, help="Number of solver processes (1 = serial)")
+    ap.add_argument("--threads-per-solve", type=int, default=None,
+                    help="SCIP lp/threads per solve (default: SCIP default when serial, 1 when --workers > 1)")
+    ap.add_argument("--thread-pool", action="store_true",
+                    help="Run --workers as threads in this process instead of separate processes")
+    ap.add_argument("--no-resume", action="store_true",
+                    help="Re-run pairs already present in an existing results.sqlite")
+    ap.add_argument("--adaptive-cap", action="store_true",
+                    help="Cap the time limit of later configs by the best time of the first --cap-first-k")
+    ap.add_argument("--cap-first-k", type=int, default=3,
+                    help="Configs (in CONFIGS order) run with the full limit before capping")
+    ap.add_argument("--cap-factor", type=float, default=2.0,
+                    help="Capped limit = min(time-limit, cap-factor * best_time + cap-slack)")
+    ap.add_argument("--cap-slack", type=float, default=10.0, help="Seconds added to the scaled best time")
+    add_solve_cache_args(ap)
     args = ap.parse_args()
+    cache = solve_cache_from_args(args)
+    if args.adaptive_cap and args.cap_factor < 1.0:
+        ap.error("--cap-factor must be >= 1 (a capped config must be allowed the best config's time)")
+
+    threads = args.threads_per_solve
+    if threads is None and args.workers > 1:
+        threads = 1
 
     manifest_path = Path(args.manifest)
     if not manifest_path.exists():
@@ -314,97 +414,99 @@ def main():
     if args.max_instances is not None:
         manifest = manifest[: int(args.max_instances)]
 
-    # Output files
+    # Output files: the store is the record, results.csv/jsonl are exported from it
     csv_path = outdir / "results.csv"
     jsonl_path = outdir / "results.jsonl"
+    store = ResultsStore(str(outdir / "results.sqlite"), fieldnames=FIELDNAMES)
+    if len(store) == 0 and jsonl_path.exists():
+        print(f"[RESUME] importing {store.import_jsonl(str(jsonl_path))} runs from {jsonl_path}")
 
-    fieldnames = [
-        "instance_name",
-        "case",
-        "config_id",
-        "config_name",
-        "lp_path",
-        "sidecar_path",
-        "solve_time_sec",
-        "wall_time_sec",
-        "status",
-        "obj",
-        "nodes",
-        "lp_iterations",
-        "time_limit",
-        "maxroundsroot",
-        "maxrounds",
-    ]
-
-    # Write headers
-    write_header = not csv_path.exists()
-    with open(csv_path, "a", newline="") as fcsv, open(jsonl_path, "a") as fjsonl:
-        writer = csv.DictWriter(fcsv, fieldnames=fieldnames)
-        if write_header:
-            writer.writeheader()
-
-        total_runs = 0
-        for entry in manifest:
-            lp_rel = entry["lp"]
-            side_rel = entry["sidecar"]
-            case = entry.get("case", None)
-
-            lp_path = str(inst_dir / lp_rel)
-            sidecar_path = str(inst_dir / side_rel)
-
-            instance_name = Path(lp_rel).stem  # filename w/out .lp
-
-            if not Path(lp_path).exists():
-                print(f"[WARN] missing lp: {lp_path}, skipping")
-                continue
+    done = set() if args.no_resume else store.pairs()
+
+    tasks: List[Dict[str, Any]] = []
+    n_skipped = 0
+    for entry in manifest:
+        lp_rel = entry["lp"]
+        side_rel = entry["sidecar"]
+        case = entry.get("case", None)
 
-            for cfg in CONFIGS:
-                cfg_id = cfg["config_id"]
-                cfg_name = cfg["name"]
-                sepa_freq = cfg["sepa_freq"]
-
-                print(f"[RUN] {instance_name} | {cfg_name}")
-                metrics = run_one(
-                    lp_path=lp_path,
-                    sepa_freq=sepa_freq,
-                    time_limit=args.time_limit,
-                    node_limit=args.node_limit,
-                    maxroundsroot=args.maxroundsroot,
-                    maxrounds=args.maxrounds,
-                    hide_output=True,
-                )
-
-                row = {
-                    "instance_name": instance_name,
-                    "case": case,
-                    "config_id": cfg_id,
-                    "config_name": cfg_name,
-                    "lp_path": lp_path,
-                    "sidecar_path": sidecar_path,
-                    "solve_time_sec": metrics.get("solve_time_sec"),
-                    "wall_time_sec": metrics.get("wall_time_sec"),
-                    "status": metrics.get("status"),
-                    "obj": metrics.get("obj"),
-                    "nodes": metrics.get("nodes"),
-                    "lp_iterations": metrics.get("lp_iterations"),
-                    "time_limit": args.time_limit,
-                    "maxroundsroot": args.maxroundsroot,
-                    "maxrounds": args.maxrounds,
-                }
-
-                writer.writerow(row)
-                fcsv.flush()
-
-                fjsonl.write(json.dumps({**row, "sepa_freq": sepa_freq}) + "\n")
-                fjsonl.flush()
-
-                total_runs += 1
-
-        print(f"\nDone. Wrote {total_runs} runs to:")
-        print(f"  {csv_path}")
-        print(f"  {jsonl_path}")
-        print(f"  {outdir / 'configs.json'}")
+        lp_path = str(inst_dir / lp_rel)
+        sidecar_path = str(inst_dir / side_rel)
 
+        instance_name = Path(lp_rel).stem  # filename w/out .lp
+
+        if not Path(lp_path).exists():
+            print(f"[WARN] missing lp: {lp_path}, skipping")
+            continue
+
+        for cfg_pos, cfg in enumerate(CONFIGS):
+            if (instance_name, cfg["config_id"]) in done:
+                n_skipped += 1
+                continue
+            tasks.append({
+                "instance_name": instance_name,
+                "case": case,
+                "config_id": cfg["config_id"],
+                "config_name": cfg["name"],
+                "lp_path": lp_path,
+                "sidecar_path": sidecar_path,
+                "sepa_freq": cfg["sepa_freq"],
+                "time_limit": args.time_limit,
+                "node_limit": args.node_limit,
+                "maxroundsroot": args.maxroundsroot,
+                "maxrounds": args.maxrounds,
+                "threads": threads,
+                "solve_cache": str(cache.cache_dir) if cache is not None else None,
+                "force_resolve": args.force_resolve,
+                "probe": not args.adaptive_cap or cfg_pos < args.cap_first_k,
+            })
+
+    if n_skipped:
+        print(f"[RESUME] skipping {n_skipped} runs already in {store.path}")
+
+    # with --adaptive-cap the first k configs of every instance run first, uncapped
+    first = [t for t in tasks if t["probe"]]
+    later = [t for t in tasks if not t["probe"]]
+    best = load_best_times(store) if args.adaptive_cap else {}
+
+    print(f"[PLAN] {len(tasks)} runs on {args.workers} {'thread' if args.thread_pool else 'worker'}(s)"
+          + (f", {len(later)} of them capped by the first {args.cap_first_k} configs" if args.adaptive_cap else ""))
+
+    total_runs = 0
+    n_capped = 0
+
+    def run_batch(batch: List[Dict[str, Any]]) -> None:
+        nonlocal total_runs, n_capped
+        for row in multiprocess_unordered(run_task, batch, cpus=args.workers, threads=args.thread_pool):
+            store.append(row)
+
+            update_best_time(best, row)
+            n_capped += row["status"] == CAPPED_STATUS
+            total_runs += 1
+            print(f"[DONE {total_runs}/{len(tasks)}] {row['instance_name']} | {row['config_name']} "
+                  f"| {row['status']} | {row['solve_time_sec']}")
+
+    try:
+        run_batch(first)
+
+        if args.adaptive_cap:
+            for t in later:
+                if t["instance_name"] in best:
+                    cap = min(float(t["time_limit"]), args.cap_factor * best[t["instance_name"]] + args.cap_slack)
+                    if cap < t["time_limit"]:
+                        t["cap_sec"] = cap
+        run_batch(later)
+    finally:
+        # refresh the views also when interrupted, so they match the store
+        store.export_csv(str(csv_path), FIELDNAMES)
+        store.export_jsonl(str(jsonl_path))
+
+    capped_note = f" ({n_capped} capped)" if args.adaptive_cap else ""
+    print(f"\nDone. Wrote {total_runs} runs{capped_note} to:")
+    print(f"  {store.path}")
+    print(f"  {csv_path}")
+    print(f"  {jsonl_path}")
+    print(f"  {outdir / 'configs.json'}")
 
 if __name__ == "__main__":
     main()
@@ -2,10 +2,15 @@
 """
 cut_quality_sepa.py
 
-Cut quality filtering separator for SCIP.
+Cut quality filtering for SCIP.
 
 After all standard separators have added their cuts to the separation storage,
-this plugin scores every cut and keeps only the top-k using overrideCutSelection3.
+this plugin scores every cut and keeps only the top-k. It is a cut selector
+plugin (CutQualityCutsel, registered with Model.includeCutsel): SCIP hands it
+the candidate cuts once per round and applies the returned selection.
+With native=True include_cut_filter() instead configures the C cut selector "mlscore"
+(Model.includeNativeCutScorer, see NativeCutFilter), which scores and selects
+without any Python callback per round.
 
 Two modes:
   1. Heuristic (no model): composite score from SCIP built-in metrics
@@ -24,7 +29,7 @@ For ML mode:
   - Model: MLP regressor, trained offline from collected data
 
 Usage (heuristic):
-    from cut_quality_sepa import CutQualitySepa, make_model_with_cut_filter
+    from cut_quality_sepa import make_model_with_cut_filter
     m, sepa = make_model_with_cut_filter("instance.lp", top_k=5)
     m.optimize()
 
@@ -37,13 +42,16 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
-from pyscipopt import Model, Sepa, SCIP_RESULT
+from pyscipopt import Model, Cutsel, SCIP_RESULT
 
+from instance_cache import load_model
+from mlp_runtime import load_mlp
 
-# Names of features extracted per cut (must match collect_cut_data.py order)
+
+# Columns of Model.getCutFeatureMatrix (must match collect_cut_data.py order)
 CUT_FEATURE_NAMES = [
     "violation",
     "rel_violation",
@@ -57,28 +65,6 @@ CUT_FEATURE_NAMES = [
 N_CUT_FEATURES = len(CUT_FEATURE_NAMES)
 
 
-def _extract_cut_features(cut, model: Model) -> np.ndarray:
-    """Extract scalar quality features for a single cut. Returns float32 array."""
-    feats = np.zeros(N_CUT_FEATURES, dtype=np.float32)
-    score_funcs = [
-        model.getCutViolation,
-        model.getCutRelViolation,
-        model.getCutObjParallelism,
-        model.getCutEfficacy,
-        model.getCutSCIPScore,
-        model.getCutExpImprov,
-        model.getCutSupportScore,
-        model.getCutIntSupport,
-    ]
-    for i, fn in enumerate(score_funcs):
-        try:
-            v = fn(cut)
-            feats[i] = float(v) if v is not None and np.isfinite(v) else 0.0
-        except Exception:
-            pass
-    return feats
-
-
 def _heuristic_score(feats: np.ndarray) -> float:
     """
     Composite heuristic score from cut feature vector.
@@ -96,12 +82,19 @@ def _heuristic_score(feats: np.ndarray) -> float:
     return float(0.4 * efficacy + 0.3 * scip_score + 0.2 * obj_para + 0.1 * int_support)
 
 
-class CutQualitySepa(Sepa):
-    """
-    Cut quality filtering meta-separator.
+def _heuristic_scores(feats: np.ndarray) -> np.ndarray:
+    """_heuristic_score applied to every row of an (n_cuts, N_CUT_FEATURES) matrix."""
+    feats = np.asarray(feats, dtype=np.float64)
+    efficacy       = np.clip(feats[:, 3], 0.0, 5.0) / 5.0
+    obj_para       = np.clip(feats[:, 2], 0.0, 1.0)
+    int_support    = np.clip(feats[:, 7], 0.0, 1.0)
+    scip_score     = np.clip(feats[:, 4], 0.0, 1.0)
+    return (0.4 * efficacy + 0.3 * scip_score + 0.2 * obj_para + 0.1 * int_support).astype(np.float32)
+
 
-    Runs at very low priority (after all standard separators have added cuts),
-    scores each cut, and calls overrideCutSelection3 to keep only the top-k.
+class _CutQualityFilter:
+    """
+    Scoring and top-k selection of CutQualityCutsel.
 
     Parameters
     ----------
@@ -153,133 +146,99 @@ class CutQualitySepa(Sepa):
 
     def _load_ml_model(self, model_pt: str) -> None:
         try:
-            import torch
-            import torch.nn as nn
-
-            ckpt = torch.load(model_pt, map_location="cpu")
-            d_in = ckpt.get("d_in", N_CUT_FEATURES)
-            hidden = ckpt.get("hidden", 64)
-
-            class MLP(nn.Module):
-                def __init__(self):
-                    super().__init__()
-                    self.net = nn.Sequential(
-                        nn.Linear(d_in, hidden), nn.ReLU(),
-                        nn.Linear(hidden, hidden), nn.ReLU(),
-                        nn.Linear(hidden, 1),
-                    )
-                def forward(self, x):
-                    return self.net(x).squeeze(-1)
-
-            net = MLP()
-            net.load_state_dict(ckpt["state_dict"])
-            net.eval()
+            # NumPy forward pass; reads the exported .npz next to model_pt when present
+            net = load_mlp(model_pt)
+            d_in = net.d_in
             self._ml_model = net
-            self._mu = np.array(ckpt.get("mu", np.zeros(d_in)), dtype=np.float32)
-            self._sd = np.array(ckpt.get("sd", np.ones(d_in)), dtype=np.float32)
+            self._mu = net.mu if net.mu is not None else np.zeros(d_in, dtype=np.float32)
+            self._sd = net.sd if net.sd is not None else np.ones(d_in, dtype=np.float32)
             if self.log:
                 print(f"[CutQuality] loaded ML model from {model_pt}")
         except Exception as e:
             if self.log:
                 print(f"[CutQuality] ML model load failed ({e}), using heuristic")
 
-    def _score_cuts(self, cuts: list, model: Model) -> np.ndarray:
-        """Score all cuts. Returns float array of shape (n_cuts,)."""
-        if not cuts:
+    def _score_cuts(self, cuts: list, model: Model, feats: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Score all cuts. Returns float array of shape (n_cuts,).
+        feats: precomputed feature matrix for `cuts`, if the caller has one.
+        """
+        if feats is None:
+            if not cuts:
+                return np.array([], dtype=np.float32)
+            feats = model.getCutFeatureMatrix(cuts)
+        if len(feats) == 0:
             return np.array([], dtype=np.float32)
 
-        feats = np.stack([_extract_cut_features(c, model) for c in cuts], axis=0)
-
         if self._ml_model is not None:
             try:
-                import torch
                 x = (feats - self._mu) / (self._sd + 1e-8)
-                with torch.no_grad():
-                    scores = self._ml_model(torch.tensor(x)).numpy().astype(np.float32)
-                return scores
+                return self._ml_model(x)[:, 0].astype(np.float32)
             except Exception:
                 pass  # fallback to heuristic
 
-        return np.array([_heuristic_score(feats[i]) for i in range(len(cuts))],
-                        dtype=np.float32)
-
-    def sepaexeclp(self) -> Dict[str, Any]:
-        """Called each separation round. Score and filter cuts in sepastore."""
-        model = self.model
-
-        # Only filter at root node to avoid overhead in tree
-        try:
-            if model.getDepth() > 0:
-                return {"result": SCIP_RESULT.DIDNOTRUN}
-        except Exception:
-            pass
+        return _heuristic_scores(feats)
 
+    def _select(self, cuts: list, model: Model, max_keep: Optional[int] = None) -> Optional[np.ndarray]:
+        """
+        Positions in `cuts` of the cuts to keep, best first, or None when the
+        round should be left to SCIP (nothing valid, or everything would be kept).
+        """
         self._root_round += 1
 
-        try:
-            cuts = model.getCuts()
-        except Exception:
-            return {"result": SCIP_RESULT.DIDNOTRUN}
-
         if not cuts:
-            return {"result": SCIP_RESULT.DIDNOTRUN}
+            return None
 
         self._total_cuts_seen += len(cuts)
 
+        # Features for every cut in one call; column 3 is efficacy
+        feats = model.getCutFeatureMatrix(cuts)
+
         # Pre-filter: discard cuts below min_efficacy
-        try:
-            valid_cuts = [c for c in cuts
-                          if model.getCutEfficacy(c) >= self.min_efficacy]
-        except Exception:
-            valid_cuts = cuts
+        keep = np.flatnonzero(feats[:, 3] >= self.min_efficacy)
+        feats = feats[keep]
 
-        if not valid_cuts:
-            return {"result": SCIP_RESULT.DIDNOTRUN}
+        if len(keep) == 0:
+            return None
 
         # Compute n_keep: fraction-based (if top_frac set) or fixed top_k
         if self.top_frac is not None:
-            n_keep = max(self.min_keep, int(len(valid_cuts) * self.top_frac))
+            n_keep = max(self.min_keep, int(len(keep) * self.top_frac))
         else:
             n_keep = self.top_k
+        if max_keep is not None:
+            n_keep = min(n_keep, max_keep)
 
-        # Skip if we'd keep everything anyway — no point calling overrideCutSelection
-        if n_keep >= len(valid_cuts):
+        # Skip if we'd keep everything anyway — SCIP's own selection does the rest
+        if n_keep >= len(keep):
             self._rounds_skipped += 1
             if self.log:
-                print(f"[CutQuality] round skipped (n_keep={n_keep} >= n_valid={len(valid_cuts)})")
-            return {"result": SCIP_RESULT.DIDNOTRUN}
+                print(f"[CutQuality] round skipped (n_keep={n_keep} >= n_valid={len(keep)})")
+            return None
 
-        scores = self._score_cuts(valid_cuts, model)
-        n_keep = min(n_keep, len(valid_cuts))
+        scores = self._score_cuts(None, model, feats=feats)
 
-        # Top-k by score
+        # Top-k by score, best first
         top_idx = np.argpartition(scores, -n_keep)[-n_keep:]
-        selected = [valid_cuts[i] for i in top_idx]
+        top_idx = top_idx[np.argsort(-scores[top_idx], kind="stable")]
 
-        self._total_cuts_kept += len(selected)
+        self._total_cuts_kept += len(top_idx)
 
         # Record for data collection
         if self.collect:
             self.round_log.append({
                 "depth": 0,
                 "n_cuts_seen": len(cuts),
-                "n_valid": len(valid_cuts),
-                "n_kept": len(selected),
+                "n_valid": len(keep),
+                "n_kept": len(top_idx),
                 "scores": scores.tolist(),
             })
 
-        try:
-            model.overrideCutSelection3(selected)
-        except Exception as e:
-            if self.log:
-                print(f"[CutQuality] overrideCutSelection3 failed: {e}")
-            return {"result": SCIP_RESULT.DIDNOTRUN}
-
         if self.log:
-            print(f"[CutQuality] round: {len(cuts)} cuts → kept {len(selected)} "
-                  f"(best score={scores[top_idx].max():.4f})")
+            print(f"[CutQuality] round: {len(cuts)} cuts → kept {len(top_idx)} "
+                  f"(best score={scores[top_idx[0]]:.4f})")
 
-        return {"result": SCIP_RESULT.DIDNOTRUN}  # we don't add cuts ourselves
+        return keep[top_idx]
 
     def get_stats(self) -> Dict[str, Any]:
         return {
@@ -293,6 +252,109 @@ class CutQualitySepa(Sepa):
     def get_log(self) -> List[Dict[str, Any]]:
         return self.round_log
 
+class CutQualityCutsel(_CutQualityFilter, Cutsel):
+    """
+    Cut quality filtering as a cut selector.
+
+    SCIP calls cutselselect once per separation round with the candidate
+    cuts; the top-k positions are handed back directly. Outside the root,
+    and in rounds where everything would be kept, SCIP's default selection
+    is used.
+    """
+
+    def cutselselect(self, cuts, forcedcuts, root, maxnselectedcuts) -> Dict[str, Any]:
+        if not root:
+            return {"result": SCIP_RESULT.DIDNOTFIND}
+        selected = self._select(cuts, self.model, max_keep=maxnselectedcuts)
+        if selected is None:
+            return {"result": SCIP_RESULT.DIDNOTFIND}
+        return {"result": SCIP_RESULT.SUCCESS, "selected": selected}
+
+
+def _load_native_layers(model_pt: str) -> Tuple[List[Tuple[np.ndarray, np.ndarray]], np.ndarray, np.ndarray]:
+    """
+    (W, b) pairs of the trained MLP, in order, plus its feature mu/sd —
+    the layout Model.includeNativeCutScorer takes.
+    """
+    net = load_mlp(model_pt)
+    layers = [(W.astype(np.float64), b.astype(np.float64)) for W, b in net.layers]
+    mu = net.mu if net.mu is not None else np.zeros(net.d_in)
+    sd = net.sd if net.sd is not None else np.ones(net.d_in)
+    return layers, np.asarray(mu, dtype=np.float64), np.asarray(sd, dtype=np.float64)
+
+
+class NativeCutFilter:
+    """
+    Handle for the C cut selector "mlscore" (Model.includeNativeCutScorer).
+
+    Same selection rule as _CutQualityFilter (min_efficacy pre-filter, top_k
+    or top_frac/min_keep, root only, skip when everything would be kept), but
+    features, scores and ranking are computed inside SCIP's sepastore. With
+    model_pt the checkpointed MLP weights are copied into SCIP once; otherwise
+    the C default is the _heuristic_score weighting. Only statistics come back
+    to Python, so collect/log have no per-round data to record.
+    """
+
+    def __init__(
+        self,
+        m: Model,
+        top_k: int = 10,
+        top_frac: Optional[float] = None,
+        min_keep: int = 5,
+        min_efficacy: float = 1e-4,
+        model_pt: Optional[str] = None,
+        log: bool = False,
+        collect: bool = False,
+    ):
+        self.model = m
+        layers = mu = sd = None
+        if model_pt and Path(model_pt).exists():
+            try:
+                layers, mu, sd = _load_native_layers(model_pt)
+                if log:
+                    print(f"[CutQuality] loaded ML model from {model_pt} into the native scorer")
+            except Exception as e:
+                if log:
+                    print(f"[CutQuality] ML model load failed ({e}), using heuristic")
+        if collect and log:
+            print("[CutQuality] native scorer keeps no per-round log")
+
+        m.includeNativeCutScorer(layers=layers, mu=mu, sd=sd, top_k=top_k, top_frac=top_frac,
+                                 min_keep=min_keep, min_efficacy=min_efficacy, root_only=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        s = self.model.getNativeCutScorerStatistics()
+        return {
+            "total_cuts_seen": s["ncutsseen"],
+            "total_cuts_kept": s["ncutskept"],
+            "keep_rate": (s["ncutskept"] / max(s["ncutsseen"], 1)),
+            "n_rounds": s["nrounds"] - s["nroundsskipped"],
+            "n_rounds_skipped": s["nroundsskipped"],
+            "select_time": s["time"],
+        }
+
+    def get_log(self) -> List[Dict[str, Any]]:
+        return []
+
+
+def include_cut_filter(
+    m: Model,
+    name: str = "cut_quality_filter",
+    native: bool = False,
+    **kwargs,
+) -> Union[CutQualityCutsel, NativeCutFilter]:
+    """
+    Register the cut quality filter on `m` and return it. kwargs go to the
+    plugin constructor. native=True uses the C scorer instead (name is then
+    ignored).
+    """
+    if native:
+        return NativeCutFilter(m, **kwargs)
+
+    cutsel = CutQualityCutsel(**kwargs)
+    m.includeCutsel(cutsel, name, "Score and filter cuts by quality; keep top-k per round", priority=10_000)
+    return cutsel
+
 
 def make_model_with_cut_filter(
     lp_path: str,
@@ -305,21 +367,21 @@ def make_model_with_cut_filter(
     log: bool = False,
     collect: bool = False,
     hide_output: bool = True,
-) -> Tuple[Model, CutQualitySepa]:
+    native: bool = False,
+) -> Tuple[Model, Union[CutQualityCutsel, NativeCutFilter]]:
     """
-    Create a SCIP Model with the cut quality filter separator registered.
+    Create a SCIP Model with the cut quality filter registered.
 
-    The filter runs at priority -1 (after all standard separators, which have
-    priority ≥ 0) so it sees ALL cuts before SCIP applies them.
+    The filter is a cut selector, so it sees ALL cuts of a round exactly when
+    SCIP selects them. native=True selects with the C scorer (see NativeCutFilter).
 
-    Returns (model, cut_quality_sepa).
+    Returns (model, cut_filter).
     """
-    m = Model()
-    if hide_output:
-        m.hideOutput(True)
+    m = load_model(lp_path, hide_output=hide_output)
     m.setRealParam("limits/time", float(time_limit))
 
-    sepa = CutQualitySepa(
+    cut_filter = include_cut_filter(
+        m,
         top_k=top_k,
         top_frac=top_frac,
         min_keep=min_keep,
@@ -327,14 +389,7 @@ def make_model_with_cut_filter(
         model_pt=model_pt,
         log=log,
         collect=collect,
-    )
-    m.includeSepa(
-        sepa,
-        name="cut_quality_filter",
-        desc="Score and filter cuts by quality; keep top-k per round",
-        priority=-1,       # run after all standard separators (priority ≥ 0)
-        freq=1,
+        native=native,
     )
 
-    m.readProblem(lp_path)
-    return m, sepa
+    return m, cut_filter
@@ -14,6 +14,8 @@ import pandas as pd
 import numpy as np
 import json
 
+from results_store import load_results
+
 def _detect_cols(df: pd.DataFrame):
     cols = set(df.columns)
 
@@ -59,7 +61,7 @@ def _normalize_inst(x: str) -> str:
 
 def main():
     ap = argparse.ArgumentParser()
-    ap.add_argument("--results-csv", required=True)
+    ap.add_argument("--results-csv", required=True, help="results.csv (or results.sqlite / results.jsonl)")
     ap.add_argument("--preds-csv", required=True)
     ap.add_argument("--baseline-config", default="all_off")
     ap.add_argument("--outdir", default="outputs_step5a_eval_k1_offline")
@@ -69,7 +71,7 @@ def main():
     outdir = Path(args.outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
-    results = pd.read_csv(args.results_csv)
+    results = load_results(args.results_csv)
     preds = pd.read_csv(args.preds_csv)
 
     inst_col, cfg_col, time_col, status_col = _detect_cols(results)
@@ -27,10 +27,13 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
-import torch
-import torch.nn as nn
 import pyscipopt as pyopt
 
+from instance_cache import load_model
+from mlp_runtime import NumpyMLP, load_mlp, softmax
+from results_store import iter_results
+from solve_cache import SolveCache, add_solve_cache_args, measure_solve, solve_cache_from_args
+
 
 SEPA_KEYS_DEFAULT = [
     "gomory",
@@ -44,25 +47,6 @@ SEPA_KEYS_DEFAULT = [
 ]
 
 
-# -------------------------
-# Model (must match train_uc_k1_offline.py classifier)
-# -------------------------
-
-class ClassifierMLP(nn.Module):
-    def __init__(self, d_in: int, hidden: int, n_classes: int):
-        super().__init__()
-        self.net = nn.Sequential(
-            nn.Linear(d_in, hidden),
-            nn.ReLU(),
-            nn.Linear(hidden, hidden),
-            nn.ReLU(),
-            nn.Linear(hidden, n_classes),
-        )
-
-    def forward(self, x: torch.Tensor) -> torch.Tensor:
-        return self.net(x)
-
-
 # -------------------------
 # Helpers
 # -------------------------
@@ -111,98 +95,46 @@ def _load_train_stats_if_present(model_pt_path: str) -> Optional[Tuple[np.ndarra
     return mu, sd
 
 
-def _infer_dims_from_state_dict(state: Dict[str, torch.Tensor]) -> Tuple[int, int, int]:
+def _load_model(model_pt: str, n_classes_expected: int) -> NumpyMLP:
     """
-    Infer (d_in, hidden, n_classes) from weights.
-    For our network:
-      net.0.weight shape = (hidden, d_in)
-      net.4.weight shape = (n_classes, hidden)
-    We do this robustly without assuming exact key names.
+    Classifier from train_uc_k1_offline.py as a NumPy MLP (no torch at solve
+    time once the checkpoint is exported with mlp_runtime.py).
     """
-    first_w = None
-    last_w = None
-
-    # find candidate 2D weights
-    weights = [(k, v) for k, v in state.items() if k.endswith("weight") and isinstance(v, torch.Tensor) and v.ndim == 2]
-    if not weights:
-        raise RuntimeError("No 2D weight matrices found in model state_dict.")
-
-    # pick smallest input-dim weight as "first" (usually hidden x d_in)
-    # and largest output-dim that matches hidden as "last"
-    # but easiest: just look for (hidden, d_in) then (n_classes, hidden)
-    # We'll assume the smallest second-dimension is d_in.
-    weights_sorted = sorted(weights, key=lambda kv: kv[1].shape[1])  # sort by in_features
-    first_w = weights_sorted[0][1]
-    hidden, d_in = first_w.shape
-
-    # find a weight whose in_features == hidden and out_features != hidden (should be last)
-    for _, w in weights:
-        if w.shape[1] == hidden and w.shape[0] != hidden:
-            last_w = w
-            break
-    if last_w is None:
-        # fallback: choose weight with in_features==hidden and maximal out_features
-        candidates = [w for _, w in weights if w.shape[1] == hidden]
-        if not candidates:
-            raise RuntimeError("Could not infer n_classes from model weights (no layer with in_features==hidden).")
-        last_w = max(candidates, key=lambda w: w.shape[0])
-
-    n_classes = int(last_w.shape[0])
-    return int(d_in), int(hidden), int(n_classes)
-
-
-def _load_model(model_pt: str, n_classes_expected: int, device: str = "cpu") -> ClassifierMLP:
-    state = torch.load(model_pt, map_location=device)
-    if isinstance(state, dict) and "state_dict" in state:
-        state = state["state_dict"]
-    if not isinstance(state, dict):
-        raise RuntimeError("model.pt did not contain a state_dict-like object.")
-
-    d_in, hidden, n_classes = _infer_dims_from_state_dict(state)
+    model = load_mlp(model_pt)
+    n_classes = model.d_out
 
     if n_classes != n_classes_expected:
         raise RuntimeError(
             f"Model output classes ({n_classes}) != classes provided ({n_classes_expected}). "
             f"Check your --classes order/length or you loaded the wrong model.pt."
         )
-
-    model = ClassifierMLP(d_in=d_in, hidden=hidden, n_classes=n_classes).to(device)
-    model.load_state_dict(state, strict=False)
-    model.eval()
     return model
 
 
 def _load_config_vectors_from_jsonl(results_jsonl: str, sepa_keys: List[str]) -> Dict[str, np.ndarray]:
+    """config_name -> 0/1 separator vector, from a results.jsonl or results.sqlite."""
     cfg: Dict[str, np.ndarray] = {}
     n_read = 0
-    with open(results_jsonl, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            n_read += 1
+    for row in iter_results(results_jsonl, columns=["config_name", "sepa_freq"]):
+        n_read += 1
+        name = row.get("config_name")
+        sepa_freq = row.get("sepa_freq", None)
+        if not name or not isinstance(sepa_freq, dict):
+            continue
+        vec = []
+        for k in sepa_keys:
+            v = sepa_freq.get(k, 0)
             try:
-                row = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            name = row.get("config_name")
-            sepa_freq = row.get("sepa_freq", None)
-            if not name or not isinstance(sepa_freq, dict):
-                continue
-            vec = []
-            for k in sepa_keys:
-                v = sepa_freq.get(k, 0)
-                try:
-                    fv = float(v)
-                except Exception:
-                    fv = 0.0
-                vec.append(1 if fv > 0 else 0)
-            cfg[name] = np.array(vec, dtype=np.int32)
+                fv = float(v)
+            except Exception:
+                fv = 0.0
+            vec.append(1 if fv > 0 else 0)
+        cfg[name] = np.array(vec, dtype=np.int32)
 
     if not cfg:
         raise RuntimeError(
             f"Could not load any config vectors from {results_jsonl}. "
-            f"Read {n_read} lines but found no rows with (config_name, sepa_freq dict)."
+            f"Read {n_read} rows but found no rows with (config_name, sepa_freq dict)."
         )
     return cfg
 
@@ -214,36 +146,33 @@ def _apply_config(m: pyopt.Model, sepa_keys: List[str], vec01: np.ndarray) -> No
         m.setParam(f"separating/{k}/freq", freq)
 
 
-def _solve_once(lp_path: str, time_limit: int, sepa_keys: List[str], cfg_vec: Optional[np.ndarray]) -> Dict[str, Any]:
-    m = pyopt.Model()
-    m.hideOutput(True)
-    m.readProblem(lp_path)
+def _solve_once(lp_path: str, time_limit: int, sepa_keys: List[str], cfg_vec: Optional[np.ndarray],
+                cache: Optional[SolveCache] = None, maxroundsroot: Optional[int] = None,
+                maxrounds: Optional[int] = None) -> Dict[str, Any]:
+    m = load_model(lp_path)
     if cfg_vec is not None:
         _apply_config(m, sepa_keys, cfg_vec)
     m.setParam("limits/time", float(time_limit))
-    m.optimize()
-
-    return {
-        "status": str(m.getStatus()),
-        "solve_time_sec": float(m.getSolvingTime()),
-        "nodes": int(m.getNNodes()),
-        "lp_iterations": int(m.getNLPIterations()),
-        "obj": float(m.getObjVal()) if m.getNSols() > 0 else None,
-    }
+    if maxroundsroot is not None:
+        m.setParam("separating/maxroundsroot", int(maxroundsroot))
+    if maxrounds is not None:
+        m.setParam("separating/maxrounds", int(maxrounds))
+
+    # the baseline is usually already cached by collect_uc_times or an earlier run
+    if cache is not None:
+        return cache.solve(m, lp_path)
+    return measure_solve(m)
 
 
-def _predict_config(model: ClassifierMLP, uc_feat: np.ndarray, mu: np.ndarray, sd: np.ndarray,
-                    classes: List[str], device: str) -> Tuple[str, float]:
+def _predict_config(model: NumpyMLP, uc_feat: np.ndarray, mu: np.ndarray, sd: np.ndarray,
+                    classes: List[str]) -> Tuple[str, float]:
     """
     Returns (pred_class, confidence) where confidence is softmax prob of pred_class.
     """
     x = (uc_feat.astype(np.float32) - mu) / sd
-    tx = torch.tensor(x.reshape(1, -1), dtype=torch.float32, device=device)
-    with torch.no_grad():
-        logits = model(tx).detach().cpu().numpy().reshape(-1)  # (K,)
+    logits = model(x)  # (K,)
     # softmax for confidence
-    ex = np.exp(logits - logits.max())
-    probs = ex / (ex.sum() + 1e-12)
+    probs = softmax(logits)
     j = int(np.argmax(probs))
     return classes[j], float(probs[j])
 
@@ -260,13 +189,18 @@ def main():
     ap.add_argument("--model-pt", required=True)
     ap.add_argument("--classes", required=True, help="Comma-separated classes in SAME order as training")
     ap.add_argument("--baseline-config", required=True)
-    ap.add_argument("--results-jsonl", required=True, help="Step3 results.jsonl to get sepa_freq vectors")
+    ap.add_argument("--results-jsonl", required=True, help="Step3 results.jsonl (or results.sqlite) to get sepa_freq vectors")
     ap.add_argument("--n", type=int, default=20)
     ap.add_argument("--time-limit", type=int, default=300)
     ap.add_argument("--seed", type=int, default=0)
     ap.add_argument("--outdir", required=True)
     ap.add_argument("--sepa-keys", default=",".join(SEPA_KEYS_DEFAULT))
+    ap.add_argument("--maxroundsroot", type=int, default=None,
+                    help="SCIP separating/maxroundsroot (match collect_uc_times to reuse its cached solves)")
+    ap.add_argument("--maxrounds", type=int, default=None, help="SCIP separating/maxrounds")
+    add_solve_cache_args(ap)
     args = ap.parse_args()
+    cache = solve_cache_from_args(args)
 
     os.makedirs(args.outdir, exist_ok=True)
     rng = random.Random(args.seed)
@@ -296,8 +230,7 @@ def main():
     else:
         mu, sd = mu_npz, sd_npz
 
-    device = "cpu"
-    model = _load_model(args.model_pt, n_classes_expected=len(classes), device=device)
+    model = _load_model(args.model_pt, n_classes_expected=len(classes))
 
     cfg_vecs = _load_config_vectors_from_jsonl(args.results_jsonl, sepa_keys=sepa_keys)
     if args.baseline_config not in cfg_vecs:
@@ -326,7 +259,7 @@ def main():
     for inst_key, lp_path in pool:
         uc_feat = feats_by_name[inst_key]
 
-        pred_cfg, conf = _predict_config(model, uc_feat, mu, sd, classes, device)
+        pred_cfg, conf = _predict_config(model, uc_feat, mu, sd, classes)
 
         if pred_cfg not in cfg_vecs:
             raise RuntimeError(
@@ -337,8 +270,10 @@ def main():
         base_vec = cfg_vecs[args.baseline_config]
         pred_vec = cfg_vecs[pred_cfg]
 
-        base_res = _solve_once(lp_path, args.time_limit, sepa_keys, base_vec)
-        pred_res = _solve_once(lp_path, args.time_limit, sepa_keys, pred_vec)
+        base_res = _solve_once(lp_path, args.time_limit, sepa_keys, base_vec, cache,
+                               args.maxroundsroot, args.maxrounds)
+        pred_res = _solve_once(lp_path, args.time_limit, sepa_keys, pred_vec, cache,
+                               args.maxroundsroot, args.maxrounds)
 
         t_base = base_res["solve_time_sec"]
         t_pred = pred_res["solve_time_sec"]
@@ -20,6 +20,11 @@ Captures:
   - lp_time_alloff:    wall time for pure LP root solve
   - lp_time_allon:     wall time for LP + cuts root solve
 
+Fused mode (--fused) does a single all_on root solve instead: a top-priority
+probe separator records the pure-LP dual bound, LP iterations, LP rows and
+elapsed time on its first call (before any separator has added a cut), and
+the cut loop then continues in the same model for the all_on numbers.
+
 Output: .npz with keys features, feature_names, instance_names
   (same format as uc_features.npz, ready to concatenate)
 
@@ -35,10 +40,12 @@ import argparse
 import json
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
-from pyscipopt import Model
+from pyscipopt import Sepa, SCIP_RESULT
+
+from instance_cache import load_model
 
 SEPAS = [
     "gomory", "cmir", "clique", "flowcover",
@@ -62,8 +69,7 @@ FEATURE_NAMES = [
 
 def _root_solve(lp_path: str, all_on: bool, time_limit: float = 120.0) -> Dict[str, Any]:
     """Run SCIP to root node only, return LP stats."""
-    m = Model()
-    m.hideOutput(True)
+    m = load_model(lp_path)
     m.setRealParam("limits/time", time_limit)
     m.setLongintParam("limits/nodes", 1)
     m.setIntParam("separating/maxroundsroot", 10 if all_on else 0)
@@ -76,10 +82,8 @@ def _root_solve(lp_path: str, all_on: bool, time_limit: float = 120.0) -> Dict[s
         except Exception:
             pass
 
-    m.readProblem(lp_path)
-
     n_vars = m.getNVars()
-    n_binvars = sum(1 for v in m.getVars() if v.vtype() == "BINARY")
+    n_binvars = m.getNBinVars()
     n_conss = m.getNConss()
 
     t0 = time.time()
@@ -97,7 +101,7 @@ def _root_solve(lp_path: str, all_on: bool, time_limit: float = 120.0) -> Dict[s
         lp_iters = 0
 
     try:
-        n_rows = m.getNRows()
+        n_rows = m.getNLPRows()
     except Exception:
         n_rows = n_conss
 
@@ -112,10 +116,91 @@ def _root_solve(lp_path: str, all_on: bool, time_limit: float = 120.0) -> Dict[s
     }
 
 
-def extract_lp_features(lp_path: str, time_limit: float = 120.0) -> np.ndarray:
+class _PureLPProbe(Sepa):
+    """
+    Runs first in the first root separation round, i.e. right after the
+    initial LP is solved and before any cut has been added, and records the
+    pure-LP state. Never separates anything itself.
+    """
+
+    def __init__(self):
+        self.t0: Optional[float] = None
+        self.record: Optional[Dict[str, Any]] = None
+
+    def sepaexeclp(self) -> Dict[str, Any]:
+        if self.record is None:
+            m = self.model
+            self.record = {
+                "dual": float(m.getDualbound()),
+                "lp_iters": int(m.getNLPIterations()),
+                "n_rows": int(m.getNLPRows()),
+                "wall": time.time() - self.t0,
+            }
+        return {"result": SCIP_RESULT.DIDNOTRUN}
+
+
+def _fused_root_solve(lp_path: str, time_limit: float = 120.0) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    One all_on root solve; returns (pure-LP stats, after-cuts stats) in the
+    same format as _root_solve(all_on=False) / _root_solve(all_on=True).
+    """
+    m = load_model(lp_path)
+    m.setRealParam("limits/time", time_limit)
+    m.setLongintParam("limits/nodes", 1)
+    m.setIntParam("separating/maxroundsroot", 10)
+    m.setIntParam("separating/maxrounds", 0)
+
+    for sepa in SEPAS:
+        try:
+            m.setIntParam(f"separating/{sepa}/freq", 1)
+        except Exception:
+            pass
+
+    probe = _PureLPProbe()
+    m.includeSepa(probe, "pure_lp_probe", "records the root LP before the first cut round",
+                  priority=10_000_000, freq=0)
+
+    dims = {
+        "n_vars": m.getNVars(),
+        "n_binvars": m.getNBinVars(),
+        "n_conss": m.getNConss(),
+    }
+
+    probe.t0 = t0 = time.time()
+    m.optimize()
+    wall = time.time() - t0
+
+    try:
+        dual = float(m.getDualbound())
+    except Exception:
+        dual = float("nan")
+
+    try:
+        lp_iters = int(m.getNLPIterations())
+    except Exception:
+        lp_iters = 0
+
+    try:
+        n_rows = m.getNLPRows()
+    except Exception:
+        n_rows = dims["n_conss"]
+
+    # No separation round ran (e.g. root LP integral or infeasible): the
+    # pure-LP state is the final state.
+    lp = probe.record or {"dual": dual, "lp_iters": lp_iters, "n_rows": n_rows, "wall": wall}
+
+    r_off = {**dims, **lp}
+    r_on = {**dims, "dual": dual, "lp_iters": lp_iters, "n_rows": n_rows, "wall": wall}
+    return r_off, r_on
+
+
+def extract_lp_features(lp_path: str, time_limit: float = 120.0, fused: bool = False) -> np.ndarray:
     """Return feature vector of length len(FEATURE_NAMES)."""
-    r_off = _root_solve(lp_path, all_on=False, time_limit=time_limit)
-    r_on = _root_solve(lp_path, all_on=True, time_limit=time_limit)
+    if fused:
+        r_off, r_on = _fused_root_solve(lp_path, time_limit=time_limit)
+    else:
+        r_off = _root_solve(lp_path, all_on=False, time_limit=time_limit)
+        r_on = _root_solve(lp_path, all_on=True, time_limit=time_limit)
 
     lp_obj = r_off["dual"]
     cuts_obj = r_on["dual"]
@@ -147,6 +232,8 @@ def main():
                     help="Per-solve time limit for root solves (sec)")
     ap.add_argument("--max-instances", type=int, default=None,
                     help="Cap for debugging")
+    ap.add_argument("--fused", action="store_true",
+                    help="One root solve per instance (pure-LP bound recorded before the first cut round)")
     args = ap.parse_args()
 
     manifest_path = Path(args.manifest)
@@ -174,7 +261,7 @@ def main():
 
         print(f"[LP] {inst_name} ...", end=" ", flush=True)
         try:
-            feats = extract_lp_features(lp_path, time_limit=args.time_limit)
+            feats = extract_lp_features(lp_path, time_limit=args.time_limit, fused=args.fused)
             all_features.append(feats)
             instance_names.append(inst_name)
             ct = feats[FEATURE_NAMES.index("cut_tightening")]
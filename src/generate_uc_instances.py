@@ -26,6 +26,7 @@ NOTE:
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
 import random
 from pathlib import Path
@@ -69,6 +70,80 @@ def load_network(case_name: str):
 # Data Generation
 # -----------------------------------------------------------------------------
 
+# How the demand noise is drawn:
+#   "legacy"    - global np.random state seeded with np.random.seed(seed); same
+#                 numbers as the original per-element loop, so existing seeds
+#                 reproduce existing instances bit for bit.
+#   "generator" - np.random.default_rng(seed); a self-contained stream that does
+#                 not depend on (or disturb) the global NumPy state.
+# Generator parameters (types, costs, min up/down) always come from the stdlib
+# `random` module seeded with the same seed.
+RNG_MODES = ("legacy", "generator")
+
+# how the UC model is built/written, see generate_instance
+BUILDERS = ("pyomo", "native")
+OUT_FORMATS = ("lp", "mps")
+
+
+def _sequential_sum(x: np.ndarray, axis: int) -> np.ndarray:
+    """Left-to-right sum along axis, i.e. the same rounding as a Python `+=` loop."""
+    return np.cumsum(x, axis=axis).take(-1, axis=axis)
+
+
+def sample_demand(
+    bus_load_base: np.ndarray,
+    time_pattern: np.ndarray,
+    n_scenarios: int,
+    demand_std: float = 0.10,
+    reserve_fraction: float = 0.12,
+    rng_mode: str = "legacy",
+    seed: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Draw the demand scenarios as arrays.
+
+    Returns a dict with
+      D       (S, T, N) bus demand per scenario and period
+      Pre     (S, T)    reserve requirement (reserve_fraction * total demand)
+      Prob    (S,)      scenario probabilities
+      Demand  (T,)      expected total demand
+      Reserve (T,)      expected reserve requirement
+    """
+    if rng_mode == "legacy":
+        # np.random.seed is done by the caller; one normal() call for all
+        # elements consumes the stream exactly like S*T*N scalar calls
+        draw = np.random.normal
+    elif rng_mode == "generator":
+        draw = np.random.default_rng(seed).normal
+    else:
+        raise ValueError(f"Unknown rng_mode: {rng_mode}. Available: {list(RNG_MODES)}")
+
+    n_periods, n_buses = len(time_pattern), len(bus_load_base)
+    base = bus_load_base[None, :] * time_pattern[:, None]                     # (T, N)
+    noise = np.clip(draw(1.0, demand_std, size=(n_scenarios, n_periods, n_buses)), 0.85, 1.15)
+    D = np.maximum(base[None, :, :] * noise, 0.0)                             # (S, T, N)
+
+    Prob = np.full(n_scenarios, 1.0 / n_scenarios)
+    Pre = reserve_fraction * _sequential_sum(D, axis=2)                       # (S, T)
+
+    weighted = (D * Prob[:, None, None]).transpose(1, 0, 2).reshape(n_periods, -1)
+    return {
+        "D": D,
+        "Pre": Pre,
+        "Prob": Prob,
+        "Demand": _sequential_sum(weighted, axis=1),
+        "Reserve": _sequential_sum(Pre * Prob[:, None], axis=0),
+    }
+
+
+def _indexed_dict(values: np.ndarray) -> Dict[Any, float]:
+    """1-based Pyomo param dict for an array: {i: v} in 1-D, {(i, j, ...): v} otherwise."""
+    if values.ndim == 1:
+        return dict(zip(range(1, len(values) + 1), values.tolist()))
+    keys = itertools.product(*(range(1, k + 1) for k in values.shape))
+    return dict(zip(keys, values.ravel().tolist()))
+
+
 def generate_uc_data(
     net,
     n_scenarios: int = 10,
@@ -77,10 +152,13 @@ def generate_uc_data(
     demand_std: float = 0.10,
     reserve_fraction: float = 0.12,
     target_utilization: float = 0.55,
+    rng_mode: str = "legacy",
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     Generate UC problem data from a pandapower network.
 
+    rng_mode selects how demand noise is drawn (see RNG_MODES).
+
     Returns:
       (pyomo_data, metadata)
       where pyomo_data is {None: param_dict} for AbstractModel.create_instance()
@@ -182,28 +260,23 @@ def generate_uc_data(
     raw = np.sin(np.linspace(-np.pi / 2, 3 * np.pi / 2, time_periods))  # starts low
     time_pattern = 0.65 + 0.45 * (raw + 1) / 2  # in [0.65, 1.10]
 
-    p["D"] = {}
-    p["Prob"] = {}
-    p["Pre"] = {}
-
-    demand_by_time: List[float] = []
-    for s in S:
-        p["Prob"][s] = 1.0 / n_scenarios
-        for t in T:
-            total_t = 0.0
-            for n in N:
-                base = bus_load_base[n] * float(time_pattern[t - 1])
-                noise = float(np.clip(np.random.normal(1.0, demand_std), 0.85, 1.15))
-                d = max(base * noise, 0.0)
-                p["D"][(s, t, n)] = float(d)
-                total_t += float(d)
-            p["Pre"][(s, t)] = float(reserve_fraction * total_t)
-
-    for t in T:
-        expected_t = sum(p["D"][(s, t, n)] * p["Prob"][s] for s in S for n in N)
-        demand_by_time.append(float(expected_t))
-
-    reserve_by_time = [float(sum(p["Pre"][(s, t)] * p["Prob"][s] for s in S)) for t in T]
+    demand = sample_demand(
+        np.array([bus_load_base[n] for n in N], dtype=float),
+        time_pattern,
+        n_scenarios,
+        demand_std=demand_std,
+        reserve_fraction=reserve_fraction,
+        rng_mode=rng_mode,
+        seed=seed,
+    )
+
+    # dict views only for the Pyomo data
+    p["D"] = _indexed_dict(demand["D"])
+    p["Prob"] = _indexed_dict(demand["Prob"])
+    p["Pre"] = _indexed_dict(demand["Pre"])
+
+    demand_by_time: List[float] = demand["Demand"].tolist()
+    reserve_by_time: List[float] = demand["Reserve"].tolist()
 
     metadata = {
         "Lup": {str(g): int(p["Ton"][g]) for g in G},
@@ -217,6 +290,7 @@ def generate_uc_data(
         "n_scenarios": n_scenarios,
         "n_generators": n_gen,
         "total_capacity": total_capacity,
+        "rng_mode": rng_mode,
         "note": "Copper-plate stochastic UC (no enforceable transmission constraints).",
     }
 
@@ -385,7 +459,60 @@ def build_uc_model(n_gen: int, n_buses: int, time_periods: int, n_scenarios: int
 # -----------------------------------------------------------------------------
 # Solve Helpers
 # -----------------------------------------------------------------------------
-def try_solve_feasibility(instance: pyo.ConcreteModel, time_limit_s: int = 30):
+def screen_scip_model(
+    m,
+    time_limit_s: int = 30,
+    svars=None,
+    early_exit: bool = False,
+    cost_bound: Optional[float] = None,
+    eps: float = 1e-6,
+):
+    """
+    Solve an already built pyscipopt.Model with the screening limits. Returns
+    dict with status AND slack totals read from the SCIP solution.
+
+    svars are the slack variables per family (uc_native.slack_vars), looked
+    up by name prefix if not given. With early_exit the solve stops at the
+    first incumbent without shed/shortfall, or once the dual bound exceeds
+    cost_bound (uc_native.zero_slack_cost_bound); the reason is reported
+    under "early_exit".
+    """
+    from uc_native import SlackScreenEventhdlr, slack_totals, slack_vars
+
+    if svars is None:
+        svars = slack_vars(m)
+    hdlr = None
+    if early_exit:
+        hdlr = SlackScreenEventhdlr(svars, eps=eps, cost_bound=cost_bound)
+        m.includeEventhdlr(hdlr, "slackscreen", "interrupts screening once the slack outcome is known")
+
+    m.setParam("limits/time", float(time_limit_s))
+    m.setParam("limits/gap", 0.05)
+    m.setParam("display/verblevel", 0)
+    m.optimize()
+    status = m.getStatus()
+    print(f"[screen] PySCIPOpt status: {status}")
+
+    info = {"solver": "pyscipopt", "status": status}
+    if hdlr is not None and hdlr.verdict is not None:
+        info["early_exit"] = hdlr.verdict
+
+    # Try to read slack values directly from SCIP solution
+    if status in ("optimal", "gaplimit", "timelimit", "userinterrupt") and m.getNSols() > 0:
+        try:
+            info["slack_summary"] = slack_totals(m, svars)
+        except Exception as e:
+            print(f"[screen] Could not read slack values: {repr(e)}")
+    return info
+
+
+def try_solve_feasibility(
+    instance: pyo.ConcreteModel,
+    time_limit_s: int = 30,
+    early_exit: bool = False,
+    cost_bound: Optional[float] = None,
+    eps: float = 1e-6,
+):
     """
     Use PySCIPOpt directly. Returns dict with status AND slack totals read from SCIP solution.
     """
@@ -395,44 +522,12 @@ def try_solve_feasibility(instance: pyo.ConcreteModel, time_limit_s: int = 30):
     fd, tmp_lp = tempfile.mkstemp(suffix=".lp")
     os.close(fd)
     try:
-        instance.write(tmp_lp)
+        # symbolic names, so the slack variables can be found by prefix
+        instance.write(tmp_lp, io_options={"symbolic_solver_labels": True})
         m = SCIPModel()
-        m.setParam("limits/time", float(time_limit_s))
-        m.setParam("limits/gap", 0.05)
-        m.setParam("display/verblevel", 0)
         m.readProblem(tmp_lp)
-        m.optimize()
-        status = m.getStatus()
-        print(f"[screen] PySCIPOpt status: {status}")
-
-        # Try to read slack values directly from SCIP solution
-        if status in ("optimal", "gaplimit", "timelimit"):
-            try:
-                total_shed = 0.0
-                total_spill = 0.0
-                total_res_short = 0.0
-                for var in m.getVars():
-                    name = var.name
-                    val = m.getVal(var)
-                    if name.startswith("load_shed"):
-                        total_shed += val
-                    elif name.startswith("spill"):
-                        total_spill += val
-                    elif name.startswith("res_short"):
-                        total_res_short += val
-                return {
-                    "solver": "pyscipopt",
-                    "status": status,
-                    "slack_summary": {
-                        "load_shed": float(total_shed),
-                        "spill": float(total_spill),
-                        "reserve_short": float(total_res_short),
-                    }
-                }
-            except Exception as e:
-                print(f"[screen] Could not read slack values: {repr(e)}")
-                return {"solver": "pyscipopt", "status": status}
-        return {"solver": "pyscipopt", "status": status}
+        return screen_scip_model(m, time_limit_s=time_limit_s, early_exit=early_exit,
+                                 cost_bound=cost_bound, eps=eps)
     except Exception as e:
         print(f"[screen] PySCIPOpt failed: {repr(e)}")
         return None
@@ -465,7 +560,29 @@ def generate_instance(
     out_dir: str = "instances",
     screen_feasibility: bool = False,
     screen_time_limit_s: int = 30,
+    rng_mode: str = "legacy",
+    builder: str = "pyomo",
+    out_format: str = "lp",
+    early_exit: bool = False,
+    screen_eps: float = 1e-6,
 ) -> Tuple[str, str]:
+    """
+    builder="pyomo" builds the AbstractModel and writes it with Pyomo;
+    builder="native" builds the same formulation directly in SCIP
+    (uc_native.build_uc_scip_model) and screens that model without a temp
+    file. out_format is "lp" or "mps".
+
+    early_exit stops the screening solve once it is known whether a solution
+    with load shed / reserve shortfall <= screen_eps exists (see
+    screen_scip_model).
+    """
+    if builder not in BUILDERS:
+        raise ValueError(f"Unknown builder: {builder}. Available: {list(BUILDERS)}")
+    if out_format not in OUT_FORMATS:
+        raise ValueError(f"Unknown out_format: {out_format}. Available: {list(OUT_FORMATS)}")
+    if builder == "pyomo" and out_format != "lp":
+        raise ValueError("The Pyomo builder only writes .lp files; use builder='native' for .mps")
+
     net = load_network(case_name)
 
     # sizes
@@ -480,15 +597,48 @@ def generate_instance(
         n_scenarios=n_scenarios,
         time_periods=time_periods,
         seed=seed,
+        rng_mode=rng_mode,
     )
 
-    abstract_model = build_uc_model(n_gen, n_buses, time_periods, n_scenarios)
-    instance = abstract_model.create_instance(pyomo_data)
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+
+    seed_str = f"_seed{seed}" if seed is not None else ""
+    filename = f"{case_name}_S{n_scenarios}_T{time_periods}{seed_str}"
+
+    lp_path = out_path / f"{filename}.{out_format}"
+    sidecar_path = out_path / f"{filename}.minud.json"
+
+    if builder == "native":
+        from uc_native import build_uc_scip_model, slack_vars
+
+        scip_model, var_index = build_uc_scip_model(pyomo_data[None], n_gen, n_buses, time_periods, n_scenarios)
+        # write and count before solving; the counts would be of the presolved problem afterwards
+        scip_model.hideOutput(True)
+        scip_model.writeProblem(str(lp_path))
+        n_vars = scip_model.getNVars()
+        n_cons = scip_model.getNConss()
+    else:
+        abstract_model = build_uc_model(n_gen, n_buses, time_periods, n_scenarios)
+        instance = abstract_model.create_instance(pyomo_data)
 
     # Optional feasibility screen
     solve_info = None
     if screen_feasibility:
-            solve_info = try_solve_feasibility(instance, time_limit_s=screen_time_limit_s)
+            cost_bound = None
+            if early_exit:
+                from uc_native import zero_slack_cost_bound
+                cost_bound = zero_slack_cost_bound(pyomo_data[None], eps=screen_eps)
+            if builder == "native":
+                try:
+                    solve_info = screen_scip_model(scip_model, time_limit_s=screen_time_limit_s,
+                                                   svars=slack_vars(scip_model, var_index),
+                                                   early_exit=early_exit, cost_bound=cost_bound, eps=screen_eps)
+                except Exception as e:
+                    print(f"[screen] PySCIPOpt failed: {repr(e)}")
+            else:
+                solve_info = try_solve_feasibility(instance, time_limit_s=screen_time_limit_s,
+                                                   early_exit=early_exit, cost_bound=cost_bound, eps=screen_eps)
             metadata["feasibility_screen"] = solve_info or {"note": "No solver available."}
 
             # Read slack directly from solve_info (not from Pyomo instance)
@@ -501,23 +651,15 @@ def generate_instance(
                 print("  Reserve short:", slack["reserve_short"])
             else:
                 metadata["slack_summary_note"] = "No incumbent values available."
-    
-    out_path = Path(out_dir)
-    out_path.mkdir(parents=True, exist_ok=True)
-
-    seed_str = f"_seed{seed}" if seed is not None else ""
-    filename = f"{case_name}_S{n_scenarios}_T{time_periods}{seed_str}"
 
-    lp_path = out_path / f"{filename}.lp"
-    sidecar_path = out_path / f"{filename}.minud.json"
+    if builder == "pyomo":
+        instance.write(str(lp_path))
+        n_vars = sum(1 for _ in instance.component_data_objects(pyo.Var))
+        n_cons = sum(1 for _ in instance.component_data_objects(pyo.Constraint))
 
-    instance.write(str(lp_path))
     with open(sidecar_path, "w") as f:
         json.dump(metadata, f, indent=2)
 
-    n_vars = sum(1 for _ in instance.component_data_objects(pyo.Var))
-    n_cons = sum(1 for _ in instance.component_data_objects(pyo.Constraint))
-
     print(f"Generated: {lp_path.name}")
     print(f"  Variables: {n_vars}, Constraints: {n_cons}")
     print(f"  Generators: {n_gen}, Buses: {n_buses}")
@@ -528,6 +670,72 @@ def generate_instance(
     return str(lp_path), str(sidecar_path)
 
 
+def _remove_candidate(lp, sidecar) -> None:
+    try:
+        Path(lp).unlink(missing_ok=True)
+        Path(sidecar).unlink(missing_ok=True)
+    except Exception:
+        pass
+
+
+def _judge_candidate(lp, sidecar, eps: float) -> bool:
+    """Read the screened sidecar, print the verdict; rejected candidates are deleted."""
+    # Read slack summary from sidecar to decide keep/reject
+    with open(sidecar, "r") as f:
+        meta = json.load(f)
+
+    slack = meta.get("slack_summary", None)
+    if slack is None:
+        # no incumbent -> reject
+        if meta.get("feasibility_screen", {}).get("early_exit") == "slack_forced":
+            print("  ❌ rejected (dual bound proves slack is forced)")
+        else:
+            print("  ❌ rejected (no slack_summary; no incumbent found)")
+        _remove_candidate(lp, sidecar)
+        return False
+
+    shed = float(slack.get("load_shed", 1e99))
+    rshort = float(slack.get("reserve_short", 1e99))
+
+    if abs(shed) <= eps and abs(rshort) <= eps:
+        print(f"  ✅ accepted (shed={shed:.3e}, rshort={rshort:.3e})")
+        return True
+    print(f"  ❌ rejected (shed={shed:.3e}, rshort={rshort:.3e})")
+    _remove_candidate(lp, sidecar)
+    return False
+
+
+def _screen_candidate(kwargs: Dict[str, Any]) -> Tuple[str, str]:
+    """Pool worker: generate + screen one seed (files are judged by the parent)."""
+    return generate_instance(screen_feasibility=True, **kwargs)
+
+
+def _candidate_paths(case: str, scenarios: int, time_periods: int, seed: int, out_dir: str, out_format: str):
+    filename = f"{case}_S{scenarios}_T{time_periods}_seed{seed}"
+    return Path(out_dir) / f"{filename}.{out_format}", Path(out_dir) / f"{filename}.minud.json"
+
+
+def _parallel_candidates(pool, case_kwargs: Dict[str, Any], max_attempts: int, window: int):
+    """
+    Yield (seed, lp, sidecar) in seed order while keeping up to `window`
+    screens running ahead. Seeds are the attempt numbers 1..max_attempts, so
+    the outcome does not depend on the number of workers or on timing.
+    """
+    from collections import deque
+
+    pending = deque()
+    next_seed = 1
+    while True:
+        while len(pending) < window and next_seed <= max_attempts:
+            pending.append((next_seed, pool.apply_async(_screen_candidate, (dict(case_kwargs, seed=next_seed),))))
+            next_seed += 1
+        if not pending:
+            return
+        seed, res = pending.popleft()
+        lp, sidecar = res.get()
+        yield seed, lp, sidecar
+
+
 def generate_dataset(
     cases: List[str],
     out_dir: str,
@@ -537,12 +745,23 @@ def generate_dataset(
     screen_time_limit_s: int,
     eps: float = 1e-6,
     max_attempts_factor: int = 50,
+    rng_mode: str = "legacy",
+    builder: str = "pyomo",
+    out_format: str = "lp",
+    workers: int = 1,
+    early_exit: bool = False,
 ) -> None:
     """
     Generate a dataset and keep only "clean" instances:
       abs(load_shed) <= eps and abs(reserve_short) <= eps
 
     Uses screening solve but does NOT require proven optimality.
+
+    Candidates of a case use seeds 1, 2, ... and are judged in seed order.
+    workers > 1 screens up to 2*workers of them concurrently in a process
+    pool; since the seed sequence and the order of judging do not change, the
+    manifest is the same for any number of workers. Once n_per_case are
+    accepted the remaining screens are cancelled and their files removed.
     """
     out_path = Path(out_dir)
     out_path.mkdir(parents=True, exist_ok=True)
@@ -554,62 +773,60 @@ def generate_dataset(
         max_attempts = max_attempts_factor * n_per_case
 
         print(f"\n=== {case}: generating {n_per_case} clean instances ===")
-        while accepted < n_per_case:
-            attempts += 1
-            if attempts > max_attempts:
-                raise RuntimeError(
-                    f"Too many attempts for {case}. "
-                    f"Try increasing --screen-time-limit or reducing scenarios/time-periods."
-                )
-
-            seed = accepted * 100000 + attempts
-            lp, sidecar = generate_instance(
-                case_name=case,
-                n_scenarios=scenarios,
-                time_periods=time_periods,
-                seed=seed,
-                out_dir=out_dir,
-                screen_feasibility=True,
-                screen_time_limit_s=screen_time_limit_s,
-            )
-
-            # Read slack summary from sidecar to decide keep/reject
-            with open(sidecar, "r") as f:
-                meta = json.load(f)
-
-            slack = meta.get("slack_summary", None)
-            if slack is None:
-                # no incumbent -> reject
-                print("  ❌ rejected (no slack_summary; no incumbent found)")
-                # delete files
-                try:
-                    Path(lp).unlink(missing_ok=True)
-                    Path(sidecar).unlink(missing_ok=True)
-                except Exception:
-                    pass
-                continue
-
-            shed = float(slack.get("load_shed", 1e99))
-            rshort = float(slack.get("reserve_short", 1e99))
-
-            if abs(shed) <= eps and abs(rshort) <= eps:
-                print(f"  ✅ accepted (shed={shed:.3e}, rshort={rshort:.3e})")
-                manifest.append({
-                    "case": case,
-                    "lp": Path(lp).name,
-                    "sidecar": Path(sidecar).name,
-                    "seed": seed,
-                    "scenarios": scenarios,
-                    "time_periods": time_periods,
-                })
-                accepted += 1
-            else:
-                print(f"  ❌ rejected (shed={shed:.3e}, rshort={rshort:.3e})")
-                try:
-                    Path(lp).unlink(missing_ok=True)
-                    Path(sidecar).unlink(missing_ok=True)
-                except Exception:
-                    pass
+        case_kwargs = dict(
+            case_name=case,
+            n_scenarios=scenarios,
+            time_periods=time_periods,
+            out_dir=out_dir,
+            screen_time_limit_s=screen_time_limit_s,
+            rng_mode=rng_mode,
+            builder=builder,
+            out_format=out_format,
+            early_exit=early_exit,
+            screen_eps=eps,
+        )
+
+        pool = None
+        if workers > 1:
+            import multiprocessing
+
+            pool = multiprocessing.Pool(workers)
+            candidates = _parallel_candidates(pool, case_kwargs, max_attempts, window=2 * workers)
+        else:
+            def serial_candidates():
+                for seed in range(1, max_attempts + 1):
+                    yield (seed,) + generate_instance(seed=seed, screen_feasibility=True, **case_kwargs)
+            candidates = serial_candidates()
+
+        try:
+            while accepted < n_per_case:
+                attempts += 1
+                if attempts > max_attempts:
+                    raise RuntimeError(
+                        f"Too many attempts for {case}. "
+                        f"Try increasing --screen-time-limit or reducing scenarios/time-periods."
+                    )
+
+                seed, lp, sidecar = next(candidates)
+                if _judge_candidate(lp, sidecar, eps):
+                    manifest.append({
+                        "case": case,
+                        "lp": Path(lp).name,
+                        "sidecar": Path(sidecar).name,
+                        "seed": seed,
+                        "scenarios": scenarios,
+                        "time_periods": time_periods,
+                        "rng_mode": rng_mode,
+                    })
+                    accepted += 1
+        finally:
+            if pool is not None:
+                # cancel speculative screens and drop whatever they wrote
+                pool.terminate()
+                pool.join()
+                # at most 2*workers seeds were submitted beyond the last judged one
+                for seed in range(attempts + 1, min(max_attempts, attempts + 2 * workers) + 1):
+                    _remove_candidate(*_candidate_paths(case, scenarios, time_periods, seed, out_dir, out_format))
 
     manifest_path = out_path / "manifest.json"
     with open(manifest_path, "w") as f:
@@ -629,6 +846,19 @@ def main():
     parser.add_argument("--scenarios", type=int, default=10, help="Number of scenarios")
     parser.add_argument("--time-periods", type=int, default=24, help="Time periods")
     parser.add_argument("--seed", type=int, help="Random seed")
+    parser.add_argument(
+        "--rng-mode",
+        choices=RNG_MODES,
+        default="legacy",
+        help="Demand noise stream: 'legacy' reproduces existing seeds, 'generator' uses np.random.default_rng(seed).",
+    )
+    parser.add_argument(
+        "--builder",
+        choices=BUILDERS,
+        default="pyomo",
+        help="'native' builds the model directly in SCIP (no Pyomo instance, no temp .lp for screening).",
+    )
+    parser.add_argument("--out-format", choices=OUT_FORMATS, default="lp", help="Instance file format (mps needs --builder native).")
     parser.add_argument("--out-dir", default="instances", help="Output directory")
 
     parser.add_argument(
@@ -649,6 +879,13 @@ def main():
     parser.add_argument("--n-per-case", type=int, default=10, help="Accepted instances per case in dataset mode.")
     parser.add_argument("--eps", type=float, default=1e-6, help="Slack tolerance for acceptance.")
     parser.add_argument("--max-attempts-factor", type=int, default=50, help="Max attempts = factor * n-per-case.")
+    parser.add_argument("--workers", type=int, default=1, help="Screen this many seeds concurrently in dataset mode "
+                        "(seeds 1, 2, ... per case; the dataset does not depend on this).")
+    parser.add_argument(
+        "--early-exit",
+        action="store_true",
+        help="Stop screening at the first slack-free incumbent or once slack is provably forced.",
+    )
 
     args = parser.parse_args()
 
@@ -662,6 +899,11 @@ def main():
             screen_time_limit_s=args.screen_time_limit,
             eps=args.eps,
             max_attempts_factor=args.max_attempts_factor,
+            rng_mode=args.rng_mode,
+            builder=args.builder,
+            out_format=args.out_format,
+            workers=args.workers,
+            early_exit=args.early_exit,
         )
         return
 
@@ -680,6 +922,10 @@ def main():
         out_dir=args.out_dir,
         screen_feasibility=args.screen_feasibility,
         screen_time_limit_s=args.screen_time_limit,
+        rng_mode=args.rng_mode,
+        builder=args.builder,
+        out_format=args.out_format,
+        early_exit=args.early_exit,
     )
 
 
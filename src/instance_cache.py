@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+instance_cache.py
+
+Parse each UC instance once per process and hand out fresh SCIP Models by
+copying the parsed original problem, instead of re-reading the Pyomo .lp
+text for every configuration.
+
+Entries are keyed by a hash of the file contents, so an instance that is
+regenerated in place is re-parsed, and two paths to the same file share one
+entry. A small LRU bound keeps large case300 models from piling up in
+long-lived worker processes.
+
+Usage:
+  from instance_cache import load_model
+
+  m = load_model(lp_path)          # fresh Model in PROBLEM stage
+  m.setRealParam("limits/time", 300.0)
+  m.optimize()
+
+Notes:
+  - Set parameters and include plugins on the returned Model; the copy takes
+    the source's (default) settings, so nothing leaks between configs.
+  - The copy's sub-SCIP depth is reset to 0, so plugins that behave
+    differently inside sub-SCIPs (symmetry handling, OBBT, ...) run exactly
+    as after readProblem().
+  - SCIP 7 has no binary problem format, so the cache lives in memory. Under
+    a process pool each worker parses an instance at most once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from pyscipopt import Model
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """Return the sha1 hex digest of a file's contents."""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class InstanceCache:
+    """
+    In-memory cache of parsed instances, keyed by content hash.
+
+    get(path) returns a new Model copied from the cached source problem.
+    """
+
+    def __init__(self, max_entries: int = 4):
+        self.max_entries = max(1, int(max_entries))
+        self._models: "OrderedDict[str, Model]" = OrderedDict()
+        # (path, size, mtime_ns) -> digest, so unchanged files are hashed once
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        self.n_parsed = 0
+        self.n_hits = 0
+
+    def digest(self, path: str) -> str:
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        d = self._digests.get(key)
+        if d is None:
+            d = file_digest(path)
+            self._digests[key] = d
+        return d
+
+    def _source(self, path: str) -> Model:
+        d = self.digest(path)
+        src = self._models.get(d)
+        if src is not None:
+            self._models.move_to_end(d)
+            self.n_hits += 1
+            return src
+
+        src = Model()
+        src.hideOutput(True)
+        src.readProblem(path)
+        self.n_parsed += 1
+
+        self._models[d] = src
+        while len(self._models) > self.max_entries:
+            self._models.popitem(last=False)
+        return src
+
+    def get(self, path: str, hide_output: bool = True) -> Model:
+        """Return a fresh, unsolved Model holding the original problem in `path`."""
+        src = self._source(path)
+        m = Model(problemName=Path(path).stem, sourceModel=src, origcopy=True, threadsafe=True)
+        # SCIPcopyOrig marks the copy as a sub-SCIP of src; solve it as a top-level problem
+        m.setSubscipDepth(0)
+        m.hideOutput(hide_output)
+        return m
+
+    def clear(self) -> None:
+        self._models.clear()
+        self._digests.clear()
+
+
+_DEFAULT_CACHE: Optional[InstanceCache] = None
+
+
+def get_cache() -> InstanceCache:
+    """Process-wide cache shared by load_model()."""
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = InstanceCache(max_entries=int(os.environ.get("UC_INSTANCE_CACHE_SIZE", "4")))
+    return _DEFAULT_CACHE
+
+
+def load_model(path: str, hide_output: bool = True, use_cache: bool = True) -> Model:
+    """
+    Return a fresh Model for the instance at `path`.
+
+    With use_cache=False this is a plain Model() + readProblem().
+    """
+    if not use_cache:
+        m = Model()
+        if hide_output:
+            m.hideOutput(True)
+        m.readProblem(path)
+        return m
+    return get_cache().get(path, hide_output=hide_output)
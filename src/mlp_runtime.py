@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+mlp_runtime.py
+
+NumPy forward pass for the small Linear+ReLU MLPs trained by
+train_cut_model.py and train_uc_k1_offline.py, plus an exporter from their
+torch checkpoints to .npz, so solve workers never import torch.
+
+A checkpoint ({"state_dict", "mu", "sd", "classes", ...}) is exported as
+  n_layers, W0, b0, W1, b1, ...   Linear weights (out, in) and biases, in order
+  mu, sd, classes                 when the checkpoint has them
+  meta                            JSON of the remaining scalar/list entries
+Hidden layers are followed by ReLU; Dropout is the identity at inference.
+
+Usage:
+  python src/mlp_runtime.py experiments/step7_cut_data/cut_model.pt [more.pt ...]
+
+  from mlp_runtime import load_mlp
+  net = load_mlp("cut_model.pt")     # uses cut_model.npz when it is up to date
+  scores = net((feats - net.mu) / (net.sd + 1e-8))[:, 0]
+
+Notes:
+  - load_mlp() still reads a .pt (importing torch) when no current .npz sits
+    next to it, so exporting is an optimization, not a requirement.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class NumpyMLP:
+    """
+    Feed-forward network: Linear layers with ReLU in between, float32.
+
+    layers: list of (W, b) with W of shape (out, in), as in torch.nn.Linear.
+    Calling the network on an (n, d_in) array returns (n, d_out); a 1D input
+    returns 1D output.
+    """
+
+    def __init__(
+        self,
+        layers: Sequence[Tuple[np.ndarray, np.ndarray]],
+        mu: Optional[np.ndarray] = None,
+        sd: Optional[np.ndarray] = None,
+        classes: Optional[List[str]] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ):
+        if not layers:
+            raise ValueError("NumpyMLP needs at least one layer")
+        self.layers = [(np.asarray(W, dtype=np.float32), np.asarray(b, dtype=np.float32).reshape(-1))
+                       for W, b in layers]
+        # transposed copies so the forward pass is a plain row-major matmul
+        self._wt = [np.ascontiguousarray(W.T) for W, _ in self.layers]
+        self.mu = None if mu is None else np.asarray(mu, dtype=np.float32)
+        self.sd = None if sd is None else np.asarray(sd, dtype=np.float32)
+        self.classes = None if classes is None else [str(c) for c in classes]
+        self.meta = dict(meta or {})
+
+    @property
+    def d_in(self) -> int:
+        return int(self.layers[0][0].shape[1])
+
+    @property
+    def d_out(self) -> int:
+        return int(self.layers[-1][0].shape[0])
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        h = np.asarray(x, dtype=np.float32)
+        single = h.ndim == 1
+        h = np.atleast_2d(h)
+        last = len(self.layers) - 1
+        for i, (wt, (_, b)) in enumerate(zip(self._wt, self.layers)):
+            h = h @ wt + b
+            if i < last:
+                np.maximum(h, 0.0, out=h)
+        return h[0] if single else h
+
+    def save(self, npz_path: str) -> None:
+        arrays: Dict[str, Any] = {"n_layers": np.int64(len(self.layers))}
+        for i, (W, b) in enumerate(self.layers):
+            arrays[f"W{i}"] = W
+            arrays[f"b{i}"] = b
+        if self.mu is not None:
+            arrays["mu"] = self.mu
+        if self.sd is not None:
+            arrays["sd"] = self.sd
+        if self.classes is not None:
+            arrays["classes"] = np.array(self.classes, dtype=str)
+        arrays["meta"] = np.array(json.dumps(self.meta))
+        np.savez(npz_path, **arrays)
+
+    @classmethod
+    def from_npz(cls, npz_path: str) -> "NumpyMLP":
+        with np.load(npz_path, allow_pickle=False) as z:
+            n = int(z["n_layers"])
+            layers = [(z[f"W{i}"], z[f"b{i}"]) for i in range(n)]
+            mu = z["mu"] if "mu" in z.files else None
+            sd = z["sd"] if "sd" in z.files else None
+            classes = z["classes"].tolist() if "classes" in z.files else None
+            meta = json.loads(str(z["meta"])) if "meta" in z.files else {}
+        return cls(layers, mu=mu, sd=sd, classes=classes, meta=meta)
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    """Softmax over the last axis."""
+    z = np.asarray(logits, dtype=np.float64)
+    ex = np.exp(z - z.max(axis=-1, keepdims=True))
+    return ex / ex.sum(axis=-1, keepdims=True)
+
+
+def _layer_sort_key(key: str) -> Tuple:
+    # "net.10.weight" after "net.4.weight"
+    return tuple((0, int(p), "") if p.isdigit() else (1, 0, p) for p in key.split("."))
+
+
+def _linear_layers(state: Dict[str, Any]) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """(W, b) of every Linear layer in a state_dict, in module order."""
+    keys = sorted((k for k in state if k.endswith(".weight") and getattr(state[k], "ndim", 0) == 2),
+                  key=_layer_sort_key)
+    if not keys:
+        raise RuntimeError("No 2D weight matrices found in model state_dict.")
+    layers = []
+    for k in keys:
+        W = state[k].detach().cpu().numpy() if hasattr(state[k], "detach") else np.asarray(state[k])
+        bk = k[: -len("weight")] + "bias"
+        if bk in state:
+            b = state[bk].detach().cpu().numpy() if hasattr(state[bk], "detach") else np.asarray(state[bk])
+        else:
+            b = np.zeros(W.shape[0], dtype=np.float32)
+        layers.append((W, b))
+    for i in range(1, len(layers)):
+        if layers[i][0].shape[1] != layers[i - 1][0].shape[0]:
+            raise RuntimeError(f"Linear layers do not chain: {keys[i - 1]} -> {keys[i]}")
+    return layers
+
+
+def mlp_from_checkpoint(model_pt: str) -> NumpyMLP:
+    """Read a torch checkpoint (imports torch) into a NumpyMLP."""
+    import torch
+
+    ckpt = torch.load(model_pt, map_location="cpu")
+    if isinstance(ckpt, dict) and "state_dict" in ckpt:
+        state = ckpt["state_dict"]
+    else:
+        state, ckpt = ckpt, {}
+    if not isinstance(state, dict):
+        raise RuntimeError("model.pt did not contain a state_dict-like object.")
+
+    meta = {k: v for k, v in ckpt.items()
+            if k not in ("state_dict", "mu", "sd", "classes")
+            and isinstance(v, (int, float, str, bool, list, type(None)))}
+    return NumpyMLP(
+        _linear_layers(state),
+        mu=ckpt.get("mu"),
+        sd=ckpt.get("sd"),
+        classes=ckpt.get("classes"),
+        meta=meta,
+    )
+
+
+def export_checkpoint(model_pt: str, npz_path: Optional[str] = None) -> str:
+    """Convert a .pt checkpoint to .npz (default: same path, .npz suffix). Returns the .npz path."""
+    npz_path = str(npz_path or Path(model_pt).with_suffix(".npz"))
+    mlp_from_checkpoint(model_pt).save(npz_path)
+    return npz_path
+
+
+def load_mlp(path: str) -> NumpyMLP:
+    """
+    Load an exported .npz, or for a .pt the .npz next to it if that is at
+    least as new; otherwise fall back to reading the checkpoint with torch.
+    """
+    p = Path(path)
+    if p.suffix == ".npz":
+        return NumpyMLP.from_npz(str(p))
+    npz = p.with_suffix(".npz")
+    if npz.exists() and (not p.exists() or npz.stat().st_mtime >= p.stat().st_mtime):
+        return NumpyMLP.from_npz(str(npz))
+    return mlp_from_checkpoint(str(p))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Export torch MLP checkpoints to .npz for NumPy inference")
+    ap.add_argument("model_pt", nargs="+")
+    ap.add_argument("--out", default=None, help="Output path (only with a single checkpoint)")
+    args = ap.parse_args()
+    if args.out and len(args.model_pt) > 1:
+        ap.error("--out needs exactly one checkpoint")
+
+    for pt in args.model_pt:
+        out = export_checkpoint(pt, args.out)
+        net = NumpyMLP.from_npz(out)
+        sizes = [net.d_in] + [W.shape[0] for W, _ in net.layers]
+        print(f"{pt} -> {out}  layers={'x'.join(map(str, sizes))}"
+              + (f"  classes={len(net.classes)}" if net.classes else ""))
+
+
+if __name__ == "__main__":
+    main()
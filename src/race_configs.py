@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+race_configs.py
+
+Successive-halving race over the separator on/off space (2^8 configs over
+collect_uc_times.SEPAS), instead of running a hand-picked CONFIGS list on
+every instance.
+
+Rung r solves the surviving configs (and the all_on baseline) on the first
+  initial_instances * instance_growth^r   instances of a shuffled manifest
+with a time limit of
+  min(max_time_limit, initial_time_limit * time_growth^r)
+and computes delta = (t_all_on - t) / t_all_on per instance, as in
+build_subset_A.py. A config is then eliminated when
+  - a one-sided paired Wilcoxon signed-rank test says the current leader
+    (highest mean delta) beats it at level --alpha, after a Holm correction
+    over all of the rung's comparisons against the leader, or
+  - it falls outside the best ceil(n_alive / eta) by mean delta
+    (successive halving; --eta 1 keeps only the statistical eliminations).
+At least --min-survivors configs are promoted, and the race stops once no
+more than that are left or after --rungs rungs.
+
+Writes:
+  experiments/step3_race/
+    configs.json          every candidate config (same shape as CONFIGS)
+    results.sqlite        every run, plus "rung" (results_store.py)
+    results.csv           exported view, collect_uc_times.py schema
+    results.jsonl         exported view
+    results_final.jsonl   the last rung only: survivors + all_on, one time limit
+    race_log.json         per-rung sizes, limits, eliminations and p-values
+
+results_final.jsonl is what build_subset_A.py should read: all of its rows
+share instances and time limit, so the delta matrix has no holes.
+
+Usage:
+  python src/race_configs.py \
+    --manifest data/instances/manifest.json \
+    --outdir experiments/step3_race \
+    --initial-instances 8 --initial-time-limit 30 --max-time-limit 300 \
+    --workers 8
+
+  python src/build_subset_A.py --results-jsonl experiments/step3_race/results_final.jsonl
+
+Notes:
+  - Configs from CONFIGS keep their config_id and name; the others get
+    config_id = CONFIG_ID_OFFSET + bitmask over SEPAS and a name joining
+    their enabled separators.
+  - --sample N races N configs (always including CONFIGS) instead of all 256.
+  - A rerun with the same arguments takes every solve from the solve cache
+    (solve_cache.py); there is no separate resume logic.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from collect_uc_times import CONFIGS, FIELDNAMES, SEPAS, run_task
+from results_store import ResultsStore
+from solve_cache import add_solve_cache_args, solve_cache_from_args
+from utils import multiprocess_unordered
+
+
+BASELINE = "all_on"
+CONFIG_ID_OFFSET = 1000
+# largest number of non-zero differences for which the exact null distribution is used
+EXACT_MAX_N = 25
+
+
+# -----------------------------
+# Config space
+# -----------------------------
+
+def config_mask(sepa_freq: Dict[str, int]) -> int:
+    return sum(1 << i for i, s in enumerate(SEPAS) if int(sepa_freq.get(s, 0)) > 0)
+
+
+def config_from_mask(mask: int) -> Dict[str, Any]:
+    on = [s for i, s in enumerate(SEPAS) if mask >> i & 1]
+    if not on:
+        name = "all_off"
+    elif len(on) == len(SEPAS):
+        name = "all_on"
+    else:
+        name = "+".join(on)
+    return {
+        "config_id": CONFIG_ID_OFFSET + mask,
+        "name": name,
+        "sepa_freq": {s: int(mask >> i & 1) for i, s in enumerate(SEPAS)},
+    }
+
+
+def build_config_space(sample: Optional[int], rng: random.Random) -> List[Dict[str, Any]]:
+    """
+    All 2^len(SEPAS) configs, or CONFIGS plus a random sample of the rest
+    up to `sample` in total. Configs of CONFIGS keep their id and name.
+    """
+    named = {config_mask(c["sepa_freq"]): c for c in CONFIGS}
+    masks = list(range(1 << len(SEPAS)))
+    if sample is not None and sample < len(masks):
+        rest = [mk for mk in masks if mk not in named]
+        masks = sorted(set(named) | set(rng.sample(rest, max(0, sample - len(named)))))
+    return [dict(named[mk]) if mk in named else config_from_mask(mk) for mk in masks]
+
+
+# -----------------------------
+# Rank test
+# -----------------------------
+
+def _average_ranks(a: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Ranks (1-based, ties averaged) and the sizes of the tie groups."""
+    order = np.argsort(a, kind="mergesort")
+    s = a[order]
+    ranks = np.empty(len(a), dtype=np.float64)
+    ties = []
+    i = 0
+    while i < len(s):
+        j = i
+        while j + 1 < len(s) and s[j + 1] == s[i]:
+            j += 1
+        ranks[order[i:j + 1]] = 0.5 * (i + j) + 1.0
+        ties.append(j - i + 1)
+        i = j + 1
+    return ranks, np.asarray(ties, dtype=np.float64)
+
+
+def wilcoxon_greater(x, y, zero_tol: float = 1e-12) -> float:
+    """
+    One-sided p-value of the paired Wilcoxon signed-rank test for
+    H1: x tends to be larger than y. Zero differences are dropped; the null
+    distribution is exact (ties included) for up to EXACT_MAX_N pairs and the
+    tie-corrected normal approximation above that.
+    """
+    d = np.asarray(x, dtype=np.float64) - np.asarray(y, dtype=np.float64)
+    d = d[np.abs(d) > zero_tol]
+    n = len(d)
+    if n == 0:
+        return 1.0
+    ranks, ties = _average_ranks(np.abs(d))
+    w_plus = float(ranks[d > 0].sum())
+
+    if n <= EXACT_MAX_N:
+        # tied ranks are multiples of 1/2, so count sign assignments over doubled ranks
+        r2 = np.rint(2.0 * ranks).astype(np.int64)
+        total = int(r2.sum())
+        counts = np.zeros(total + 1, dtype=np.float64)
+        counts[0] = 1.0
+        for r in r2:
+            shifted = np.zeros_like(counts)
+            shifted[r:] = counts[:total + 1 - r]
+            counts += shifted
+        k = int(np.rint(2.0 * w_plus))
+        return float(counts[k:].sum() / counts.sum())
+
+    mean = n * (n + 1) / 4.0
+    var = n * (n + 1) * (2 * n + 1) / 24.0 - float(np.sum(ties ** 3 - ties)) / 48.0
+    if var <= 0:
+        return 1.0
+    z = (w_plus - mean - 0.5) / math.sqrt(var)
+    return 0.5 * math.erfc(z / math.sqrt(2.0))
+
+
+def holm_adjust(pvals) -> np.ndarray:
+    """Holm step-down adjusted p-values (family-wise error control over all tests)."""
+    p = np.asarray(pvals, dtype=np.float64)
+    m = len(p)
+    order = np.argsort(p, kind="mergesort")
+    adj = np.empty(m)
+    running = 0.0
+    for i, j in enumerate(order):
+        running = max(running, min(1.0, (m - i) * p[j]))
+        adj[j] = running
+    return adj
+
+
+# -----------------------------
+# Racing
+# -----------------------------
+
+def delta_matrix(rows: List[Dict[str, Any]], instances: List[str], config_ids: List[int],
+                 baseline_id: int) -> np.ndarray:
+    """(n_instances, n_configs) delta vs the baseline; instances without a usable baseline are NaN."""
+    t = {(r["instance_name"], int(r["config_id"])): r["solve_time_sec"] for r in rows}
+    out = np.full((len(instances), len(config_ids)), np.nan)
+    for i, name in enumerate(instances):
+        base = t.get((name, baseline_id))
+        if base is None or float(base) <= 0:
+            continue
+        for j, cid in enumerate(config_ids):
+            v = t.get((name, cid))
+            if v is not None:
+                out[i, j] = (float(base) - float(v)) / float(base)
+    return out
+
+
+def eliminate(delta: np.ndarray, config_ids: List[int], alpha: float, eta: float,
+              min_survivors: int) -> Tuple[List[int], Dict[int, Dict[str, Any]]]:
+    """
+    Survivors of one rung (best mean delta first) and, per config, its mean
+    delta, p-value against the leader (raw and Holm-adjusted over the rung's
+    comparisons) and why it was dropped (if it was). A config is dominated
+    when its adjusted p-value is below alpha.
+    """
+    delta = delta[~np.isnan(delta).any(axis=1)]
+    mean = delta.mean(axis=0) if len(delta) else np.zeros(len(config_ids))
+    order = [int(j) for j in np.argsort(-mean, kind="mergesort")]
+    leader = order[0]
+
+    others = order[1:]
+    raw = [wilcoxon_greater(delta[:, leader], delta[:, j]) for j in others]
+    adjusted = holm_adjust(raw) if others else np.zeros(0)
+    info: Dict[int, Dict[str, Any]] = {
+        config_ids[leader]: {"mean_delta": float(mean[leader]), "p_vs_leader": 1.0,
+                             "p_adjusted": 1.0, "dropped": None},
+    }
+    for j, p, p_adj in zip(others, raw, adjusted):
+        info[config_ids[j]] = {"mean_delta": float(mean[j]), "p_vs_leader": p,
+                               "p_adjusted": float(p_adj), "dropped": None}
+
+    keep = max(min_survivors, int(math.ceil(len(order) / eta)))
+    survivors = []
+    for pos, j in enumerate(order):
+        cid = config_ids[j]
+        if pos < min_survivors:
+            survivors.append(cid)
+        elif info[cid]["p_adjusted"] < alpha:
+            info[cid]["dropped"] = "dominated"
+        elif len(survivors) >= keep:
+            info[cid]["dropped"] = "halving"
+        else:
+            survivors.append(cid)
+    return survivors, info
+
+
+def load_instances(manifest_path: Path) -> List[Dict[str, Any]]:
+    with open(manifest_path, "r") as f:
+        manifest = json.load(f)
+    inst_dir = manifest_path.parent
+    out = []
+    for entry in manifest:
+        lp_path = str(inst_dir / entry["lp"])
+        if not Path(lp_path).exists():
+            print(f"[WARN] missing lp: {lp_path}, skipping")
+            continue
+        out.append({
+            "instance_name": Path(entry["lp"]).stem,
+            "case": entry.get("case", None),
+            "lp_path": lp_path,
+            "sidecar_path": str(inst_dir / entry["sidecar"]),
+        })
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--manifest", required=True, help="Path to manifest.json")
+    ap.add_argument("--outdir", default="experiments/step3_race", help="Output folder")
+    ap.add_argument("--sample", type=int, default=None,
+                    help="Race this many configs (CONFIGS + random others) instead of all 2^8")
+    ap.add_argument("--rungs", type=int, default=4, help="Maximum number of rungs")
+    ap.add_argument("--initial-instances", type=int, default=8, help="Instances in the first rung")
+    ap.add_argument("--instance-growth", type=float, default=2.0, help="Instance count factor per rung")
+    ap.add_argument("--initial-time-limit", type=float, default=30.0, help="Time limit of the first rung (sec)")
+    ap.add_argument("--time-growth", type=float, default=2.0, help="Time limit factor per rung")
+    ap.add_argument("--max-time-limit", type=float, default=300.0, help="Upper bound on the time limit (sec)")
+    ap.add_argument("--eta", type=float, default=2.0,
+                    help="Keep at most ceil(n / eta) configs per rung (1 = statistical elimination only)")
+    ap.add_argument("--alpha", type=float, default=0.05, help="Family-wise level (Holm) of the rank tests against the leader")
+    ap.add_argument("--min-survivors", type=int, default=3, help="Never promote fewer configs than this")
+    ap.add_argument("--node-limit", type=int, default=None, help="Optional node limit per run")
+    ap.add_argument("--maxroundsroot", type=int, default=10, help="SCIP separating/maxroundsroot")
+    ap.add_argument("--maxrounds", type=int, default=10, help="SCIP separating/maxrounds")
+    ap.add_argument("--seed", type=int, default=0, help="Seed for the instance order and config sample")
+    ap.add_argument("--workers", type=int, default=1, help="Number of solver processes (1 = serial)")
+    ap.add_argument("--threads-per-solve", type=int, default=None,
+                    help="SCIP lp/threads per solve (default: SCIP default when serial, 1 when --workers > 1)")
+    ap.add_argument("--thread-pool", action="store_true",
+                    help="Run --workers as threads in this process instead of separate processes")
+    add_solve_cache_args(ap)
+    args = ap.parse_args()
+    if args.eta < 1.0:
+        ap.error("--eta must be >= 1")
+    cache = solve_cache_from_args(args)
+
+    threads = args.threads_per_solve
+    if threads is None and args.workers > 1:
+        threads = 1
+
+    manifest_path = Path(args.manifest)
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"manifest not found: {manifest_path}")
+    outdir = Path(args.outdir)
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    rng = random.Random(args.seed)
+    instances = load_instances(manifest_path)
+    rng.shuffle(instances)
+
+    configs = build_config_space(args.sample, rng)
+    by_id = {c["config_id"]: c for c in configs}
+    baseline_id = next(c["config_id"] for c in configs if c["name"] == BASELINE)
+    with open(outdir / "configs.json", "w") as f:
+        json.dump(configs, f, indent=2)
+
+    csv_path = outdir / "results.csv"
+    jsonl_path = outdir / "results.jsonl"
+    store = ResultsStore(str(outdir / "results.sqlite"), fieldnames=FIELDNAMES)
+    store.clear()
+    alive = [c["config_id"] for c in configs]
+    log: List[Dict[str, Any]] = []
+    total_runs = 0
+
+    for rung in range(args.rungs):
+        n_inst = min(len(instances), int(round(args.initial_instances * args.instance_growth ** rung)))
+        time_limit = min(args.max_time_limit, args.initial_time_limit * args.time_growth ** rung)
+        run_ids = alive if baseline_id in alive else alive + [baseline_id]
+        print(f"[RUNG {rung}] {len(alive)} configs x {n_inst} instances, time limit {time_limit:g}s")
+
+        tasks = [{
+            **inst,
+            "config_id": cid,
+            "config_name": by_id[cid]["name"],
+            "sepa_freq": by_id[cid]["sepa_freq"],
+            "time_limit": time_limit,
+            "node_limit": args.node_limit,
+            "maxroundsroot": args.maxroundsroot,
+            "maxrounds": args.maxrounds,
+            "threads": threads,
+            "solve_cache": str(cache.cache_dir) if cache is not None else None,
+            "force_resolve": args.force_resolve,
+        } for inst in instances[:n_inst] for cid in run_ids]
+
+        rung_rows = []
+        for row in multiprocess_unordered(run_task, tasks, cpus=args.workers, threads=args.thread_pool):
+            row["rung"] = rung
+            rung_rows.append(row)
+            store.append(row)
+            total_runs += 1
+            print(f"[DONE {len(rung_rows)}/{len(tasks)}] {row['instance_name']} | {row['config_name']} "
+                  f"| {row['status']} | {row['solve_time_sec']}")
+
+        names = [inst["instance_name"] for inst in instances[:n_inst]]
+        survivors, info = eliminate(delta_matrix(rung_rows, names, alive, baseline_id), alive,
+                                    alpha=args.alpha, eta=args.eta, min_survivors=args.min_survivors)
+        exhausted = n_inst == len(instances) and time_limit >= args.max_time_limit
+        last = len(survivors) <= args.min_survivors or rung == args.rungs - 1 or exhausted
+        log.append({
+            "rung": rung,
+            "n_instances": n_inst,
+            "time_limit": time_limit,
+            "n_configs": len(alive),
+            "n_survivors": len(survivors),
+            "configs": {by_id[cid]["name"]: v for cid, v in info.items()},
+        })
+        print(f"[RUNG {rung}] {len(survivors)} survive; leader {by_id[survivors[0]]['name']} "
+              f"(mean delta {info[survivors[0]]['mean_delta']:.4f})")
+        alive = survivors
+        if last:
+            break
+
+    store.export_csv(str(csv_path), FIELDNAMES)
+    store.export_jsonl(str(jsonl_path))
+    final_path = outdir / "results_final.jsonl"
+    store.export_jsonl(str(final_path), where={"rung": rung, "config_id": sorted(set(alive) | {baseline_id})})
+
+    full_grid = len(configs) * len(instances)
+    with open(outdir / "race_log.json", "w") as f:
+        json.dump({
+            "args": vars(args),
+            "n_candidates": len(configs),
+            "n_instances": len(instances),
+            "n_runs": total_runs,
+            "full_grid_runs": full_grid,
+            "survivors": [by_id[cid]["name"] for cid in alive],
+            "rungs": log,
+        }, f, indent=2)
+
+    print(f"\nDone. {total_runs} runs ({full_grid} for the full grid at the largest limit). Survivors:")
+    for cid in alive:
+        print(f"  {by_id[cid]['name']}")
+    print(f"  {store.path}")
+    print(f"  {jsonl_path}")
+    print(f"  {final_path}")
+    print(f"  {outdir / 'race_log.json'}")
+
+
+if __name__ == "__main__":
+    main()
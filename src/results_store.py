@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+results_store.py
+
+SQLite-backed store for the per-run result rows that collect_uc_times.py,
+race_configs.py, run_improved.py and run_with_ucb.py produce, replacing the
+append-only results.csv + results.jsonl pair as the primary record. The CSV
+and JSONL files are still written, as views exported from the store.
+
+Layout of a store file (results.sqlite):
+  results    one row per run, one column per field; columns are added the
+             first time a row carries a new field. dict/list values are
+             stored as JSON text, everything else as SQLite scalars.
+  columns    field name -> kind ("json", "bool" or the scalar type), so
+             rows read back with the same Python types they were written
+             with, and whether it is one of the writer's base fields
+Rows are indexed by instance_name and, when present, (instance_name, config_id).
+
+Concurrency:
+  The database runs in WAL mode with a busy timeout, so worker processes (or
+  threads, each gets its own connection) can append to the same file while
+  others read it. A store object pickles as just its path.
+
+Reads:
+  where= filters are translated to SQL, so only matching rows are decoded:
+    {"status": "optimal"}                     equality
+    {"config_name": ["all_on", "all_off"]}    membership (list/tuple/set)
+    {"solve_time_sec": ("<", 10.0)}           comparison (<, <=, >, >=, !=)
+  columns= limits which fields are returned.
+
+Usage:
+  from results_store import ResultsStore, load_results
+
+  store = ResultsStore("experiments/step3_collect_time/results.sqlite")
+  store.append(row)
+  rows = store.get("uc_case1_0003", config_id=4)
+  df = load_results("experiments/step3_collect_time/results.sqlite",
+                    columns=["instance_name", "config_name", "solve_time_sec"],
+                    where={"status": ["optimal", "timelimit"]})
+
+  python src/results_store.py import experiments/step3_collect_time/results.jsonl
+  python src/results_store.py export experiments/step3_collect_time/results.sqlite
+
+Notes:
+  - load_results() / iter_results() also accept a results.jsonl or
+    results.csv path (applying where= in Python), so every reader works on
+    stores and on existing files alike.
+  - Exported JSONL rows leave out extra fields that are NULL (e.g. cap_sec on
+    an uncapped run), so they match what the scripts used to append.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+TABLE = "results"
+COLUMNS_TABLE = "columns"
+STORE_SUFFIXES = {".sqlite", ".sqlite3", ".db"}
+BUSY_TIMEOUT_SEC = 60.0
+
+_OPS = {"<", "<=", ">", ">=", "!=", "="}
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _kind(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (dict, list, tuple)):
+        return "json"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    return "str"
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value)
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    return str(value)
+
+
+def _decode(value: Any, kind: Optional[str]) -> Any:
+    if value is None:
+        return None
+    if kind == "json":
+        return json.loads(value)
+    if kind == "bool":
+        return bool(value)
+    return value
+
+
+def _where_sql(where: Optional[Dict[str, Any]]) -> tuple[str, list]:
+    if not where:
+        return "", []
+    parts, params = [], []
+    for col, cond in where.items():
+        if isinstance(cond, (list, set, frozenset)):
+            vals = [_encode(v) for v in cond]
+            if not vals:
+                parts.append("0")
+                continue
+            parts.append(f"{_quote(col)} IN ({', '.join('?' * len(vals))})")
+            params.extend(vals)
+        elif isinstance(cond, tuple) and len(cond) == 2 and cond[0] in _OPS:
+            parts.append(f"{_quote(col)} {cond[0]} ?")
+            params.append(_encode(cond[1]))
+        elif cond is None:
+            parts.append(f"{_quote(col)} IS NULL")
+        else:
+            parts.append(f"{_quote(col)} = ?")
+            params.append(_encode(cond))
+    return " WHERE " + " AND ".join(parts), params
+
+
+def _match(row: Dict[str, Any], where: Optional[Dict[str, Any]]) -> bool:
+    """Python version of _where_sql, for rows read from JSONL/CSV."""
+    for col, cond in (where or {}).items():
+        v = row.get(col)
+        if isinstance(cond, (list, set, frozenset)):
+            if v not in cond:
+                return False
+        elif isinstance(cond, tuple) and len(cond) == 2 and cond[0] in _OPS:
+            op, ref = cond
+            if v is None:
+                return False
+            ok = {"<": v < ref, "<=": v <= ref, ">": v > ref, ">=": v >= ref,
+                  "!=": v != ref, "=": v == ref}[op]
+            if not ok:
+                return False
+        elif v != cond:
+            return False
+    return True
+
+
+class ResultsStore:
+    """
+    Result rows in one SQLite file.
+
+    store = ResultsStore(path, fieldnames=FIELDNAMES)   # create or reopen
+    store.append(row)                                    # dict of field -> value
+    for row in store.rows(where={"config_name": "all_on"}): ...
+
+    fieldnames, if given, are created up front as base fields, which always
+    appear in exported rows (also after reopening the store); fields first
+    seen later are added as columns on demand.
+    """
+
+    def __init__(self, path: str, fieldnames: Optional[Sequence[str]] = None):
+        self.path = str(path)
+        self.base_fields: List[str] = []
+        self._local = threading.local()
+        self._kinds: Dict[str, Optional[str]] = {}
+        self._order: List[str] = []
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._conn()
+        with conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {TABLE} (_id INTEGER PRIMARY KEY AUTOINCREMENT)")
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {_quote(COLUMNS_TABLE)} "
+                         f"(name TEXT PRIMARY KEY, kind TEXT, base INTEGER DEFAULT 0)")
+        self._refresh()
+        if fieldnames:
+            self._ensure_columns({f: None for f in fieldnames})
+            with conn:
+                conn.executemany(f"INSERT OR IGNORE INTO {_quote(COLUMNS_TABLE)} (name) VALUES (?)",
+                                 [(f,) for f in fieldnames])
+                conn.executemany(f"UPDATE {_quote(COLUMNS_TABLE)} SET base = 1 WHERE name = ?",
+                                 [(f,) for f in fieldnames])
+            self._refresh()
+
+    # pickles as its path, so it can be handed to worker processes
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SEC)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _refresh(self) -> None:
+        conn = self._conn()
+        cols = [r[1] for r in conn.execute(f"PRAGMA table_info({TABLE})") if r[1] != "_id"]
+        meta = {name: (kind, base) for name, kind, base in
+                conn.execute(f"SELECT name, kind, base FROM {_quote(COLUMNS_TABLE)}")}
+        self._order = cols
+        self._kinds = {c: meta.get(c, (None, 0))[0] for c in cols}
+        self.base_fields = [c for c in cols if meta.get(c, (None, 0))[1]]
+        self._ensure_indexes()
+
+    def _ensure_indexes(self) -> None:
+        conn = self._conn()
+        with conn:
+            if "instance_name" in self._kinds:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{TABLE}_instance ON {TABLE}(instance_name)")
+            if "instance_name" in self._kinds and "config_id" in self._kinds:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{TABLE}_pair ON {TABLE}(instance_name, config_id)")
+
+    def _ensure_columns(self, row: Dict[str, Any]) -> None:
+        """Add missing columns and record the kind of columns seen with a value for the first time."""
+        new_cols = [k for k in row if k not in self._kinds]
+        new_kinds = {k: _kind(v) for k, v in row.items() if self._kinds.get(k) is None and _kind(v) is not None}
+        if not new_cols and not new_kinds:
+            return
+        conn = self._conn()
+        with conn:
+            for k in new_cols:
+                try:
+                    conn.execute(f"ALTER TABLE {TABLE} ADD COLUMN {_quote(k)}")
+                except sqlite3.OperationalError as e:
+                    # another writer added it first
+                    if "duplicate column" not in str(e):
+                        raise
+            for k, kind in new_kinds.items():
+                conn.execute(f"INSERT OR IGNORE INTO {_quote(COLUMNS_TABLE)} (name, kind) VALUES (?, ?)", (k, kind))
+                conn.execute(f"UPDATE {_quote(COLUMNS_TABLE)} SET kind = ? WHERE name = ? AND kind IS NULL",
+                             (kind, k))
+        self._refresh()
+
+    # -----------------------------
+    # Writes
+    # -----------------------------
+
+    def append(self, row: Dict[str, Any]) -> None:
+        self.append_many([row])
+
+    def append_many(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Insert rows in one transaction; returns how many were written."""
+        rows = list(rows)
+        for row in rows:
+            self._ensure_columns(row)
+        conn = self._conn()
+        with conn:
+            for row in rows:
+                cols = list(row)
+                conn.execute(
+                    f"INSERT INTO {TABLE} ({', '.join(_quote(c) for c in cols)}) "
+                    f"VALUES ({', '.join('?' * len(cols))})",
+                    [_encode(row[c]) for c in cols],
+                )
+        return len(rows)
+
+    def clear(self) -> None:
+        """Delete every row (the columns are kept)."""
+        conn = self._conn()
+        with conn:
+            conn.execute(f"DELETE FROM {TABLE}")
+
+    def import_jsonl(self, jsonl_path: str) -> int:
+        """Append the rows of a results.jsonl (skipping a truncated last line)."""
+        return self.append_many(_read_jsonl(jsonl_path))
+
+    # -----------------------------
+    # Reads
+    # -----------------------------
+
+    def __len__(self) -> int:
+        return int(self._conn().execute(f"SELECT COUNT(*) FROM {TABLE}").fetchone()[0])
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self._order)
+
+    def rows(self, columns: Optional[Sequence[str]] = None,
+             where: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Rows in insertion order, as dicts of the requested columns (default: all)."""
+        self._refresh()
+        cols = [c for c in (columns or self._order) if c in self._kinds]
+        if not cols or set(where or {}) - set(self._kinds):
+            # filtering on a field no row ever had matches nothing
+            return iter(())
+        clause, params = _where_sql(where)
+        cur = self._conn().execute(
+            f"SELECT {', '.join(_quote(c) for c in cols)} FROM {TABLE}{clause} ORDER BY _id", params)
+        kinds = [self._kinds[c] for c in cols]
+        return ({c: _decode(v, k) for c, v, k in zip(cols, r, kinds)} for r in cur)
+
+    def get(self, instance_name: str, config_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """All rows of an instance (and config), via the index."""
+        where: Dict[str, Any] = {"instance_name": instance_name}
+        if config_id is not None:
+            where["config_id"] = int(config_id)
+        return list(self.rows(where=where))
+
+    def pairs(self) -> set:
+        """{(instance_name, config_id)} of every stored row."""
+        if "config_id" not in self._kinds:
+            self._refresh()
+        if "config_id" not in self._kinds:
+            return set()
+        cur = self._conn().execute(f"SELECT DISTINCT instance_name, config_id FROM {TABLE}")
+        return {(name, int(cid)) for name, cid in cur if cid is not None}
+
+    def to_frame(self, columns: Optional[Sequence[str]] = None, where: Optional[Dict[str, Any]] = None):
+        import pandas as pd
+        return pd.DataFrame(list(self.rows(columns=columns, where=where)),
+                            columns=[c for c in (columns or self.fields) if c in self._kinds])
+
+    # -----------------------------
+    # Views
+    # -----------------------------
+
+    def export_jsonl(self, jsonl_path: str, where: Optional[Dict[str, Any]] = None) -> int:
+        """Write the rows as JSON lines (atomically); returns the row count."""
+        keep = set(self.base_fields)
+        n = 0
+        tmp = f"{jsonl_path}.tmp"
+        with open(tmp, "w") as f:
+            for row in self.rows(where=where):
+                f.write(json.dumps({k: v for k, v in row.items() if v is not None or k in keep}) + "\n")
+                n += 1
+        os.replace(tmp, jsonl_path)
+        return n
+
+    def export_csv(self, csv_path: str, fieldnames: Optional[Sequence[str]] = None,
+                   where: Optional[Dict[str, Any]] = None) -> int:
+        """Write the rows as CSV with the given columns (default: base fields, else all)."""
+        fieldnames = list(fieldnames or self.base_fields or self.fields)
+        n = 0
+        tmp = f"{csv_path}.tmp"
+        with open(tmp, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            for row in self.rows(columns=fieldnames, where=where):
+                writer.writerow({k: json.dumps(v) if isinstance(v, (dict, list)) else v for k, v in row.items()})
+                n += 1
+        os.replace(tmp, csv_path)
+        return n
+
+
+# -----------------------------
+# Reading any results file
+# -----------------------------
+
+def is_store_path(path: str) -> bool:
+    return Path(path).suffix.lower() in STORE_SUFFIXES
+
+
+def _read_jsonl(jsonl_path: str) -> Iterator[Dict[str, Any]]:
+    with open(jsonl_path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def iter_results(path: str, columns: Optional[Sequence[str]] = None,
+                 where: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Result rows of a store (.sqlite/.db), results.jsonl or results.csv, filtered
+    by where= (pushed into SQL for a store) and restricted to columns=.
+    """
+    path = str(path)
+    if is_store_path(path):
+        yield from ResultsStore(path).rows(columns=columns, where=where)
+        return
+    if path.endswith(".csv"):
+        import pandas as pd
+        source = pd.read_csv(path).to_dict("records")
+    else:
+        source = _read_jsonl(path)
+    for row in source:
+        if _match(row, where):
+            yield row if columns is None else {c: row.get(c) for c in columns}
+
+
+def load_results(path: str, columns: Optional[Sequence[str]] = None,
+                 where: Optional[Dict[str, Any]] = None):
+    """iter_results() as a pandas DataFrame (read_csv dtypes for a .csv)."""
+    import pandas as pd
+
+    path = str(path)
+    if is_store_path(path):
+        return ResultsStore(path).to_frame(columns=columns, where=where)
+    if path.endswith(".csv") and not where:
+        df = pd.read_csv(path)
+        return df if columns is None else df[[c for c in columns if c in df.columns]]
+    return pd.DataFrame(list(iter_results(path, columns=columns, where=where)))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Import results.jsonl into a store, or export a store's views")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    imp = sub.add_parser("import", help="results.jsonl -> results.sqlite (next to it unless --store)")
+    imp.add_argument("jsonl")
+    imp.add_argument("--store", default=None)
+    exp = sub.add_parser("export", help="results.sqlite -> results.jsonl + results.csv")
+    exp.add_argument("store")
+    exp.add_argument("--jsonl", default=None)
+    exp.add_argument("--csv", default=None)
+    exp.add_argument("--fields", default=None, help="Comma-separated CSV columns (default: all)")
+    args = ap.parse_args()
+
+    if args.cmd == "import":
+        store_path = args.store or str(Path(args.jsonl).with_suffix(".sqlite"))
+        n = ResultsStore(store_path).import_jsonl(args.jsonl)
+        print(f"{args.jsonl} -> {store_path}: {n} rows")
+    else:
+        store = ResultsStore(args.store)
+        base = Path(args.store).with_suffix("")
+        jsonl_path = args.jsonl or f"{base}.jsonl"
+        csv_path = args.csv or f"{base}.csv"
+        n = store.export_jsonl(jsonl_path)
+        store.export_csv(csv_path, args.fields.split(",") if args.fields else None)
+        print(f"{args.store} -> {jsonl_path}, {csv_path}: {n} rows")
+
+
+if __name__ == "__main__":
+    main()
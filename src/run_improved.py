@@ -10,7 +10,8 @@ Runs four solves per instance:
   3. cut_filter — Cut quality filtering (top-k cuts per round)
   4. combined   — UC-aware branching + cut quality filtering
 
-Reports delta vs all_on for each strategy.
+Reports delta vs all_on for each strategy. all_on results come from the
+solve cache (solve_cache.py) when present; --force-resolve re-measures them.
 
 Usage:
   python src/run_improved.py \\
@@ -31,7 +32,6 @@ With trained cut ML model:
 from __future__ import annotations
 
 import argparse
-import csv
 import json
 import time
 from pathlib import Path
@@ -40,16 +40,19 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 from pyscipopt import Model
 
+from instance_cache import load_model
+from results_store import ResultsStore
+from solve_cache import SolveCache, add_solve_cache_args, solve_cache_from_args
 from uc_branch import UCBranchrule, make_model_with_uc_branch
-from cut_quality_sepa import CutQualitySepa, make_model_with_cut_filter
+from cut_quality_sepa import include_cut_filter, make_model_with_cut_filter
 
 
-def solve_all_on(lp_path: str, time_limit: int) -> Dict[str, Any]:
-    """SCIP default: all separators on."""
-    m = Model()
-    m.hideOutput(True)
+def solve_all_on(lp_path: str, time_limit: int, cache: Optional[SolveCache] = None) -> Dict[str, Any]:
+    """SCIP default: all separators on. Taken from cache when given and present."""
+    m = load_model(lp_path)
     m.setRealParam("limits/time", float(time_limit))
-    m.readProblem(lp_path)
+    if cache is not None:
+        return cache.solve(m, lp_path)
     t0 = time.time()
     m.optimize()
     wall = time.time() - t0
@@ -75,6 +78,7 @@ def solve_cut_filter(
     log: bool,
     top_frac: Optional[float] = None,
     min_keep: int = 5,
+    native: bool = False,
 ) -> Dict[str, Any]:
     """All cuts generated, but filter to top-k (or top-frac) per round."""
     m, sepa = make_model_with_cut_filter(
@@ -85,6 +89,7 @@ def solve_cut_filter(
         min_keep=min_keep,
         model_pt=cut_model,
         log=log,
+        native=native,
     )
     t0 = time.time()
     m.optimize()
@@ -102,10 +107,10 @@ def solve_combined(
     log: bool,
     top_frac: Optional[float] = None,
     min_keep: int = 5,
+    native: bool = False,
 ) -> Dict[str, Any]:
     """UC-aware branching + cut quality filtering."""
-    m = Model()
-    m.hideOutput(True)
+    m = load_model(lp_path)
     m.setRealParam("limits/time", float(time_limit))
 
     branch_rule = UCBranchrule(log=log)
@@ -118,23 +123,15 @@ def solve_combined(
         maxbounddist=1.0,
     )
 
-    cut_sepa = CutQualitySepa(top_k=top_k, top_frac=top_frac, min_keep=min_keep,
-                              model_pt=cut_model, log=log)
-    m.includeSepa(
-        cut_sepa,
-        name="cut_quality_filter",
-        desc="Top-k cut filtering",
-        priority=-1,
-        freq=1,
-    )
+    cut_filter = include_cut_filter(m, top_k=top_k, top_frac=top_frac, min_keep=min_keep,
+                                    model_pt=cut_model, log=log, native=native)
 
-    m.readProblem(lp_path)
     t0 = time.time()
     m.optimize()
     wall = time.time() - t0
     result = _metrics(m, wall)
     result["branch_stats"] = branch_rule.get_stats()
-    result["cut_filter_stats"] = cut_sepa.get_stats()
+    result["cut_filter_stats"] = cut_filter.get_stats()
     return result
 
 
@@ -178,9 +175,13 @@ def main():
                     help="Minimum cuts to keep when using --top-frac (floor)")
     ap.add_argument("--cut-model", default=None,
                     help="Trained cut quality MLP (.pt) — omit for heuristic mode")
+    ap.add_argument("--native-cut-scorer", action="store_true",
+                    help="Score and select cuts in C (mlscore cut selector) instead of a Python callback")
     ap.add_argument("--seed", type=int, default=0)
     ap.add_argument("--log", action="store_true")
+    add_solve_cache_args(ap)
     args = ap.parse_args()
+    cache = solve_cache_from_args(args)
 
     rng = np.random.RandomState(args.seed)
     outdir = Path(args.outdir)
@@ -205,11 +206,10 @@ def main():
     rows = []
     csv_path = outdir / "results.csv"
     jsonl_path = outdir / "results.jsonl"
+    store = ResultsStore(str(outdir / "results.sqlite"), fieldnames=fieldnames)
+    store.clear()
 
-    with open(csv_path, "w", newline="") as fcsv:
-        writer = csv.DictWriter(fcsv, fieldnames=fieldnames)
-        writer.writeheader()
-
+    try:
         for entry in manifest:
             lp_rel = entry["lp"]
             lp_path = str(inst_dir / lp_rel)
@@ -222,7 +222,7 @@ def main():
 
             print(f"\n[{inst_name}]")
 
-            r_on = solve_all_on(lp_path, args.time_limit)
+            r_on = solve_all_on(lp_path, args.time_limit, cache)
             print(f"  all_on:     {r_on['solve_time_sec']:7.2f}s  "
                   f"[{r_on['status']}]  nodes={r_on['nodes']}")
 
@@ -233,14 +233,16 @@ def main():
                   f"{r_br['branch_stats']['n_branches']}")
 
             r_cf = solve_cut_filter(lp_path, args.time_limit, args.top_k,
-                                    args.cut_model, args.log, args.top_frac, args.min_keep)
+                                    args.cut_model, args.log, args.top_frac, args.min_keep,
+                                    args.native_cut_scorer)
             print(f"  cut_filter: {r_cf['solve_time_sec']:7.2f}s  "
                   f"[{r_cf['status']}]  nodes={r_cf['nodes']}  "
                   f"keep={r_cf['cut_filter_stats']['total_cuts_kept']}/"
                   f"{r_cf['cut_filter_stats']['total_cuts_seen']}")
 
             r_co = solve_combined(lp_path, args.time_limit, args.top_k,
-                                  args.cut_model, args.log, args.top_frac, args.min_keep)
+                                  args.cut_model, args.log, args.top_frac, args.min_keep,
+                                  args.native_cut_scorer)
             print(f"  combined:   {r_co['solve_time_sec']:7.2f}s  "
                   f"[{r_co['status']}]  nodes={r_co['nodes']}")
 
@@ -290,11 +292,10 @@ def main():
                 "cut_keep_rate": round(keep_rate, 4) if np.isfinite(keep_rate) else None,
             }
             rows.append(row)
-            writer.writerow(row)
-            fcsv.flush()
-
-            with open(jsonl_path, "a") as fjsonl:
-                fjsonl.write(json.dumps(row) + "\n")
+            store.append(row)
+    finally:
+        store.export_csv(str(csv_path))
+        store.export_jsonl(str(jsonl_path))
 
     # Summary
     if rows:
@@ -311,6 +312,7 @@ def main():
             "n": len(rows),
             "top_k": args.top_k,
             "cut_model": args.cut_model,
+            "native_cut_scorer": args.native_cut_scorer,
             "delta_branch": summarize("delta_branch"),
             "delta_cutfilter": summarize("delta_cutfilter"),
             "delta_combined": summarize("delta_combined"),
@@ -12,7 +12,8 @@ For each instance, runs three solves:
 
 Outputs:
   experiments/step6_ucb_eval/
-    results.jsonl    -- per-instance metrics
+    results.sqlite   -- per-instance metrics (results_store.py)
+    results.jsonl    -- exported from results.sqlite, incl. the UCB round log
     results.csv
     summary.json
 
@@ -27,20 +28,24 @@ Usage:
     --time-limit 300 \
     --alpha 1.0 \
     --max-rounds 10
+
+The all_off / all_on solves go through the solve cache (solve_cache.py), so a
+rerun only pays for the UCB solves; --force-resolve re-measures them.
 """
 
 from __future__ import annotations
 
 import argparse
-import csv
 import json
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import numpy as np
-from pyscipopt import Model
 
+from instance_cache import load_model
+from results_store import ResultsStore
+from solve_cache import SolveCache, add_solve_cache_args, measure_solve, solve_cache_from_args
 from ucb_sepa import SEPAS, N_ARMS, LinUCB, UCBSepa, make_model_with_ucb, warm_start_from_offline_model
 
 
@@ -56,10 +61,10 @@ def load_features_npz(path: str) -> Dict[str, np.ndarray]:
     return {n: feats[i] for i, n in enumerate(names)}
 
 
-def solve_fixed_config(lp_path: str, all_on: bool, time_limit: int) -> Dict[str, Any]:
-    """Solve with all separators on or all off. Returns metrics dict."""
-    m = Model()
-    m.hideOutput(True)
+def solve_fixed_config(lp_path: str, all_on: bool, time_limit: int,
+                       cache: Optional[SolveCache] = None) -> Dict[str, Any]:
+    """Solve with all separators on or all off (from cache if given). Returns metrics dict."""
+    m = load_model(lp_path)
     m.setRealParam("limits/time", float(time_limit))
     for sepa in SEPAS:
         freq = 1 if all_on else 0
@@ -67,29 +72,9 @@ def solve_fixed_config(lp_path: str, all_on: bool, time_limit: int) -> Dict[str,
             m.setIntParam(f"separating/{sepa}/freq", freq)
         except Exception:
             pass
-    m.readProblem(lp_path)
-    t0 = time.time()
-    m.optimize()
-    wall = time.time() - t0
-    try:
-        status = str(m.getStatus())
-    except Exception:
-        status = "unknown"
-    try:
-        obj = float(m.getObjVal())
-    except Exception:
-        obj = None
-    try:
-        nodes = int(m.getNNodes())
-    except Exception:
-        nodes = None
-    return {
-        "solve_time_sec": float(getattr(m, "getSolvingTime", lambda: wall)()),
-        "wall_time_sec": wall,
-        "status": status,
-        "obj": obj,
-        "nodes": nodes,
-    }
+    if cache is not None:
+        return cache.solve(m, lp_path)
+    return measure_solve(m)
 
 
 def solve_with_ucb(
@@ -167,7 +152,9 @@ def main():
                     help="Training mode: run UCB on all instances and save weights to outdir/ucb_weights.npz")
     ap.add_argument("--seed", type=int, default=0)
     ap.add_argument("--log", action="store_true", help="Print per-round UCB decisions")
+    add_solve_cache_args(ap)
     args = ap.parse_args()
+    cache = solve_cache_from_args(args)
 
     rng = np.random.RandomState(args.seed)
     outdir = Path(args.outdir)
@@ -229,11 +216,11 @@ def main():
         "n_ucb_rounds", "warm_started", "easy_fallback",
     ]
 
-    rows = []
-    with open(csv_path, "w", newline="") as fcsv:
-        writer = csv.DictWriter(fcsv, fieldnames=fieldnames)
-        writer.writeheader()
+    store = ResultsStore(str(outdir / "results.sqlite"), fieldnames=fieldnames)
+    store.clear()
 
+    rows = []
+    try:
         for entry in manifest:
             lp_rel = entry["lp"]
             lp_path = str(inst_dir / lp_rel)
@@ -259,13 +246,13 @@ def main():
             print(f"\n[{inst_name}]")
 
             # 1. all_off baseline
-            r_off = solve_fixed_config(lp_path, all_on=False, time_limit=args.time_limit)
+            r_off = solve_fixed_config(lp_path, all_on=False, time_limit=args.time_limit, cache=cache)
             print(f"  all_off:  {r_off['solve_time_sec']:.2f}s  [{r_off['status']}]")
 
             easy = is_easy(r_off["solve_time_sec"])
 
             # 2. all_on
-            r_on = solve_fixed_config(lp_path, all_on=True, time_limit=args.time_limit)
+            r_on = solve_fixed_config(lp_path, all_on=True, time_limit=args.time_limit, cache=cache)
             print(f"  all_on:   {r_on['solve_time_sec']:.2f}s  [{r_on['status']}]")
 
             # 3. UCB — fall back to all_on for easy instances to avoid exploration overhead
@@ -317,16 +304,15 @@ def main():
                 "easy_fallback": easy,
             }
             rows.append(row)
-            writer.writerow(row)
-            fcsv.flush()
-
-            # write full record to jsonl (includes ucb_round_log)
-            with open(jsonl_path, "a") as fjsonl:
-                fjsonl.write(json.dumps({
-                    **row,
-                    "ucb_round_log": r_ucb["ucb_round_log"],
-                    "warm_start_rewards": warm_rewards,
-                }) + "\n")
+            # the store (and results.jsonl) keep the full record, incl. ucb_round_log
+            store.append({
+                **row,
+                "ucb_round_log": r_ucb["ucb_round_log"],
+                "warm_start_rewards": warm_rewards,
+            })
+    finally:
+        store.export_csv(str(csv_path))
+        store.export_jsonl(str(jsonl_path))
 
     # Summary
     if rows:
@@ -5,6 +5,7 @@ from states import getState
 
 parser = argparse.ArgumentParser()
 parser.add_argument("--instance", type=str, required=True)
+parser.add_argument("--store", type=str, default=None, help="optional StateStore dir to append the state to")
 args = parser.parse_args()
 
 INSTANCE = Path(args.instance).expanduser().resolve()
@@ -28,7 +29,12 @@ m.optimize()
 state = getState("learn1", m, round_num=0)
 
 print("keys:", state.keys())
-print("row_features:", len(state["row_features"]))
-print("col_features:", len(state["col_features"]))
-print("cut_features:", len(state["cut_features"]))
+print("row_features:", len(state["row_features"]["lp_pos"]))
+print("col_features:", len(state["col_features"]["lp_pos"]))
+print("cut_features:", len(state["cut_features"]["lp_pos"]))
 print("sepa_features:", len(state["sepa_features"]))
+
+if args.store:
+    from utils import append_state, load_state
+    ref = append_state(args.store, state)
+    print("stored:", ref, "keys:", list(load_state(ref).keys()))
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+solve_cache.py
+
+Content-addressed cache of fixed-configuration solve results, shared by
+collect_uc_times.py, eval_uc_k1_online_policy.py, run_with_ucb.py and
+run_improved.py, so reruns do not re-solve baselines already measured.
+
+The key is built from the configured Model just before optimize():
+  - sha1 of the instance file contents
+  - every SCIP parameter (Model.getParams()), so separator frequencies,
+    limits, lp/threads, seeds and anything else a caller sets are all part of it
+  - SCIP and PySCIPOpt versions, and SOLVE_CACHE_VERSION
+Reading the values from the Model means a default that was never set and the
+same value set explicitly give the same key.
+
+Invalidation:
+  - Editing or regenerating an instance changes its hash; changing any
+    parameter or upgrading SCIP/PySCIPOpt gives a new key. Old entries are
+    simply never read again (clear() removes everything).
+  - Bump SOLVE_CACHE_VERSION when the solver fork or the stored metrics
+    change in a way the versions above do not capture.
+  - Only solves that ended with a final status (optimal, infeasible,
+    time/node limit, ...) are stored; interrupted or failed solves are not.
+  - force=True (--force-resolve) skips lookups and overwrites the entries
+    with fresh results.
+
+Usage:
+  from solve_cache import SolveCache, measure_solve
+
+  cache = SolveCache("experiments/solve_cache")
+  m = load_model(lp_path)
+  m.setRealParam("limits/time", 300.0)
+  result = cache.solve(m, lp_path, measure_solve)
+
+Only cache solves whose outcome is determined by the key, i.e. no Python
+plugins with their own state (UCB, cut filters, branching rules).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from pyscipopt import Model
+
+from instance_cache import file_digest
+
+
+SOLVE_CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = "experiments/solve_cache"
+
+# statuses that are a reproducible outcome of the keyed settings
+FINAL_STATUSES = {
+    "optimal", "infeasible", "unbounded", "inforunbd",
+    "timelimit", "nodelimit", "totalnodelimit", "stallnodelimit", "gaplimit", "sollimit", "bestsollimit",
+}
+
+# (path, size, mtime_ns) -> digest, so unchanged instances are hashed once per process
+_digests: Dict[Tuple[str, int, int], str] = {}
+_digests_lock = threading.Lock()
+
+
+def _instance_digest(path: str) -> str:
+    p = os.path.abspath(path)
+    st = os.stat(p)
+    stamp = (p, st.st_size, st.st_mtime_ns)
+    with _digests_lock:
+        digest = _digests.get(stamp)
+    if digest is None:
+        digest = file_digest(p)
+        with _digests_lock:
+            _digests[stamp] = digest
+    return digest
+
+
+# SCIP/PySCIPOpt versions, read once per process
+_version_info: Optional[Dict[str, Any]] = None
+
+
+def _versions(m: Model) -> Dict[str, Any]:
+    global _version_info
+    if _version_info is None:
+        import pyscipopt
+        _version_info = {
+            "scip": m.version(),
+            "pyscipopt": getattr(pyscipopt, "__version__", None),
+        }
+    return _version_info
+
+
+def measure_solve(m: Model) -> Dict[str, Any]:
+    """
+    Optimize a configured model and return its metrics (solve/wall time,
+    status, obj, nodes, lp_iterations). The cached scripts all measure with
+    this, so an entry written by one has the fields every other one reads.
+    """
+    t0 = time.time()
+    m.optimize(release_gil=True)
+    wall = time.time() - t0
+
+    # Metrics
+    out: Dict[str, Any] = {
+        "solve_time_sec": float(getattr(m, "getSolvingTime", lambda: wall)()),
+        "wall_time_sec": float(wall),
+    }
+
+    # Status / objective / nodes if available
+    try:
+        out["status"] = str(m.getStatus())
+    except Exception:
+        out["status"] = None
+
+    try:
+        out["obj"] = float(m.getObjVal())
+    except Exception:
+        out["obj"] = None
+
+    try:
+        out["nodes"] = int(m.getNNodes())
+    except Exception:
+        out["nodes"] = None
+
+    try:
+        out["lp_iterations"] = int(m.getNLPIterations())
+    except Exception:
+        out["lp_iterations"] = None
+
+    return out
+
+
+class SolveCache:
+    """
+    Solve results stored as one JSON file per key under cache_dir.
+
+    Writes go through a temporary file and os.replace, so concurrent workers
+    (processes or threads) can share a cache directory.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, force: bool = False):
+        self.cache_dir = Path(cache_dir)
+        self.force = force
+        self.n_hits = 0
+        self.n_misses = 0
+
+    def key_fields(self, m: Model, lp_path: str) -> Dict[str, Any]:
+        """Everything that determines the outcome of solving m, as a JSON-able dict."""
+        return {
+            "format": SOLVE_CACHE_VERSION,
+            "instance": _instance_digest(lp_path),
+            "params": dict(sorted(m.getParams().items())),
+            **_versions(m),
+        }
+
+    @staticmethod
+    def key(fields: Dict[str, Any]) -> str:
+        return hashlib.sha1(json.dumps(fields, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Stored result for key, or None (also for an unreadable entry)."""
+        try:
+            with open(self._path(key), "r") as f:
+                return json.load(f)["result"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, fields: Dict[str, Any], result: Dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"key": fields, "result": result, "created": time.time()}
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def solve(
+        self,
+        m: Model,
+        lp_path: str,
+        measure: Optional[Callable[[Model], Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Return the cached result for the configured model m, or run
+        measure(m) (default: measure_solve; it must optimize and return a
+        metrics dict with "status") and store it. Cached results carry
+        "cached": True.
+        """
+        measure = measure or measure_solve
+        fields = self.key_fields(m, lp_path)
+        key = self.key(fields)
+
+        if not self.force:
+            hit = self.get(key)
+            if hit is not None:
+                self.n_hits += 1
+                return {**hit, "cached": True}
+
+        self.n_misses += 1
+        result = measure(m)
+        if str(result.get("status")) in FINAL_STATUSES:
+            self.put(key, fields, result)
+        return result
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+def add_solve_cache_args(ap) -> None:
+    """--solve-cache / --no-solve-cache / --force-resolve on an argparse parser."""
+    ap.add_argument("--solve-cache", default=DEFAULT_CACHE_DIR,
+                    help="Directory of cached fixed-config solve results")
+    ap.add_argument("--no-solve-cache", action="store_true",
+                    help="Neither read nor write the solve cache")
+    ap.add_argument("--force-resolve", action="store_true",
+                    help="Re-solve even when a cached result exists (and overwrite it)")
+
+
+def solve_cache_from_args(args) -> Optional[SolveCache]:
+    if args.no_solve_cache:
+        return None
+    return SolveCache(args.solve_cache, force=args.force_resolve)
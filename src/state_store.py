@@ -0,0 +1,197 @@
+"""
+state_store.py
+
+Append-friendly on-disk store for per-round solver states (the dicts built by
+states.getState), one directory per instance instead of one directory of
+.npy/.pkl files per round.
+
+Layout of a store directory:
+  meta.json                 store settings (chunk_rounds, compress)
+  index.jsonl               one line per appended round: where each leaf lives
+  <leaf>.<chunk>.bin        raw bytes of that leaf for `chunk_rounds` rounds
+
+Nested dicts (e.g. row_features, row_coefs) are flattened into leaves
+"row_features/lhs", ...; NumPy arrays are written as raw bytes, ragged
+per-round arrays simply follow each other and the index keeps their byte
+offset and shape. Anything else (name lists, sepa stats, tuples) is pickled.
+
+With compress=False (default) a single round is read back with np.memmap,
+without touching the other rounds. With compress=True every block is
+zlib-compressed; reading a round then decompresses only that round's blocks.
+
+Rounds are referenced as "<store_dir>::<round>" by utils.find_all_paths and
+loaded with utils.load_state.
+"""
+
+import json
+import os
+import pickle
+import zlib
+
+import numpy as np
+
+META_FILE = 'meta.json'
+INDEX_FILE = 'index.jsonl'
+ROUND_SEP = '::'
+KEY_SEP = '/'
+
+
+def is_store(path):
+    return os.path.isfile(os.path.join(path, INDEX_FILE))
+
+
+def split_ref(ref):
+    """'<store_dir>::<round>' -> (store_dir, round); plain paths give (path, None)."""
+    if ROUND_SEP in ref:
+        path, r = ref.rsplit(ROUND_SEP, 1)
+        return path, int(r)
+    return ref, None
+
+
+def _flatten(state, prefix=''):
+    leaves = {}
+    for k, v in state.items():
+        key = f'{prefix}{k}'
+        if isinstance(v, dict) and v and all(isinstance(kk, str) for kk in v):
+            leaves.update(_flatten(v, key + KEY_SEP))
+        else:
+            leaves[key] = v
+    return leaves
+
+
+def _unflatten(leaves):
+    state = {}
+    for key, v in leaves.items():
+        parts = key.split(KEY_SEP)
+        d = state
+        for p in parts[:-1]:
+            d = d.setdefault(p, {})
+        d[parts[-1]] = v
+    return state
+
+
+class StateStore:
+    """
+    Per-instance store of solver states.
+
+    store = StateStore(path)              # create or reopen for appending
+    store.append(state, round_num=3)
+    state = store.load(3)                 # memory-mapped arrays by default
+    """
+
+    def __init__(self, path, chunk_rounds=64, compress=False):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+        meta_path = os.path.join(path, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            self.chunk_rounds = int(meta['chunk_rounds'])
+            self.compress = bool(meta['compress'])
+        else:
+            self.chunk_rounds = int(chunk_rounds)
+            self.compress = bool(compress)
+            with open(meta_path, 'w') as f:
+                json.dump({'chunk_rounds': self.chunk_rounds, 'compress': self.compress, 'version': 1}, f)
+
+        self._index = {}
+        self._order = []
+        index_path = os.path.join(path, INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # truncated last line of an interrupted append
+                    if entry['round'] not in self._index:
+                        self._order.append(entry['round'])
+                    self._index[entry['round']] = entry['blocks']
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, round_num):
+        return round_num in self._index
+
+    def rounds(self):
+        return list(self._order)
+
+    def keys(self, round_num):
+        return _unflatten({k: None for k in self._index[round_num]})
+
+    def _data_file(self, key, chunk):
+        return f"{key.replace(KEY_SEP, '__')}.{chunk:05d}.bin"
+
+    def _write_block(self, fname, payload):
+        fpath = os.path.join(self.path, fname)
+        with open(fpath, 'ab') as f:
+            offset = f.tell()
+            f.write(payload)
+        return offset
+
+    def append(self, state, round_num=None):
+        """Append one round. round_num defaults to the number of stored rounds."""
+        if round_num is None:
+            round_num = len(self._order)
+        round_num = int(round_num)
+        if round_num in self._index:
+            raise ValueError(f'round {round_num} already stored in {self.path}')
+
+        chunk = len(self._order) // self.chunk_rounds
+        blocks = {}
+        for key, value in _flatten(state).items():
+            fname = self._data_file(key, chunk)
+            if isinstance(value, np.ndarray) and value.dtype != object:
+                arr = np.ascontiguousarray(value)
+                payload = arr.tobytes()
+                block = {'k': 'a', 'dt': arr.dtype.str, 'sh': list(arr.shape)}
+            else:
+                payload = pickle.dumps(value, protocol=5)
+                block = {'k': 'p'}
+            if self.compress:
+                payload = zlib.compress(payload)
+            block.update({'f': fname, 'o': self._write_block(fname, payload), 'n': len(payload)})
+            blocks[key] = block
+
+        with open(os.path.join(self.path, INDEX_FILE), 'a') as f:
+            f.write(json.dumps({'round': round_num, 'blocks': blocks}) + '\n')
+
+        self._index[round_num] = blocks
+        self._order.append(round_num)
+        return round_num
+
+    def _read_block(self, block, mmap):
+        fpath = os.path.join(self.path, block['f'])
+        if block['k'] == 'a':
+            dtype = np.dtype(block['dt'])
+            shape = tuple(block['sh'])
+            if self.compress:
+                with open(fpath, 'rb') as f:
+                    f.seek(block['o'])
+                    raw = zlib.decompress(f.read(block['n']))
+                return np.frombuffer(raw, dtype=dtype).reshape(shape)
+            if block['n'] == 0:
+                return np.empty(shape, dtype=dtype)
+            if mmap:
+                return np.memmap(fpath, dtype=dtype, mode='r', offset=block['o'], shape=shape)
+            return np.fromfile(fpath, dtype=dtype, count=int(np.prod(shape)), offset=block['o']).reshape(shape)
+
+        with open(fpath, 'rb') as f:
+            f.seek(block['o'])
+            raw = f.read(block['n'])
+        if self.compress:
+            raw = zlib.decompress(raw)
+        return pickle.loads(raw)
+
+    def load(self, round_num, keys=None, mmap=True):
+        """
+        Load one round as a (nested) state dict. keys restricts the top-level
+        entries read, e.g. keys=['cut_parallelism'].
+        """
+        blocks = self._index[int(round_num)]
+        if keys is not None:
+            keys = set(keys)
+            blocks = {k: b for k, b in blocks.items() if k.split(KEY_SEP, 1)[0] in keys}
+        return _unflatten({k: self._read_block(b, mmap) for k, b in blocks.items()})
@@ -1,7 +1,159 @@
 import numpy as np
 import states_helpers as _helpers
 
-def getState(statestr, model, round_num=0):
+# row features that do not change while a row exists (given fixed LP columns);
+# nlpnonz is not one of them: it only becomes valid once a cut is linked into the LP
+_STATIC_ROW_KEYS = ('origin_type', 'cst', 'row_norm', 'obj_parallelism', 'intcols',
+                    'rank', 'nnonz', 'is_integral', 'is_removable')
+
+
+def _rowKey(row):
+    # SCIP row index is unique for the whole solve
+    return row.index
+
+
+class IncrementalStateBuilder:
+    """
+    Builds 'learn1' states over the separation rounds of one solve, reusing
+    what did not change since the previous round.
+
+    Rows and cuts are keyed by their SCIP row index, so a cut that enters the
+    LP keeps its cached data as a row. Per row, the static features (_STATIC_ROW_KEYS, the
+    name) and the coefficients are computed once; activity, dualsol, basis
+    status, age and LP position are refreshed every round. Cut/cut and cut/row
+    parallelism is only computed for pairs that were not both present in the
+    previous round.
+
+    Coefficient column indices are LP positions, so everything is dropped when
+    the number of LP columns changes.
+
+    builder = IncrementalStateBuilder(model)
+    state = getState('learn1', model, round_num=r, builder=builder)
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.reset()
+
+    def reset(self):
+        self._ncols = None
+        self._slot = {}        # row key -> slot in the arrays below
+        self._static = {k: None for k in _STATIC_ROW_KEYS}
+        self._names = []
+        self._start = np.zeros(0, dtype=np.int64)    # slot -> offset into _indices/_data
+        self._nnz = np.zeros(0, dtype=np.int64)
+        self._indices = np.zeros(0, dtype=np.int32)
+        self._data = np.zeros(0, dtype=np.float64)
+        self._cut_par = None   # (cut key -> position, square cut/cut matrix) of the previous round
+        self._cutrow_par = None  # (cut key -> position, row key -> position, cut/row matrix)
+        self.n_static_computed = 0
+        self.n_static_reused = 0
+
+    def newRound(self, ncols):
+        if ncols != self._ncols:
+            self.reset()
+            self._ncols = ncols
+
+    def _slots(self, rows):
+        """Slots of `rows` in the static cache, filling it for rows not seen before."""
+        keys = [_rowKey(row) for row in rows]
+        new = [i for i, k in enumerate(keys) if k not in self._slot]
+        self.n_static_computed += len(new)
+        self.n_static_reused += len(rows) - len(new)
+
+        if new:
+            new_rows = [rows[i] for i in new]
+            feats = self.model.getRowFeatures1Batch(new_rows, names=True)
+            indptr, indices, data = self.model.getLPMatrixCSR(new_rows)
+
+            nslots = len(self._names)
+            for k in _STATIC_ROW_KEYS:
+                old = self._static[k]
+                self._static[k] = feats[k] if old is None else np.concatenate([old, feats[k]])
+            self._names.extend(feats['rname'])
+            self._start = np.concatenate([self._start, len(self._indices) + np.asarray(indptr[:-1], dtype=np.int64)])
+            self._nnz = np.concatenate([self._nnz, np.diff(indptr).astype(np.int64)])
+            self._indices = np.concatenate([self._indices, indices])
+            self._data = np.concatenate([self._data, data])
+            for j, i in enumerate(new):
+                self._slot[keys[i]] = nslots + j
+
+        return np.fromiter((self._slot[k] for k in keys), dtype=np.int64, count=len(keys))
+
+    def computeRowFeatures1Batch(self, rows, round_num=0):
+        slots = self._slots(rows)
+        features = self.model.getRowFeatures1Batch(rows, dynamic_only=True)
+        if len(rows):
+            for k in _STATIC_ROW_KEYS:
+                features[k] = self._static[k][slots]
+            features['rname'] = [self._names[s] for s in slots]
+        features['round_num'] = round_num
+        return features
+
+    def computeCoefsCSR(self, rows, cols):
+        slots = self._slots(rows)
+        lengths = self._nnz[slots]
+        indptr = np.zeros(len(rows) + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum(lengths)
+        # position of every output nonzero in the cached buffers
+        pos = np.repeat(self._start[slots] - indptr[:-1], lengths) + np.arange(indptr[-1])
+        return {
+            'indptr': indptr,
+            'indices': self._indices[pos],
+            'data': self._data[pos],
+            'shape': (len(rows), len(cols)),
+        }
+
+    @staticmethod
+    def _positions(keys, prev_pos):
+        return np.fromiter((prev_pos.get(k, -1) for k in keys), dtype=np.int64, count=len(keys))
+
+    def computeCutParallelism(self, cuts):
+        """Condensed upper triangle of the cut/cut parallelism, as computeCutParallelism."""
+        keys = [_rowKey(cut) for cut in cuts]
+        n = len(cuts)
+        full = np.empty((n, n), dtype=np.float32)
+
+        prev = self._positions(keys, self._cut_par[0]) if self._cut_par is not None else np.full(n, -1)
+        old = np.flatnonzero(prev >= 0)
+        new = np.flatnonzero(prev < 0)
+        if len(old):
+            full[np.ix_(old, old)] = self._cut_par[1][np.ix_(prev[old], prev[old])]
+        if len(new):
+            block = _helpers.computeCutRowParallelism([cuts[i] for i in new], cuts, self.model)
+            full[new, :] = block
+            full[:, new] = block.T
+
+        self._cut_par = ({k: i for i, k in enumerate(keys)}, full)
+        return full[np.triu_indices(n, k=1)]
+
+    def computeCutRowParallelism(self, cuts, rows):
+        cut_keys = [_rowKey(cut) for cut in cuts]
+        row_keys = [_rowKey(row) for row in rows]
+        par = np.empty((len(cuts), len(rows)), dtype=np.float32)
+
+        if self._cutrow_par is not None:
+            prev_c = self._positions(cut_keys, self._cutrow_par[0])
+            prev_r = self._positions(row_keys, self._cutrow_par[1])
+        else:
+            prev_c = np.full(len(cuts), -1)
+            prev_r = np.full(len(rows), -1)
+        old_c, new_c = np.flatnonzero(prev_c >= 0), np.flatnonzero(prev_c < 0)
+        old_r, new_r = np.flatnonzero(prev_r >= 0), np.flatnonzero(prev_r < 0)
+
+        if len(old_c) and len(old_r):
+            par[np.ix_(old_c, old_r)] = self._cutrow_par[2][np.ix_(prev_c[old_c], prev_r[old_r])]
+        if len(new_c):
+            par[new_c, :] = _helpers.computeCutRowParallelism([cuts[i] for i in new_c], rows, self.model)
+        if len(old_c) and len(new_r):
+            par[np.ix_(old_c, new_r)] = _helpers.computeCutRowParallelism(
+                [cuts[i] for i in old_c], [rows[j] for j in new_r], self.model)
+
+        self._cutrow_par = ({k: i for i, k in enumerate(cut_keys)}, {k: j for j, k in enumerate(row_keys)}, par)
+        return par
+
+
+def getState(statestr, model, round_num=0, builder=None):
     ### immediate steps
     # log_lookahead_score
     # lpobjval in state
@@ -22,11 +174,26 @@ def getState(statestr, model, round_num=0):
         cuts = model.getPoolCuts() + model.getCuts()
         cols = model.getLPColsData()
 
-        row_features = _helpers.computeRowFeatures1(rows, model, round_num=round_num)
-        col_features = _helpers.computeColFeatures1(cols, model, round_num=round_num)
-        cut_features = _helpers.computeRowFeatures1(cuts, model, round_num=round_num)
+        col_features = _helpers.computeColFeatures1Batch(cols, model, round_num=round_num)
         sepa_features = _helpers.computeSepaFeatures1(model, round_num=round_num)  
 
+        if builder is not None:
+            # reuse static row data and old parallelism pairs from earlier rounds
+            builder.newRound(len(cols))
+            row_features = builder.computeRowFeatures1Batch(rows, round_num=round_num)
+            cut_features = builder.computeRowFeatures1Batch(cuts, round_num=round_num)
+            cut_parallelism = builder.computeCutParallelism(cuts)
+            cutrow_parallelism = builder.computeCutRowParallelism(cuts, rows)
+            row_coefs = builder.computeCoefsCSR(rows, cols)
+            cut_coefs = builder.computeCoefsCSR(cuts, cols)
+        else:
+            row_features = _helpers.computeRowFeatures1Batch(rows, model, round_num=round_num)
+            cut_features = _helpers.computeRowFeatures1Batch(cuts, model, round_num=round_num)
+            cut_parallelism = _helpers.computeCutParallelism(cuts, model)
+            cutrow_parallelism = _helpers.computeCutRowParallelism(cuts, rows, model)
+            row_coefs = _helpers.computeCoefsCSR(rows, cols, model)
+            cut_coefs = _helpers.computeCoefsCSR(cuts, cols, model)
+
         state = {
             'cut_input_scores': _helpers.computeInputScores(cuts, model),
             'row_input_scores': _helpers.computeInputScores(rows, model),
@@ -34,10 +201,10 @@ def getState(statestr, model, round_num=0):
             'row_features': row_features,
             'col_features': col_features,
             'cut_features': cut_features,
-            'cut_parallelism': _helpers.computeCutParallelism(cuts, model),
-            'cutrow_parallelism': _helpers.computeCutRowParallelism(cuts, rows, model),
-            'row_coefs': _helpers.computeCoefs(rows, cols, model),
-            'cut_coefs': _helpers.computeCoefs(cuts, cols, model),
+            'cut_parallelism': cut_parallelism,
+            'cutrow_parallelism': cutrow_parallelism,
+            'row_coefs': row_coefs,
+            'cut_coefs': cut_coefs,
             'sepa_features': sepa_features 
         }
 
@@ -52,13 +219,13 @@ def getState(statestr, model, round_num=0):
             'cut_input_scores': _helpers.computeInputScores(cuts, model),
             'row_input_scores': _helpers.computeInputScores(rows, model),
             'cut_lookahead_scores': _helpers.computeLookaheadScores(cuts, model),
-            'row_features': _helpers.computeRowFeatures1(rows, model),
-            'col_features': _helpers.computeColFeatures1(cols, model),
-            'cut_features': _helpers.computeRowFeatures1(cuts, model),
+            'row_features': _helpers.computeRowFeatures1Batch(rows, model),
+            'col_features': _helpers.computeColFeatures1Batch(cols, model),
+            'cut_features': _helpers.computeRowFeatures1Batch(cuts, model),
             'cut_parallelism': _helpers.computeCutParallelism(cuts, model),
             'cutrow_parallelism': _helpers.computeCutRowParallelism(cuts, rows, model),
-            'row_coefs': _helpers.computeCoefs(rows, cols, model),
-            'cut_coefs': _helpers.computeCoefs(cuts, cols, model),
+            'row_coefs': _helpers.computeCoefsCSR(rows, cols, model),
+            'cut_coefs': _helpers.computeCoefsCSR(cuts, cols, model),
         }
 
     elif statestr == 'scores':
@@ -1,5 +1,4 @@
 import numpy as np
-import torch
 
 CUT_IDENTIFIERS_TO_NUMS = {
     'cmir': 1,
@@ -165,6 +164,18 @@ def computeColFeatures1(cols, model, round_num=0):
         features.append(ft)
     return features
 
+def computeRowFeatures1Batch(rows, model, round_num=0, names=True):
+    """Columnar computeRowFeatures1: one array per feature, round_num as a scalar."""
+    features = model.getRowFeatures1Batch(rows, names=names)
+    features['round_num'] = round_num
+    return features
+
+def computeColFeatures1Batch(cols, model, round_num=0, names=True):
+    """Columnar computeColFeatures1: one array per feature, round_num as a scalar."""
+    features = model.getColFeatures1Batch(cols, names=names)
+    features['round_num'] = round_num
+    return features
+
 def computeCoefs(rows, cols, model):
     # hash col position for fast retrieval..
     col_dict = {}
@@ -182,6 +193,20 @@ def computeCoefs(rows, cols, model):
 
     return coefs
 
+def computeCoefsCSR(rows, cols, model):
+    """
+    Row coefficients over the LP columns as a CSR dict
+    {'indptr', 'indices', 'data', 'shape'}; column j is cols[j], i.e. the
+    LP position. Same content as computeCoefs, without per-nonzero objects.
+    """
+    indptr, indices, data = model.getLPMatrixCSR(rows)
+    return {
+        'indptr': indptr,
+        'indices': indices,
+        'data': data,
+        'shape': (len(rows), len(cols)),
+    }
+
 def computeCutTypes(cuts):
 
     cut_types = np.empty((len(cuts), ), dtype=np.int32)
@@ -192,21 +217,9 @@ def computeCutTypes(cuts):
     return cut_types
 
 def computeCutParallelism(cuts, model):
-
-    cut_parallelism = []
-    for i, cut1 in enumerate(cuts[:-1]): # exclude the very last
-        for cut2 in cuts[(i+1):]:
-            cut_parallelism.append(model.getRowParallelism(cut1, cut2))
-
-    cut_parallelism = np.array(cut_parallelism, dtype=np.float32) #1D
-    return cut_parallelism
+    # condensed upper triangle: pairs (0,1), (0,2), ..., (1,2), ... as float32, 1D
+    return model.getParallelismMatrix(cuts, condensed=True)
 
 def computeCutRowParallelism(cuts, rows, model):
-
-    row_parallelism = np.empty((len(cuts), len(rows)), dtype=np.float32)
-
-    for i, cut1 in enumerate(cuts): # exclude the very last  [:-1]
-        for j, row in enumerate(rows):
-            row_parallelism[i, j] = model.getRowParallelism(cut1, row)
-
-    return row_parallelism
\ No newline at end of file
+    # (len(cuts), len(rows)) float32
+    return model.getParallelismMatrix(cuts, rows)
\ No newline at end of file
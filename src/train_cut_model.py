@@ -10,10 +10,11 @@ Input .npz (from collect_cut_data.py):
 
 Positive labels = cut improved LP bound (we want to rank these high).
 The model predicts a quality score; at inference time the top-k cuts by score
-are selected via CutQualitySepa.
+are selected via the cut quality filter (cut_quality_sepa.py).
 
 Output (to --outdir):
   cut_model.pt  — torch checkpoint with state_dict, mu, sd, d_in, hidden
+  cut_model.npz — the same weights for the NumPy runtime (mlp_runtime.py)
   cut_metrics.json
 
 Usage:
@@ -32,6 +33,8 @@ import numpy as np
 import torch
 import torch.nn as nn
 
+from mlp_runtime import export_checkpoint
+
 
 class CutMLP(nn.Module):
     def __init__(self, d_in: int, hidden: int = 64):
@@ -154,6 +157,7 @@ def main():
         "pct_positive_overall": float((y > 0).mean()),
         **precision_at_k,
         "model_path": str(best_path),
+        "npz_path": export_checkpoint(str(best_path)),
     }
     with open(outdir / "cut_metrics.json", "w") as f:
         json.dump(metrics, f, indent=2)
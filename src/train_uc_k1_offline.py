@@ -15,6 +15,7 @@ is argmax_s delta(x,s) over s in A.  (Simple and robust starting point.)
 Outputs written to --outdir:
 - dataset_train.csv / dataset_val.csv (assembled training tables)
 - model.pt (torch checkpoint)
+- model.npz (the same weights for the NumPy runtime, mlp_runtime.py)
 - metrics.json
 - preds_val.csv
 """
@@ -33,6 +34,9 @@ import pandas as pd
 import torch
 import torch.nn as nn
 
+from mlp_runtime import export_checkpoint
+from results_store import load_results
+
 
 # -----------------------------
 # Small model: MLP classifier
@@ -91,6 +95,9 @@ def assemble_table(
     Build a per-(instance, config) table with features and computed delta.
     Requires:
       df columns: instance_name, config_name, solve_time_sec
+    Rows with status "capped" (collect_uc_times.py --adaptive-cap) are
+    right-censored: their delta is only an upper bound, flagged in the
+    "censored" column. Instances whose baseline run is capped are dropped.
     """
     required = {"instance_name", "config_name", "solve_time_sec"}
     missing = required - set(df.columns)
@@ -102,6 +109,17 @@ def assemble_table(
     if df.empty:
         raise RuntimeError("After filtering to subset A, results table is empty. Check config_name strings.")
 
+    if "status" in df.columns:
+        df["censored"] = df["status"] == "capped"
+    else:
+        df["censored"] = False
+
+    # a censored baseline gives no usable reference time
+    bad = set(df.loc[df["censored"] & (df["config_name"] == baseline_config), "instance_name"])
+    if bad:
+        print(f"[WARN] dropping {len(bad)} instances whose baseline run was capped")
+        df = df[~df["instance_name"].isin(bad)].copy()
+
     # baseline times per instance (must exist)
     base = df[df["config_name"] == baseline_config][["instance_name", "solve_time_sec"]].rename(
         columns={"solve_time_sec": "baseline_time_sec"}
@@ -151,7 +169,14 @@ def make_instance_labels(df: pd.DataFrame, subset_a: List[str]) -> pd.DataFrame:
     """
     From per-(instance, config) rows, pick best config per instance via max delta.
     Returns per-instance table with label config_name.
+    Censored (capped) rows only bound their delta from above, so they are not
+    eligible as labels; a capped config was at least cap_factor times slower
+    than the best one when it was stopped.
     """
+    if "censored" in df.columns:
+        has_exact = df.groupby("instance_name")["censored"].transform(lambda c: (~c).any())
+        df = df[~df["censored"] | ~has_exact]
+
     # choose max-delta row per instance
     best = (
         df.sort_values(["instance_name", "delta"], ascending=[True, False])
@@ -273,13 +298,14 @@ def train_classifier(
         "val_acc": float((preds_df["y_true"] == preds_df["y_pred"]).mean()),
         "classes": train_pack.y_name,
         "model_path": str(best_path),
+        "npz_path": export_checkpoint(str(best_path)),
     }
     return metrics
 
 
 def main():
     p = argparse.ArgumentParser()
-    p.add_argument("--results-csv", required=True)
+    p.add_argument("--results-csv", required=True, help="results.csv (or results.sqlite / results.jsonl)")
     p.add_argument("--uc-features-npz", required=True)
     p.add_argument("--lp-features-npz", default=None, help="Optional LP-based features to concatenate")
     p.add_argument("--outdir", required=True)
@@ -303,7 +329,7 @@ def main():
     if not subset_a:
         raise RuntimeError("Empty subset A parsed. Provide --subset-a like 'a,b,c'.")
 
-    df = pd.read_csv(args.results_csv)
+    df = load_results(args.results_csv)
     feat_map, feat_names = load_uc_features(args.uc_features_npz)
 
     if args.lp_features_npz:
@@ -32,6 +32,8 @@ from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 from pyscipopt import Model, Branchrule, SCIP_RESULT
 
+from instance_cache import load_model
+
 
 class UCBranchrule(Branchrule):
     """
@@ -56,9 +58,11 @@ class UCBranchrule(Branchrule):
         self._n_uc_branches = 0
 
         try:
-            for var in model.getVars():
-                if var.vtype() == "BINARY" and abs(var.getObj()) < 1e-9:
-                    self._u_var_names.add(var.name)
+            # SCIP_VARTYPE 0 == binary
+            attrs = model.getVarAttrsArray(("obj", "vtype"))
+            u_idx = np.flatnonzero((attrs["vtype"] == 0) & (np.abs(attrs["obj"]) < 1e-9))
+            all_vars = model.getVars()
+            self._u_var_names = {all_vars[i].name for i in u_idx.tolist()}
             if self.log:
                 print(f"[UCBranch] identified {len(self._u_var_names)} commitment (u) vars")
         except Exception as e:
@@ -134,9 +138,7 @@ def make_model_with_uc_branch(
 
     Returns (model, branch_rule).
     """
-    m = Model()
-    if hide_output:
-        m.hideOutput(True)
+    m = load_model(lp_path, hide_output=hide_output)
     m.setRealParam("limits/time", float(time_limit))
 
     branch_rule = UCBranchrule(log=log)
@@ -149,5 +151,4 @@ def make_model_with_uc_branch(
         maxbounddist=1.0,
     )
 
-    m.readProblem(lp_path)
     return m, branch_rule
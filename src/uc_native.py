@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+uc_native.py
+
+Build the stochastic copper-plate UC model of
+generate_uc_instances.build_uc_model straight into a pyscipopt.Model,
+without Pyomo's create_instance and without writing/reading a text .lp.
+
+Same formulation, constraint by constraint: generation bounds, reserve
+coupling, system reserve, copper-plate balance, ramping (t=1 via p0),
+commitment transitions (t=1 via u0), v/w tightening, min up/down windows,
+and the penalized slacks. Each constraint family is laid out as index/coef
+arrays over the flat variable list and added with one Model.addMatrixCons
+call.
+
+Variable and constraint names follow Pyomo's symbolic LP labels
+("u(3_7)", "p(3_7_2)", "load_shed(2_7)"), so files written from here read
+like the Pyomo ones and slack variables can be found by name prefix.
+
+Usage:
+  from uc_native import build_uc_scip_model
+  m, idx = build_uc_scip_model(pyomo_data[None], n_gen, n_buses, T, S)
+  m.writeProblem("inst.lp")        # only if a file is wanted
+  m.optimize()
+
+Screening with early exit (SlackScreenEventhdlr) stops the solve at the
+first incumbent without load shed / reserve shortfall, or as soon as the
+dual bound exceeds zero_slack_cost_bound(p), i.e. no slack-free solution
+can exist.
+
+Equivalence check against the Pyomo path (small case, needs pyomo + pandapower):
+  python uc_native.py --case case5 --scenarios 2 --time-periods 6 --seed 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from pyscipopt import Model, Eventhdlr, SCIP_EVENTTYPE
+
+# objective penalties, as in generate_uc_instances.build_uc_model
+VOLL = 1e6
+SPILL_PEN = 1e3
+RES_SHORT = 1e5
+
+SLACK_PREFIXES = ("load_shed", "spill", "res_short")
+
+
+def _param_array(values: Dict[Any, float], shape: Tuple[int, ...], default: float = 0.0) -> np.ndarray:
+    """1-based Pyomo param dict -> dense array of the given shape."""
+    arr = np.full(shape, default, dtype=float)
+    for key, v in values.items():
+        key = key if isinstance(key, tuple) else (key,)
+        arr[tuple(k - 1 for k in key)] = v
+    return arr
+
+
+def _label(name: str, key: Tuple[int, ...]) -> str:
+    return f"{name}({'_'.join(str(k) for k in key)})"
+
+
+class _Builder:
+    """Flat variable list plus helpers to add constraint families from arrays."""
+
+    def __init__(self, model: Model):
+        self.model = model
+        self.vars: List[Any] = []
+        self.n_conss = 0
+
+    def add_vars(self, name: str, shape: Tuple[int, ...], vtype: str, obj: np.ndarray) -> np.ndarray:
+        """Add one variable per index (1-based in the name); returns their positions in self.vars."""
+        start = len(self.vars)
+        obj = np.broadcast_to(obj, shape)
+        lb, ub = (0.0, 1.0) if vtype == "B" else (0.0, None)
+        labels = [_label(name, tuple(k + 1 for k in key)) for key in itertools.product(*(range(k) for k in shape))]
+        self.vars.extend(self.model.addVars(shape, name=labels, vtype=vtype, lb=lb, ub=ub, obj=obj).reshape(-1))
+        return np.arange(start, len(self.vars)).reshape(shape)
+
+    def add_rows(
+        self,
+        name: str,
+        cols: List[np.ndarray],
+        coefs: List[Any],
+        lhs: Optional[Any] = None,
+        rhs: Optional[Any] = None,
+        mask: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Add the constraint family lhs <= sum_k coefs[k] * vars[cols[k]] <= rhs.
+
+        cols/coefs are lists of arrays broadcast to one common index shape, one
+        entry per term; terms with a zero coefficient are left out, so rows
+        with fewer terms (e.g. t=1) are padded with col 0 / coef 0. mask
+        selects which rows exist; row names carry the 1-based index.
+        """
+        shape = np.broadcast_shapes(*(np.shape(c) for c in cols + coefs))
+        cols = np.stack([np.broadcast_to(c, shape) for c in cols], axis=-1).reshape(-1, len(cols))
+        coefs = np.stack([np.broadcast_to(np.asarray(a, dtype=float), shape) for a in coefs],
+                         axis=-1).reshape(-1, cols.shape[1])
+        nrows = cols.shape[0]
+        lhs = None if lhs is None else np.broadcast_to(np.asarray(lhs, dtype=float), shape).reshape(-1)
+        rhs = None if rhs is None else np.broadcast_to(np.asarray(rhs, dtype=float), shape).reshape(-1)
+        keep = np.ones(nrows, dtype=bool) if mask is None else np.broadcast_to(mask, shape).reshape(-1)
+
+        labels = [_label(name, tuple(k + 1 for k in key))
+                  for key, kept in zip(itertools.product(*(range(k) for k in shape)), keep) if kept]
+        cols, coefs = cols[keep], coefs[keep]
+        nz = coefs != 0.0
+        indptr = np.zeros(cols.shape[0] + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(nz.sum(axis=1))
+        self.model.addMatrixCons((indptr, cols[nz], coefs[nz]), self.vars,
+                                 lhs=None if lhs is None else lhs[keep],
+                                 rhs=None if rhs is None else rhs[keep],
+                                 names=labels)
+        self.n_conss += len(labels)
+
+
+def build_uc_scip_model(
+    p: Dict[str, Any],
+    n_gen: int,
+    n_buses: int,
+    time_periods: int,
+    n_scenarios: int,
+    name: str = "Stochastic_CopperPlate_UC",
+    model: Optional[Model] = None,
+) -> Tuple[Model, Dict[str, np.ndarray]]:
+    """
+    Build the UC model from the param dict of generate_uc_data (pyomo_data[None]).
+
+    Returns (model, index) where index maps each variable family to the array
+    of positions in model.getVars() order (u/v/w: (G, T); p/r: (G, T, S);
+    load_shed/spill/res_short: (S, T)).
+    """
+    G, T, N, S = n_gen, time_periods, n_buses, n_scenarios
+
+    OpEx = _param_array(p["OpEx"], (G,))
+    Csu = _param_array(p["Csu"], (G,))
+    Csd = _param_array(p["Csd"], (G,))
+    Pmin = _param_array(p["Pmin"], (G,))
+    Pmax = _param_array(p["Pmax"], (G,))
+    Pramp = _param_array(p["Pramp"], (G,))
+    Rmax = _param_array(p["Rmax"], (G,))
+    Ton = _param_array(p["Ton"], (G,)).astype(int)
+    Toff = _param_array(p["Toff"], (G,)).astype(int)
+    u0 = _param_array(p.get("u0", {}), (G,))
+    p0 = _param_array(p.get("p0", {}), (G,))
+    D = _param_array(p["D"], (S, T, N))
+    Prob = _param_array(p["Prob"], (S,))
+    Pre = _param_array(p.get("Pre", {}), (S, T))
+
+    if model is None:
+        model = Model(name)
+    b = _Builder(model)
+
+    # ---- variables (objective coefficients set directly) ----
+    u = b.add_vars("u", (G, T), "B", 0.0)
+    v = b.add_vars("v", (G, T), "B", Csu[:, None])
+    w = b.add_vars("w", (G, T), "B", Csd[:, None])
+    pv = b.add_vars("p", (G, T, S), "C", OpEx[:, None, None] * Prob[None, None, :])
+    r = b.add_vars("r", (G, T, S), "C", 0.0)
+    shed = b.add_vars("load_shed", (S, T), "C", (Prob * VOLL)[:, None])
+    spill = b.add_vars("spill", (S, T), "C", (Prob * SPILL_PEN)[:, None])
+    short = b.add_vars("res_short", (S, T), "C", (Prob * RES_SHORT)[:, None])
+
+    uGTS = u[:, :, None]
+    PminGTS, PmaxGTS, RmaxGTS = Pmin[:, None, None], Pmax[:, None, None], Rmax[:, None, None]
+
+    # (1) generation bounds
+    b.add_rows("gen_min", [uGTS, pv], [PminGTS, -1.0], rhs=0.0)
+    b.add_rows("gen_max", [pv, uGTS], [1.0, -PmaxGTS], rhs=0.0)
+
+    # (2) reserve from headroom
+    b.add_rows("gen_reserve_joint", [pv, r, uGTS], [1.0, 1.0, -PmaxGTS], rhs=0.0)
+    b.add_rows("unit_reserve_cap", [r, uGTS], [1.0, -RmaxGTS], rhs=0.0)
+
+    # system reserve / power balance: sums over g, indexed (s, t)
+    r_st = r.transpose(2, 1, 0)      # (S, T, G)
+    p_st = pv.transpose(2, 1, 0)
+    b.add_rows("system_reserve",
+               [r_st[:, :, g] for g in range(G)] + [short],
+               [1.0] * G + [1.0],
+               lhs=Pre)
+    # (3) copper-plate balance; Pyomo sums D over buses in order
+    demand = np.zeros((S, T))
+    for n in range(N):
+        demand = demand + D[:, :, n]
+    b.add_rows("power_balance",
+               [p_st[:, :, g] for g in range(G)] + [shed, spill],
+               [1.0] * G + [1.0, -1.0],
+               lhs=demand, rhs=demand)
+
+    # (4) ramping, t=1 against p0
+    first = np.zeros((1, T, 1), dtype=bool)
+    first[0, 0, 0] = True
+    p_prev = np.concatenate([pv[:, :1, :], pv[:, :-1, :]], axis=1)   # col is ignored at t=1 (coef 0)
+    prev_coef = np.where(first, 0.0, 1.0)
+    ramp_up_rhs = np.where(first, Pramp[:, None, None] + p0[:, None, None], Pramp[:, None, None])
+    ramp_dn_rhs = np.where(first, Pramp[:, None, None] - p0[:, None, None], Pramp[:, None, None])
+    b.add_rows("ramp_up", [pv, p_prev], [1.0, -prev_coef], rhs=ramp_up_rhs)
+    b.add_rows("ramp_down", [p_prev, pv], [prev_coef, -1.0], rhs=ramp_dn_rhs)
+
+    # (5) transitions, t=1 against u0
+    first_gt = first[:, :, 0]
+    u_prev = np.concatenate([u[:, :1], u[:, :-1]], axis=1)
+    uprev_coef = np.where(first_gt, 0.0, 1.0)
+    u0_first = np.where(first_gt, u0[:, None], 0.0)
+    b.add_rows("commit_transition", [u, u_prev, v, w], [1.0, -uprev_coef, -1.0, 1.0],
+               lhs=u0_first, rhs=u0_first)
+
+    # (6) tightening for v, w
+    b.add_rows("startup_upper1", [v, u], [1.0, -1.0], rhs=0.0)
+    b.add_rows("startup_upper2", [v, u_prev], [1.0, uprev_coef], rhs=np.where(first_gt, 1.0 - u0[:, None], 1.0))
+    b.add_rows("shutdown_upper1", [w, u_prev], [1.0, -uprev_coef], rhs=u0_first)
+    b.add_rows("shutdown_upper2", [w, u], [1.0, 1.0], rhs=1.0)
+
+    # (7) min up/down windows [t, min(T, t+L-1)]; skipped where L <= 1
+    tt = np.arange(T)
+    for fam, L, bin_var, sign in (("min_up", Ton, v, 1.0), ("min_down", Toff, w, -1.0)):
+        Lmax = max(int(L.max()), 1)
+        t_last = np.minimum(T - 1, tt[None, :] + L[:, None] - 1)          # (G, T)
+        window = (t_last - tt[None, :] + 1).astype(float)
+        cols, coefs = [], []
+        for k in range(Lmax):
+            tau = tt + k
+            inside = (tau[None, :] <= t_last)
+            cols.append(u[:, np.minimum(tau, T - 1)])
+            coefs.append(np.where(inside, sign, 0.0))
+        cols.append(bin_var)
+        coefs.append(-window)
+        # min_down: sum (1 - u) >= window * w  <=>  -sum u - window * w >= -window
+        lhs = np.zeros((G, T)) if sign > 0 else -window
+        b.add_rows(fam, cols, coefs, lhs=lhs, mask=(L > 1)[:, None] & np.ones((1, T), dtype=bool))
+
+    index = {"u": u, "v": v, "w": w, "p": pv, "r": r,
+             "load_shed": shed, "spill": spill, "res_short": short}
+    return model, index
+
+
+# slack family -> key in the screening slack_summary
+SLACK_KEYS = {"load_shed": "load_shed", "spill": "spill", "res_short": "reserve_short"}
+
+
+def slack_vars(model: Model, index: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, List[Any]]:
+    """
+    Slack variables per family, looked up once before solving: through the
+    builder's index if given, else by name prefix (needs symbolic names, e.g.
+    an .lp written by Pyomo with symbolic_solver_labels=True).
+    """
+    scip_vars = model.getVars()
+    if index is not None:
+        return {fam: [scip_vars[i] for i in index[fam].ravel().tolist()] for fam in SLACK_PREFIXES}
+    return {fam: [scip_vars[i] for i in model.getVarIndicesByPrefix(fam).tolist()] for fam in SLACK_PREFIXES}
+
+
+def slack_totals(model: Model, svars: Dict[str, List[Any]], sol=None) -> Dict[str, float]:
+    """Total load shed / spill / reserve shortfall in `sol` (default: best solution)."""
+    if sol is None:
+        sol = model.getBestSol()
+    return {SLACK_KEYS[fam]: float(model.getSolValsArray(sol, vars=vs).sum()) for fam, vs in svars.items()}
+
+
+def slack_summary(model: Model, index: Dict[str, np.ndarray]) -> Dict[str, float]:
+    """Total load shed / spill / reserve shortfall in the best solution, via the variable index."""
+    return slack_totals(model, slack_vars(model, index))
+
+
+def zero_slack_cost_bound(p: Dict[str, Any], eps: float = 1e-6) -> float:
+    """
+    Upper bound on the objective of any solution with load shed and reserve
+    shortfall <= eps: full-capacity dispatch cost, a start-up and shut-down
+    of every unit in every period, and the largest possible spill.
+    A dual bound above this proves that slack is forced.
+    """
+    G = len(p["Pmax"])
+    S = len(p["Prob"])
+    T = len(p["Pre"]) // S
+    N = len(p["D"]) // (S * T)
+    Pmax = _param_array(p["Pmax"], (G,))
+    Prob = _param_array(p["Prob"], (S,))
+    D = _param_array(p["D"], (S, T, N))
+
+    dispatch = float(Prob.sum() * T * np.dot(_param_array(p["OpEx"], (G,)), Pmax))
+    commit = float(T * (_param_array(p["Csu"], (G,)).sum() + _param_array(p["Csd"], (G,)).sum()))
+    spill = float(SPILL_PEN * np.dot(Prob, np.maximum(Pmax.sum() - D.sum(axis=2), 0.0).sum(axis=1)))
+    return dispatch + commit + spill + eps * (VOLL + RES_SHORT)
+
+
+class SlackScreenEventhdlr(Eventhdlr):
+    """
+    Interrupts a screening solve once its outcome is known:
+      verdict "clean"        - an incumbent with load shed and reserve shortfall <= eps
+      verdict "slack_forced" - the dual bound exceeds cost_bound, so every solution sheds
+    verdict stays None when the solve ends on its own.
+    """
+
+    def __init__(self, svars: Dict[str, List[Any]], eps: float = 1e-6, cost_bound: Optional[float] = None):
+        self.svars = {fam: svars[fam] for fam in ("load_shed", "res_short")}
+        self.eps = eps
+        self.cost_bound = cost_bound
+        self.verdict = None
+
+    def eventinit(self):
+        self.model.catchEvent(SCIP_EVENTTYPE.BESTSOLFOUND, self)
+        if self.cost_bound is not None:
+            self.model.catchEvent(SCIP_EVENTTYPE.LPSOLVED, self)
+            self.model.catchEvent(SCIP_EVENTTYPE.NODESOLVED, self)
+
+    def eventexit(self):
+        self.model.dropEvent(SCIP_EVENTTYPE.BESTSOLFOUND, self)
+        if self.cost_bound is not None:
+            self.model.dropEvent(SCIP_EVENTTYPE.LPSOLVED, self)
+            self.model.dropEvent(SCIP_EVENTTYPE.NODESOLVED, self)
+
+    def eventexec(self, event):
+        if self.verdict is not None:
+            return
+        if event.getType() == SCIP_EVENTTYPE.BESTSOLFOUND:
+            totals = slack_totals(self.model, self.svars)
+            if totals["load_shed"] <= self.eps and totals["reserve_short"] <= self.eps:
+                self.verdict = "clean"
+        elif self.model.getDualbound() > self.cost_bound * (1.0 + 1e-6) + 1e-6:
+            self.verdict = "slack_forced"
+
+        if self.verdict is not None:
+            self.model.interruptSolve()
+
+
+# -----------------------------------------------------------------------------
+# Equivalence check against the Pyomo path
+# -----------------------------------------------------------------------------
+
+def check_equivalence(
+    case_name: str = "case5",
+    n_scenarios: int = 2,
+    time_periods: int = 6,
+    seed: int = 1,
+    time_limit_s: float = 120.0,
+    rel_tol: float = 1e-6,
+) -> Dict[str, Any]:
+    """
+    Build one instance both ways and compare: variable names, types, bounds
+    and objective coefficients, constraint count, and the optimal objective.
+    Raises AssertionError on a mismatch.
+    """
+    import os
+    import tempfile
+
+    import generate_uc_instances as gen
+
+    net = gen.load_network(case_name)
+    n_gen = len(net.gen) if hasattr(net, "gen") and len(net.gen) > 0 else len(net.ext_grid)
+    n_buses = len(net.bus)
+    pyomo_data, _ = gen.generate_uc_data(net, n_scenarios=n_scenarios, time_periods=time_periods, seed=seed)
+
+    instance = gen.build_uc_model(n_gen, n_buses, time_periods, n_scenarios).create_instance(pyomo_data)
+    fd, tmp_lp = tempfile.mkstemp(suffix=".lp")
+    os.close(fd)
+    try:
+        instance.write(tmp_lp, io_options={"symbolic_solver_labels": True})
+        ref = Model()
+        ref.hideOutput(True)
+        ref.readProblem(tmp_lp)
+    finally:
+        os.remove(tmp_lp)
+
+    nat, _ = build_uc_scip_model(pyomo_data[None], n_gen, n_buses, time_periods, n_scenarios)
+    nat.hideOutput(True)
+
+    def var_table(m):
+        out = {}
+        for var in m.getVars():
+            ub = var.getUbOriginal()
+            out[var.name] = (var.vtype(), var.getLbOriginal(), None if m.isInfinity(ub) else ub, var.getObj())
+        return out
+
+    ref_vars, nat_vars = var_table(ref), var_table(nat)
+    assert set(ref_vars) == set(nat_vars), \
+        f"variable names differ: {sorted(set(ref_vars) ^ set(nat_vars))[:10]}"
+    for vname, (vt, lb, ub, obj) in ref_vars.items():
+        vt2, lb2, ub2, obj2 = nat_vars[vname]
+        assert vt == vt2, (vname, vt, vt2)
+        assert math.isclose(lb, lb2, abs_tol=1e-9), (vname, lb, lb2)
+        assert (ub is None) == (ub2 is None) and (ub is None or math.isclose(ub, ub2, abs_tol=1e-9)), (vname, ub, ub2)
+        assert math.isclose(obj, obj2, rel_tol=rel_tol, abs_tol=1e-9), (vname, obj, obj2)
+    assert ref.getNConss() == nat.getNConss(), (ref.getNConss(), nat.getNConss())
+
+    objs = []
+    for m in (ref, nat):
+        m.setRealParam("limits/time", float(time_limit_s))
+        m.optimize()
+        objs.append((m.getStatus(), m.getObjVal() if m.getNSols() > 0 else None))
+    (st_ref, obj_ref), (st_nat, obj_nat) = objs
+    assert st_ref == st_nat, (st_ref, st_nat)
+    if st_ref == "optimal":
+        assert math.isclose(obj_ref, obj_nat, rel_tol=rel_tol, abs_tol=1e-6), (obj_ref, obj_nat)
+
+    return {
+        "n_vars": len(nat_vars),
+        "n_conss": nat.getNConss(),
+        "status": st_nat,
+        "obj_pyomo": obj_ref,
+        "obj_native": obj_nat,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Check the native SCIP UC builder against the Pyomo formulation")
+    ap.add_argument("--case", default="case5")
+    ap.add_argument("--scenarios", type=int, default=2)
+    ap.add_argument("--time-periods", type=int, default=6)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--time-limit", type=float, default=120.0)
+    args = ap.parse_args()
+
+    res = check_equivalence(args.case, args.scenarios, args.time_periods, args.seed, args.time_limit)
+    print("equivalent:", res)
+
+
+if __name__ == "__main__":
+    main()
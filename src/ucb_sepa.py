@@ -31,6 +31,9 @@ import numpy as np
 
 from pyscipopt import Model, Sepa, SCIP_RESULT
 
+from instance_cache import load_model
+from mlp_runtime import load_mlp, softmax
+
 # -----------------------------------------------------------------------
 # Constants
 # -----------------------------------------------------------------------
@@ -66,38 +69,64 @@ class LinUCB:
 
     UCB score for arm a given context x:
         score_a = theta_a @ x + alpha * sqrt(x @ A_a^{-1} @ x)
+
+    All arms are stored stacked: A, A_inv (n_arms, d, d) and b, theta
+    (n_arms, d). A_inv is kept current with Sherman-Morrison rank-one
+    updates, so an update is O(d^2) and scoring all arms is one einsum.
     """
 
     def __init__(self, n_arms: int, d: int, alpha: float = 1.0):
         self.n_arms = n_arms
         self.d = d
         self.alpha = alpha
-        self.A = [np.eye(d, dtype=np.float64) for _ in range(n_arms)]
-        self.b = [np.zeros(d, dtype=np.float64) for _ in range(n_arms)]
+        self.A = np.tile(np.eye(d, dtype=np.float64), (n_arms, 1, 1))
+        self.b = np.zeros((n_arms, d), dtype=np.float64)
+        self.A_inv = self.A.copy()
+        self.theta = np.zeros((n_arms, d), dtype=np.float64)
 
     def score(self, arm: int, x: np.ndarray) -> float:
-        A_inv = np.linalg.inv(self.A[arm])
-        theta = A_inv @ self.b[arm]
-        return float(theta @ x + self.alpha * np.sqrt(x @ A_inv @ x))
+        x = np.asarray(x, dtype=np.float64)
+        var = x @ self.A_inv[arm] @ x
+        return float(self.theta[arm] @ x + self.alpha * np.sqrt(max(var, 0.0)))
 
     def scores(self, x: np.ndarray) -> np.ndarray:
-        return np.array([self.score(a, x) for a in range(self.n_arms)])
+        x = np.asarray(x, dtype=np.float64)
+        var = np.einsum("i,aij,j->a", x, self.A_inv, x)
+        return self.theta @ x + self.alpha * np.sqrt(np.maximum(var, 0.0))
+
+    def _rank_one_update(self, arm: int, u: np.ndarray) -> None:
+        """A_a += u u^T, with A_a^{-1} updated by Sherman-Morrison."""
+        self.A[arm] += np.outer(u, u)
+        Au = self.A_inv[arm] @ u
+        self.A_inv[arm] -= np.outer(Au, Au) / (1.0 + u @ Au)
 
     def update(self, arm: int, x: np.ndarray, reward: float) -> None:
-        self.A[arm] += np.outer(x, x)
+        x = np.asarray(x, dtype=np.float64)
+        self._rank_one_update(arm, x)
         self.b[arm] += reward * x
+        self.theta[arm] = self.A_inv[arm] @ self.b[arm]
 
     def warm_start_arm(self, arm: int, x: np.ndarray, reward: float, n_pseudo: int = 10) -> None:
         """Add n_pseudo synthetic observations for arm with given reward."""
-        for _ in range(n_pseudo):
-            self.update(arm, x, reward)
+        if n_pseudo <= 0:
+            return
+        x = np.asarray(x, dtype=np.float64)
+        # n identical observations == one rank-one update with sqrt(n) * x
+        self._rank_one_update(arm, np.sqrt(n_pseudo) * x)
+        self.b[arm] += n_pseudo * reward * x
+        self.theta[arm] = self.A_inv[arm] @ self.b[arm]
+
+    def refresh(self) -> None:
+        """Recompute A_inv and theta exactly from A and b."""
+        self.A_inv = np.linalg.inv(self.A)
+        self.theta = np.einsum("aij,aj->ai", self.A_inv, self.b)
 
     def save(self, path: str) -> None:
         """Save A and b matrices to .npz for cross-instance persistence."""
         np.savez(
             path,
-            A=np.stack(self.A, axis=0),
-            b=np.stack(self.b, axis=0),
+            A=self.A,
+            b=self.b,
             n_arms=np.array(self.n_arms),
             d=np.array(self.d),
             alpha=np.array(self.alpha),
@@ -112,8 +141,9 @@ class LinUCB:
             d=int(data["d"]),
             alpha=float(data["alpha"]),
         )
-        obj.A = [data["A"][i] for i in range(obj.n_arms)]
-        obj.b = [data["b"][i] for i in range(obj.n_arms)]
+        obj.A = np.array(data["A"], dtype=np.float64).reshape(obj.n_arms, obj.d, obj.d)
+        obj.b = np.array(data["b"], dtype=np.float64).reshape(obj.n_arms, obj.d)
+        obj.refresh()
         return obj
 
 
@@ -393,9 +423,7 @@ def make_model_with_ucb(
     time_limit_multiplier: UCB solve is capped at time_limit * multiplier to
         prevent runaway solves from bad arm choices.
     """
-    m = Model()
-    if hide_output:
-        m.hideOutput(True)
+    m = load_model(lp_path, hide_output=hide_output)
 
     # Cap UCB solve time to avoid catastrophic blowups from bad arm choices
     ucb_time_limit = float(time_limit) * time_limit_multiplier
@@ -428,7 +456,6 @@ def make_model_with_ucb(
         freq=1,
     )
 
-    m.readProblem(lp_path)
     return m, sepa_plugin
 
 
@@ -452,34 +479,10 @@ def warm_start_from_offline_model(
 
     Returns dict {sepa_name: reward_float}.
     """
-    import torch
-
-    # Inline MLP definition (must match train_uc_k1_offline.py)
-    import torch.nn as nn
-
-    class MLP(nn.Module):
-        def __init__(self, d_in, n_classes, hidden=128, depth=2, dropout=0.1):
-            super().__init__()
-            layers = []
-            d = d_in
-            for _ in range(depth):
-                layers += [nn.Linear(d, hidden), nn.ReLU(), nn.Dropout(dropout)]
-                d = hidden
-            layers.append(nn.Linear(d, n_classes))
-            self.net = nn.Sequential(*layers)
-
-        def forward(self, x):
-            return self.net(x)
-
-    ckpt = torch.load(model_pt_path, map_location="cpu")
-    classes = ckpt["classes"]
-    model = MLP(ckpt["d_in"], len(classes), ckpt["hidden"], ckpt["depth"], ckpt["dropout"])
-    model.load_state_dict(ckpt["state_dict"])
-    model.eval()
-
-    x = torch.tensor(instance_feats, dtype=torch.float32).unsqueeze(0)
-    with torch.no_grad():
-        probs = torch.softmax(model(x), dim=1).squeeze().numpy()
+    # NumPy forward pass; uses the exported .npz next to the .pt when present
+    net = load_mlp(model_pt_path)
+    classes = net.classes
+    probs = softmax(net(np.asarray(instance_feats, dtype=np.float32)))
 
     # Map config probabilities to per-separator reward boosts
     rewards: Dict[str, float] = {s: 0.0 for s in SEPAS}
@@ -4,9 +4,9 @@ import os
 import pickle
 import joblib
 import platform
-import torch
 
-import tqdm
+from tqdm import tqdm
+from state_store import StateStore, is_store, split_ref, ROUND_SEP
 from multiprocessing import Pool
 from multiprocessing.dummy import Pool as ThreadPool
 
@@ -16,6 +16,20 @@ def multiprocess(func, tasks, cpus=None):
     with Pool(cpus or os.cpu_count()) as pool:
         return list(pool.imap(func, tasks))
 
+def multiprocess_unordered(func, tasks, cpus=None, threads=False):
+    """
+    Like multiprocess, but yields results as soon as each task finishes.
+    threads=True uses a thread pool instead, which only pays off when func
+    releases the GIL (e.g. SCIP solves via model.optimize(release_gil=True)).
+    """
+    if cpus == 1 or len(tasks) <= 1:
+        for t in tasks:
+            yield func(t)
+        return
+    pool_cls = ThreadPool if threads else Pool
+    with pool_cls(cpus or os.cpu_count()) as pool:
+        yield from pool.imap_unordered(func, tasks)
+
 def multithread(func, tasks, cpus=None, show_bar=True):
     bar = lambda x: tqdm(x, total=len(tasks)) if show_bar else x
     if cpus == 1 or len(tasks) == 1:
@@ -69,6 +83,31 @@ def save_state(path, state):
 
         save_func(obj_path, obj)
 
+def append_state(path, state, round_num=None, **store_kwargs):
+    """Append one round to the StateStore at path; returns its reference for load_state."""
+    r = StateStore(path, **store_kwargs).append(state, round_num=round_num)
+    return f'{path}{ROUND_SEP}{r}'
+
+def load_state(path, keys=None, mmap=True):
+    """
+    Load a state written by save_state (a directory of .npy/.pkl files) or one
+    round of a StateStore ('<store>::<round>', as returned by find_all_paths).
+    """
+    store_path, round_num = split_ref(path)
+    if round_num is not None:
+        return StateStore(store_path).load(round_num, keys=keys, mmap=mmap)
+
+    state = {}
+    for fname in os.listdir(path):
+        k, ext = os.path.splitext(fname)
+        if keys is not None and k not in keys:
+            continue
+        if ext == '.npy':
+            state[k] = np.load(os.path.join(path, fname), mmap_mode='r' if mmap else None)
+        elif ext == '.pkl':
+            state[k] = load_pickle(os.path.join(path, fname))
+    return state
+
 
 def save_json(path, d):
     with open(path, 'w') as file:
@@ -157,6 +196,18 @@ def save_joblib(path, obj):
 def load_joblib(path):
     return joblib.load(path)
 
+def _state_paths(model_path):
+    # legacy per-round directories, plus one '<store>::<round>' ref per stored round
+    paths = []
+    for root, dirs, _ in os.walk(model_path):
+        for d in dirs:
+            path = f'{root}/{d}'
+            if d.startswith('nsepacut'):
+                paths.append(path)
+            elif is_store(path):
+                paths.extend(f'{path}{ROUND_SEP}{r}' for r in StateStore(path).rounds())
+    return paths
+
 def find_all_paths_sepa(
         split,
         instances,
@@ -176,11 +227,7 @@ def find_all_paths_sepa(
 
     for model in models:
         model_path = f'{basepath}/{model}/{state}/'
-        for root, dirs, _ in os.walk(model_path):
-            for d in dirs:
-                if d.startswith('nsepacut'):
-                    path = f'{root}/{d}'
-                    paths.append(path)
+        paths.extend(_state_paths(model_path))
 
     return paths
 
@@ -207,11 +254,7 @@ def find_all_paths(
 
     for model in models:
         model_path = f'{basepath}/{model}/{state}/{samplingstrategy}'
-        for root, dirs, _ in os.walk(model_path):
-            for d in dirs:
-                if d.startswith('nsepacut'):
-                    path = f'{root}/{d}'
-                    paths.append(path)
+        paths.extend(_state_paths(model_path))
 
     return paths
 
@@ -239,6 +282,7 @@ def is_local():
 Utility functions to load and save torch model checkpoints 
 """
 def load_checkpoint(net, optimizer=None, step='max', save_dir='checkpoints'):
+    import torch
     os.makedirs(save_dir, exist_ok=True)
 
     checkpoints = [x for x in os.listdir(save_dir) if not x.startswith('events')]
@@ -258,6 +302,7 @@ def load_checkpoint(net, optimizer=None, step='max', save_dir='checkpoints'):
     return step
 
 def save_checkpoint(net, optimizer, step, save_dir='checkpoints'):
+    import torch
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
     save_path = os.path.join(save_dir, str(step) + '.pth')